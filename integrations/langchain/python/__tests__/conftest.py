@@ -0,0 +1,89 @@
+"""Shared fixtures for the SEC EDGAR LangChain toolkit tests."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class FakeEdgarHandler(BaseHTTPRequestHandler):
+    """Serves canned responses registered on the server's ``routes``."""
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        failures = self.server.failures.get(self.path)
+        if failures:
+            status, headers = failures.pop(0)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        route = self.server.routes.get(self.path)
+        if route is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body, headers = route
+        if headers.get("delay"):
+            time.sleep(headers["delay"])
+        etag = headers.get("ETag")
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(headers.get("status", 200))
+        for name, value in headers.items():
+            if name not in ("status", "delay", "unsized"):
+                self.send_header(name, value)
+        if headers.get("unsized"):
+            # No Content-Length: the body runs until the connection closes
+            self.close_connection = True
+        else:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeEdgarServer(ThreadingHTTPServer):
+    """Local stand-in for data.sec.gov / www.sec.gov."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeEdgarHandler)
+        self.routes = {}
+        self.failures = {}
+        self.requests = []
+
+    def url(self, path: str) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def add(self, path: str, body: bytes, **headers) -> str:
+        self.routes[path] = (body, headers)
+        return self.url(path)
+
+    def fail(self, path: str, *statuses: int, **headers) -> None:
+        """Answer the next requests for ``path`` with these error statuses first."""
+        self.failures.setdefault(path, []).extend((status, headers) for status in statuses)
+
+
+@pytest.fixture
+def edgar_server():
+    """Run a fake EDGAR server on a random local port."""
+    server = FakeEdgarServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,96 @@
+"""Tests for the async tool path."""
+
+import json
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+
+SUBMISSIONS = {
+    "cik": "320193",
+    "name": "Apple Inc.",
+    "tickers": ["AAPL"],
+    "filings": {
+        "recent": {
+            "form": ["8-K", "10-K"],
+            "filingDate": ["2099-01-02", "2099-01-01"],
+            "accessionNumber": ["0000320193-99-000002", "0000320193-99-000001"],
+            "primaryDocument": ["a8k.htm", "a10k.htm"],
+            "primaryDocDescription": ["8-K", "10-K"],
+        }
+    },
+}
+
+FACTS = {
+    "facts": {
+        "us-gaap": {
+            "Revenues": {"units": {"USD": [
+                {"end": "2023-09-30", "val": 383285000000, "form": "10-K"},
+            ]}},
+        }
+    }
+}
+
+
+@pytest.fixture
+def toolkit(edgar_server):
+    """Toolkit pointed at the fake EDGAR server."""
+    pytest.importorskip("httpx")
+    edgar_server.add("/submissions/CIK0000320193.json", json.dumps(SUBMISSIONS).encode())
+    edgar_server.add("/api/xbrl/companyfacts/CIK0000320193.json", json.dumps(FACTS).encode())
+    edgar_server.add("/api/xbrl/companyfacts/CIK0000789019.json", json.dumps(FACTS).encode())
+    edgar_server.add("/doc.htm", b"<html><body><p>Risk&nbsp;Factors</p></body></html>")
+
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)")
+    toolkit = SECEdgarToolkit(config)
+    toolkit.base_url = edgar_server.url("")
+    return toolkit
+
+
+def test_every_tool_has_a_coroutine(toolkit):
+    """Test all tools expose an async implementation."""
+    tools = toolkit.get_tools()
+
+    assert len(tools) == 9
+    assert all(tool.coroutine is not None for tool in tools)
+
+
+@pytest.mark.asyncio
+async def test_async_company_info(toolkit, edgar_server):
+    """Test the async tool matches the sync output."""
+    tool = next(t for t in toolkit.get_tools() if t.name == "sec_edgar_company_info")
+
+    result = await tool.ainvoke("320193")
+
+    assert json.loads(result)["Name"] == "Apple Inc."
+    assert result == toolkit._get_company_info("320193")
+    await toolkit.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_8k_events(toolkit):
+    """Test chained async tools go through the async search."""
+    result = await toolkit._aget_8k_events("320193")
+
+    assert "Total 8-K Filings (Last 90 days): 1" in result
+    await toolkit.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_filing_content(toolkit, edgar_server):
+    """Test filing documents are fetched with the async client."""
+    result = await toolkit._aget_filing_content(edgar_server.url("/doc.htm"))
+
+    assert "Risk" in result
+    await toolkit.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_compare(toolkit, edgar_server):
+    """Test comparisons fetch both companies."""
+    result = await toolkit._acompare_financials(json.dumps({"cik1": "320193", "cik2": "789019"}))
+
+    assert result.count("$383,285,000,000") == 2
+    paths = [path for path, _ in edgar_server.requests]
+    assert "/api/xbrl/companyfacts/CIK0000789019.json" in paths
+    await toolkit.aclose()
+    assert toolkit._aclient is None
@@ -0,0 +1,92 @@
+"""Tests for the pluggable data-source backends."""
+
+import json
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.backends import BackendChain, CacheBackend, FixtureBackend, HTTPBackend
+from sec_edgar_langchain.cache import CachedResponse, SQLiteResponseCache
+
+SUBMISSIONS = {"cik": "320193", "name": "Apple Inc.", "tickers": ["AAPL"]}
+TICKERS = {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}}
+DOCUMENT = "<html><body><p>Item 1A. Risk Factors</p><p>Competition is intense.</p></body></html>"
+
+
+def config(**overrides):
+    return SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", **overrides)
+
+
+def test_chain_falls_through_to_next_backend():
+    """Test each request is answered by the first backend holding the data."""
+    local = FixtureBackend(submissions={"320193": SUBMISSIONS})
+    remote = FixtureBackend(submissions={"789019": {"cik": "789019", "name": "MICROSOFT CORP"}}, tickers=TICKERS)
+    chain = BackendChain([local, remote])
+
+    assert chain.submissions("0000320193")["name"] == "Apple Inc."
+    assert chain.submissions("0000789019")["name"] == "MICROSOFT CORP"
+    assert chain.company_tickers() == TICKERS
+    assert chain.company_facts("0000320193") is None
+    assert ("submissions", "0000320193") not in remote.calls
+
+
+@pytest.mark.asyncio
+async def test_async_chain():
+    """Test the async methods route the same way."""
+    chain = BackendChain([FixtureBackend(), FixtureBackend(submissions={"1": SUBMISSIONS}, latency=0.01)])
+
+    assert (await chain.asubmissions("0000000001"))["name"] == "Apple Inc."
+    assert await chain.acompany_facts("0000000001") is None
+
+
+def test_toolkit_runs_on_fixture_backend():
+    """Test tools need no network with an in-memory backend."""
+    backend = FixtureBackend(
+        submissions={"320193": SUBMISSIONS},
+        tickers=TICKERS,
+        documents={"https://www.sec.gov/doc.htm": DOCUMENT},
+    )
+    toolkit = SECEdgarToolkit(config(), backend=backend)
+
+    assert toolkit.backend is backend
+    assert toolkit._lookup_cik("AAPL").startswith("CIK: 0000320193")
+    assert json.loads(toolkit._get_company_info("320193"))["Ticker"] == "AAPL"
+    content = toolkit._get_filing_content('{"url": "https://www.sec.gov/doc.htm", "section": "Item 1A"}')
+    assert "Competition is intense." in content
+    assert "not available" in toolkit._get_filing_content("https://www.sec.gov/other.htm")
+    assert "Submissions for CIK 0000000002 not available" in toolkit._get_company_info("2")
+
+
+@pytest.mark.asyncio
+async def test_async_filing_content_from_fixture():
+    """Test the async tool streams fixture documents too."""
+    backend = FixtureBackend(documents={"https://www.sec.gov/doc.htm": DOCUMENT})
+    toolkit = SECEdgarToolkit(config(), backend=backend)
+
+    params = '{"url": "https://www.sec.gov/doc.htm", "section": "Item 1A"}'
+    assert await toolkit._aget_filing_content(params) == toolkit._get_filing_content(params)
+
+
+def test_base_url_points_http_backend_at_stand_in(edgar_server):
+    """Test the configured base URL is used for every API request."""
+    edgar_server.add("/submissions/CIK0000320193.json", json.dumps(SUBMISSIONS).encode())
+
+    with SECEdgarToolkit(config(base_url=edgar_server.url(""))) as toolkit:
+        assert isinstance(toolkit.backend, HTTPBackend)
+        assert json.loads(toolkit._get_company_info("320193"))["Name"] == "Apple Inc."
+
+    assert [path for path, _ in edgar_server.requests] == ["/submissions/CIK0000320193.json"]
+
+
+def test_offline_serves_stale_cache_entries(tmp_path):
+    """Test offline mode answers from the cache regardless of age and never connects."""
+    cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"))
+    url = "https://data.sec.gov/submissions/CIK0000320193.json"
+    cache.put(CachedResponse(url=url, body=json.dumps(SUBMISSIONS).encode(), fetched_at=0.0))
+
+    toolkit = SECEdgarToolkit(config(offline=True), cache=cache)
+
+    assert isinstance(toolkit.backend, CacheBackend)
+    assert toolkit._client is None
+    assert json.loads(toolkit._get_company_info("320193"))["Name"] == "Apple Inc."
+    assert "not available" in toolkit._get_company_info("789019")
+    cache.close()
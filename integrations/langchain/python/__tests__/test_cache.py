@@ -0,0 +1,124 @@
+"""Tests for the persistent response cache."""
+
+import json
+import os
+
+import pytest
+from sec_edgar_langchain import SECEdgarHTTPClient
+from sec_edgar_langchain.client import AsyncSECEdgarHTTPClient
+from sec_edgar_langchain.cache import CachedResponse, SQLiteResponseCache, ttl_for
+
+
+class TestSQLiteResponseCache:
+    """Test cache storage and eviction."""
+
+    def test_round_trip(self, tmp_path):
+        """Test bodies and validators survive a reopen."""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = SQLiteResponseCache(path)
+        cache.put(CachedResponse("https://x/a", b"hello" * 100, etag='"v1"', fetched_at=10.0))
+        cache.close()
+
+        cached = SQLiteResponseCache(path).get("https://x/a")
+
+        assert cached.body == b"hello" * 100
+        assert cached.etag == '"v1"'
+        assert cached.fetched_at == 10.0
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted past the size bound."""
+        cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"), max_bytes=2500)
+        blobs = {url: os.urandom(1000) for url in ("a", "b", "c")}
+
+        cache.put(CachedResponse("a", blobs["a"]))
+        cache.put(CachedResponse("b", blobs["b"]))
+        cache.get("a")
+        cache.put(CachedResponse("c", blobs["c"]))
+
+        assert cache.get("b") is None
+        assert cache.get("a").body == blobs["a"]
+        assert cache.get("c").body == blobs["c"]
+        assert cache.size() <= 2500
+
+    def test_ttl_longest_fragment_wins(self):
+        """Test per-endpoint TTLs pick the most specific fragment."""
+        ttls = {"/api/": 1.0, "/api/xbrl/companyfacts/": 5.0}
+
+        assert ttl_for("https://data.sec.gov/api/xbrl/companyfacts/CIK1.json", ttls) == 5.0
+        assert ttl_for("https://data.sec.gov/api/other", ttls) == 1.0
+        assert ttl_for("https://data.sec.gov/submissions/CIK1.json", ttls) == 0.0
+
+
+class TestCachedFetch:
+    """Test the HTTP client's cache integration."""
+
+    def test_fresh_entry_skips_network(self, tmp_path, edgar_server):
+        """Test a fresh entry is served without a request."""
+        url = edgar_server.add("/submissions/CIK1.json", b'{"cik": "1"}')
+        cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"))
+        client = SECEdgarHTTPClient("TestApp/1.0", cache=cache, cache_ttls={"/submissions/": 60})
+
+        assert client.get_json(url) == {"cik": "1"}
+        assert client.get_json(url) == {"cik": "1"}
+        assert len(edgar_server.requests) == 1
+
+    def test_warm_restart(self, tmp_path, edgar_server):
+        """Test a new client reuses responses cached by a previous one."""
+        url = edgar_server.add("/submissions/CIK1.json", b'{"cik": "1"}')
+        path = str(tmp_path / "cache.sqlite3")
+        ttls = {"/submissions/": 60}
+
+        SECEdgarHTTPClient("TestApp/1.0", cache=SQLiteResponseCache(path), cache_ttls=ttls).fetch(url)
+        restarted = SECEdgarHTTPClient("TestApp/1.0", cache=SQLiteResponseCache(path), cache_ttls=ttls)
+
+        assert restarted.get_json(url) == {"cik": "1"}
+        assert len(edgar_server.requests) == 1
+
+    def test_stale_entry_revalidates(self, tmp_path, edgar_server):
+        """Test stale entries send validators and reuse the body on 304."""
+        body = json.dumps({"facts": {}}).encode()
+        url = edgar_server.add("/api/xbrl/companyfacts/CIK1.json", body, ETag='"abc"')
+        cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"))
+        client = SECEdgarHTTPClient("TestApp/1.0", cache=cache, cache_ttls={})
+
+        client.fetch(url)
+        before = cache.get(url).fetched_at
+        assert client.get_json(url) == {"facts": {}}
+
+        path, headers = edgar_server.requests[-1]
+        assert headers.get("If-None-Match") == '"abc"'
+        assert cache.get(url).fetched_at >= before
+
+    def test_changed_entry_is_replaced(self, tmp_path, edgar_server):
+        """Test a 200 on revalidation replaces the cached body."""
+        url = edgar_server.add("/submissions/CIK1.json", b'{"v": 1}', ETag='"1"')
+        client = SECEdgarHTTPClient(
+            "TestApp/1.0", cache=SQLiteResponseCache(str(tmp_path / "c.sqlite3")), cache_ttls={}
+        )
+        client.fetch(url)
+
+        edgar_server.add("/submissions/CIK1.json", b'{"v": 2}', ETag='"2"')
+
+        assert client.get_json(url) == {"v": 2}
+
+    def test_not_modified_without_entry_refetches(self, tmp_path, edgar_server):
+        """Test a 304 with nothing cached is fetched again instead of caching an empty body."""
+        url = edgar_server.add("/submissions/CIK1.json", b'{"v": 1}')
+        edgar_server.fail("/submissions/CIK1.json", 304)
+        cache = SQLiteResponseCache(str(tmp_path / "c.sqlite3"))
+        client = SECEdgarHTTPClient("TestApp/1.0", cache=cache)
+
+        assert client.get_json(url) == {"v": 1}
+        assert cache.get(url).body == b'{"v": 1}'
+        assert edgar_server.requests[-1][1].get("Cache-Control") == "no-cache"
+
+    @pytest.mark.asyncio
+    async def test_async_not_modified_without_entry_refetches(self, tmp_path, edgar_server):
+        """Test the async client refetches a 304 with nothing cached too."""
+        url = edgar_server.add("/submissions/CIK1.json", b'{"v": 1}')
+        edgar_server.fail("/submissions/CIK1.json", 304)
+        cache = SQLiteResponseCache(str(tmp_path / "c.sqlite3"))
+
+        async with AsyncSECEdgarHTTPClient("TestApp/1.0", cache=cache) as client:
+            assert await client.get_json(url) == {"v": 1}
+        assert cache.get(url).body == b'{"v": 1}'
@@ -0,0 +1,95 @@
+"""Tests for the in-memory company ticker index."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sec_edgar_langchain import CompanyTickerIndex, SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.backends import FixtureBackend
+
+TICKERS = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 789019, "ticker": "MSFT", "title": "MICROSOFT CORP"},
+    "2": {"cik_str": 1652044, "ticker": "GOOGL", "title": "Alphabet Inc."},
+    "3": {"cik_str": 1652044, "ticker": "GOOG", "title": "Alphabet Inc."},
+    "4": {"cik_str": 1418091, "ticker": "APLE", "title": "Apple Hospitality REIT, Inc."},
+    "5": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+}
+
+
+class TestCompanyTickerIndex:
+    """Test index lookups."""
+
+    def setup_method(self):
+        self.index = CompanyTickerIndex.from_company_tickers(TICKERS)
+
+    def test_exact_ticker(self):
+        """Test ticker lookups are exact and case-insensitive."""
+        assert self.index.lookup("msft").cik == "0000789019"
+        assert self.index.lookup("APLE").name == "Apple Hospitality REIT, Inc."
+
+    def test_cik_lookup(self):
+        """Test CIKs resolve with or without zero padding."""
+        assert self.index.by_cik("320193").ticker == "AAPL"
+        assert self.index.by_cik("0000320193").ticker == "AAPL"
+
+    def test_name_prefix_prefers_larger_company(self):
+        """Test prefix matches are ranked by position in the SEC file."""
+        matches = self.index.search("apple")
+
+        assert [m.ticker for m in matches] == ["AAPL", "APLE"]
+
+    def test_exact_name_wins(self):
+        """Test an exact normalized name beats longer prefix matches."""
+        assert self.index.lookup("apple inc").ticker == "AAPL"
+
+    def test_token_match(self):
+        """Test out-of-order words match through the token index."""
+        assert self.index.lookup("hathaway berkshire").ticker == "BRK-B"
+
+    def test_substring_fallback(self):
+        """Test mid-word queries still match."""
+        assert self.index.lookup("SOFT").ticker == "MSFT"
+
+    def test_no_match(self):
+        """Test unknown companies return nothing."""
+        assert self.index.lookup("NO SUCH COMPANY") is None
+        assert self.index.lookup("   ") is None
+
+
+def test_toolkit_loads_index_once():
+    """Test repeated lookups are served without refetching tickers."""
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)")
+    toolkit = SECEdgarToolkit(config)
+
+    with patch.object(toolkit._client, "get_json", return_value=TICKERS) as mock_get:
+        assert "0000320193" in toolkit._lookup_cik("AAPL")
+        assert "Alphabet" in toolkit._lookup_cik("alphabet")
+        assert "MSFT" in toolkit._lookup_cik("789019")
+        assert "not found" in toolkit._lookup_cik("Nonexistent Widgets")
+
+    assert mock_get.call_count == 1
+
+
+def test_toolkit_refreshes_after_ttl():
+    """Test the index is reloaded once the TTL expires."""
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", ticker_index_ttl=0)
+    toolkit = SECEdgarToolkit(config)
+
+    with patch.object(toolkit._client, "get_json", return_value=TICKERS) as mock_get:
+        toolkit._lookup_cik("AAPL")
+        toolkit._lookup_cik("AAPL")
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_lookups_load_index_once():
+    """Test coroutines arriving before the index is loaded share one load."""
+    backend = FixtureBackend(tickers=TICKERS, latency=0.05)
+    toolkit = SECEdgarToolkit(SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)"), backend=backend)
+
+    results = await asyncio.gather(*(toolkit._alookup_cik(ticker) for ticker in ("AAPL", "MSFT", "GOOG") * 3))
+
+    assert all(result.startswith("CIK: ") for result in results)
+    assert backend.calls.count(("tickers", "")) == 1
@@ -0,0 +1,64 @@
+"""Tests for the pooled SEC EDGAR HTTP client."""
+
+import pytest
+from unittest.mock import Mock, patch
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit, SECEdgarHTTPClient
+
+
+class TestSECEdgarHTTPClient:
+    """Test the pooled HTTP session layer."""
+
+    def test_session_headers(self):
+        """Test keep-alive and compression are negotiated by default."""
+        client = SECEdgarHTTPClient("TestApp/1.0 (test@example.com)")
+        headers = client.session.headers
+
+        assert headers["User-Agent"] == "TestApp/1.0 (test@example.com)"
+        assert headers["Accept-Encoding"] == "gzip, deflate"
+        assert headers["Connection"] == "keep-alive"
+
+    def test_pool_configuration(self):
+        """Test the adapter is mounted with the configured pool sizes."""
+        client = SECEdgarHTTPClient(
+            "TestApp/1.0 (test@example.com)", pool_connections=2, pool_maxsize=5
+        )
+        adapter = client.session.get_adapter("https://data.sec.gov")
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
+        assert client.session.get_adapter("https://www.sec.gov") is adapter
+
+    def test_close_is_idempotent(self):
+        """Test closing twice is safe and blocks further requests."""
+        client = SECEdgarHTTPClient("TestApp/1.0 (test@example.com)")
+        client.close()
+        client.close()
+
+        assert client.closed
+        with pytest.raises(RuntimeError):
+            client.get("https://data.sec.gov/submissions/CIK0000320193.json")
+
+
+class TestToolkitLifecycle:
+    """Test the toolkit owns and closes its HTTP client."""
+
+    def test_tools_share_one_session(self):
+        """Test every request goes through the toolkit's session."""
+        config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", rate_limit_delay=0)
+        toolkit = SECEdgarToolkit(config)
+
+        response = Mock(status_code=200, content=b'{"cik": "320193", "name": "Apple Inc."}')
+        with patch.object(toolkit._client.session, "get", return_value=response) as mock_get:
+            toolkit._get_company_info("320193")
+            toolkit._get_company_facts("320193")
+
+        assert mock_get.call_count == 2
+
+    def test_context_manager_closes_client(self):
+        """Test leaving the context closes the pooled connections."""
+        config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)")
+
+        with SECEdgarToolkit(config) as toolkit:
+            assert not toolkit._client.closed
+
+        assert toolkit._client.closed
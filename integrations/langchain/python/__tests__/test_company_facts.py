@@ -0,0 +1,164 @@
+"""Tests for the columnar companyfacts store."""
+
+import io
+import json
+import sys
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.backends import FixtureBackend
+from sec_edgar_langchain.company_facts import CompanyFacts, load_company_facts
+
+
+def report(start, end, val, fy, fp, form, filed, accn):
+    row = {"end": end, "val": val, "fy": fy, "fp": fp, "form": form, "filed": filed, "accn": accn}
+    if start:
+        row["start"] = start
+    return row
+
+
+# Each 10-K repeats the two prior years; FY2022 revenue is restated in the FY2023 10-K
+REVENUE = [
+    report("2020-10-01", "2021-09-30", 365, 2021, "FY", "10-K", "2021-10-29", "a-21"),
+    report("2020-10-01", "2021-09-30", 365, 2022, "FY", "10-K", "2022-10-28", "a-22"),
+    report("2021-10-01", "2022-09-30", 394, 2022, "FY", "10-K", "2022-10-28", "a-22"),
+    report("2021-10-01", "2022-09-30", 390, 2023, "FY", "10-K", "2023-11-03", "a-23"),
+    report("2022-10-01", "2023-09-30", 383, 2023, "FY", "10-K", "2023-11-03", "a-23"),
+    report("2023-10-01", "2023-12-30", 120, 2024, "Q1", "10-Q", "2024-02-02", "q-24"),
+    report("2023-10-01", "2024-03-30", 210, 2024, "Q2", "10-Q", "2024-05-03", "q-24b"),
+    report("2023-12-31", "2024-03-30", 90, 2024, "Q2", "10-Q", "2024-05-03", "q-24b"),
+]
+
+PAYLOAD = {
+    "cik": 320193,
+    "entityName": "Apple Inc.",
+    "facts": {
+        "dei": {"EntityCommonStockSharesOutstanding": {"label": "Shares Outstanding", "units": {"shares": [
+            {"end": "2024-04-19", "val": 15337686000, "fy": 2024, "fp": "Q2", "form": "10-Q", "filed": "2024-05-03"},
+        ]}}},
+        "us-gaap": {
+            "Revenues": {"label": "Revenues", "units": {"USD": REVENUE}},
+            "EarningsPerShareBasic": {"units": {"USD/shares": [
+                report("2022-10-01", "2023-09-30", 6.16, 2023, "FY", "10-K", "2023-11-03", "a-23"),
+            ]}},
+        },
+    },
+}
+
+
+def test_periods_are_deduplicated_and_sorted():
+    """Test one row per period, restated values win and fiscal labels are kept."""
+    series = CompanyFacts(PAYLOAD).series("Revenues")
+
+    assert series.end == ["2021-09-30", "2022-09-30", "2023-09-30", "2023-12-30", "2024-03-30", "2024-03-30"]
+    fy2022 = series.by_fiscal_period(2022, "FY")
+    assert [(fact.value, fact.accession, fact.fy) for fact in fy2022] == [(390, "a-23", 2022)]
+
+
+def test_latest_prefers_longest_period():
+    """Test the six-month span wins over the quarter ending the same day."""
+    latest = CompanyFacts(PAYLOAD).latest("us-gaap:Revenues")
+
+    assert (latest.value, latest.start, latest.fp) == (210, "2023-10-01", "Q2")
+
+
+def test_latest_prefers_most_recently_filed():
+    """Test a later filing for the same end date beats a longer period filed earlier."""
+    restated = report("2023-12-31", "2024-03-30", 95, 2024, "Q2", "8-K", "2024-06-14", "k-24")
+    payload = {"facts": {"us-gaap": {"Revenues": {"units": {"USD": REVENUE + [restated]}}}}}
+
+    latest = CompanyFacts(payload).latest("Revenues")
+
+    assert (latest.value, latest.start, latest.filed) == (95, "2023-12-31", "2024-06-14")
+
+
+def test_trailing_years_and_fiscal_periods():
+    """Test window and fiscal-period selections."""
+    series = CompanyFacts(PAYLOAD).series("Revenues")
+
+    assert [fact.end for fact in series.trailing_years(2, fp="FY")] == ["2022-09-30", "2023-09-30"]
+    assert [fact.value for fact in series.by_fiscal_period(2024, "Q2")] == [90, 210]
+    assert [fact.fp for fact in series.by_fiscal_period(2024)] == ["Q1", "Q2", "Q2"]
+    assert [fact.value for fact in series.between("2023-01-01", "2023-12-31")] == [383, 120]
+
+
+def test_any_taxonomy_is_available():
+    """Test dei concepts and unit selection."""
+    facts = CompanyFacts(PAYLOAD)
+
+    assert facts.latest("EntityCommonStockSharesOutstanding").value == 15337686000
+    assert facts.units("EarningsPerShareBasic") == ["USD/shares"]
+    assert "dei:EntityCommonStockSharesOutstanding" in facts.concepts()
+    assert facts.series("us-gaap:GrossProfit") is None
+
+
+def test_company_facts_tool():
+    """Test the default summary and concept queries through the tool."""
+    toolkit = SECEdgarToolkit(
+        SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)"),
+        backend=FixtureBackend(company_facts={"320193": PAYLOAD}),
+    )
+
+    summary = json.loads(toolkit._get_company_facts("320193"))
+    assert summary["Latest Revenue"] == {"value": "$210", "period": "2024-03-30", "form": "10-Q"}
+    assert summary["EPS (Basic)"]["value"] == "$6.16"
+
+    result = json.loads(toolkit._get_company_facts(json.dumps({
+        "cik": "320193",
+        "concepts": ["us-gaap:Revenues", "dei:EntityCommonStockSharesOutstanding", "GrossProfit"],
+        "years": 3,
+        "fiscal_period": "FY",
+    })))
+    assert [value["period"] for value in result["us-gaap:Revenues"]["values"]] == ["2023-09-30", "2022-09-30", "2021-09-30"]
+    assert result["dei:EntityCommonStockSharesOutstanding"]["unit"] == "shares"
+    assert result["GrossProfit"] == "Not reported"
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_load_company_facts_keeps_requested_concepts(monkeypatch, streaming):
+    """Test only the selected concepts are decoded, with and without ijson."""
+    if not streaming:
+        monkeypatch.setitem(sys.modules, "ijson", None)
+    body = json.dumps(PAYLOAD).encode()
+
+    data = load_company_facts(body, concepts=["Revenues", "us-gaap:GrossProfit"], taxonomies=["dei"])
+
+    assert (data["cik"], data["entityName"]) == (320193, "Apple Inc.")
+    assert data["facts"]["us-gaap"] == {"Revenues": PAYLOAD["facts"]["us-gaap"]["Revenues"]}
+    assert data["facts"]["dei"] == PAYLOAD["facts"]["dei"]
+    assert CompanyFacts(data).latest("EarningsPerShareBasic") is None
+
+
+class ForwardOnly(io.BytesIO):
+    """A stream that cannot be rewound, like an HTTP response body."""
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+
+def test_load_company_facts_reads_once():
+    """Test concepts from several taxonomies are collected in a single pass."""
+    pytest.importorskip("ijson")
+
+    data = load_company_facts(
+        ForwardOnly(json.dumps(PAYLOAD).encode()),
+        concepts=["us-gaap:Revenues", "dei:EntityCommonStockSharesOutstanding"],
+    )
+
+    assert (data["cik"], sorted(data["facts"])) == (320193, ["dei", "us-gaap"])
+    assert data["facts"]["us-gaap"] == {"Revenues": PAYLOAD["facts"]["us-gaap"]["Revenues"]}
+
+
+def test_streaming_mode_tools(edgar_server):
+    """Test the tools produce the same output when decoding incrementally."""
+    edgar_server.add("/api/xbrl/companyfacts/CIK0000320193.json", json.dumps(PAYLOAD).encode())
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)")
+    plain = SECEdgarToolkit(config, backend=FixtureBackend(company_facts={"320193": PAYLOAD}))
+    streaming = SECEdgarToolkit(config.model_copy(update={"stream_company_facts": True}))
+    streaming.base_url = edgar_server.url("")
+
+    for params in ("320193", json.dumps({"cik": "320193", "concepts": ["Revenues"], "years": 2})):
+        assert streaming._get_company_facts(params) == plain._get_company_facts(params)
+    peers = json.dumps({"ciks": ["320193"], "metrics": ["revenue", "eps", "dei:EntityCommonStockSharesOutstanding"]})
+    assert streaming._compare_financials(peers) == plain._compare_financials(peers)
+    streaming.close()
@@ -0,0 +1,102 @@
+"""Tests for peer-group financial comparison."""
+
+import json
+import time
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.backends import FixtureBackend
+from sec_edgar_langchain.results import PeerComparison
+
+
+def company_facts(name, revenue, eps):
+    return {
+        "entityName": name,
+        "facts": {
+            "us-gaap": {
+                "RevenueFromContractWithCustomerExcludingAssessedTax": {"units": {"USD": [
+                    {"end": "2022-12-31", "val": revenue - 1, "form": "10-K"},
+                    {"end": "2023-12-31", "val": revenue, "form": "10-K"},
+                ]}},
+                "EarningsPerShareBasic": {"units": {"USD/shares": [
+                    {"end": "2023-12-31", "val": eps, "form": "10-K"},
+                ]}},
+                "GrossProfit": {"units": {"USD": [
+                    {"end": "2023-12-31", "val": 42, "form": "10-K"},
+                ]}},
+            }
+        },
+    }
+
+
+FACTS = {
+    "0000000001": company_facts("Alpha Corp", 1000, 1.5),
+    "0000000002": company_facts("Beta Inc", 2000, 2.25),
+    "0000000003": company_facts("Gamma LLC", 3000, 3.0),
+}
+
+
+@pytest.fixture
+def toolkit():
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)")
+    return SECEdgarToolkit(config, backend=FixtureBackend(company_facts=FACTS, latency=0.2))
+
+
+def test_peer_table(toolkit):
+    """Test the table has one column per company and one row per metric."""
+    result = toolkit._compare_financials(json.dumps({
+        "ciks": ["1", "2", "3"],
+        "metrics": ["revenue", "eps", "us-gaap:GrossProfit", "liabilities"],
+    }))
+    lines = result.splitlines()
+
+    assert lines[1] == "| Metric | Alpha Corp (0000000001) | Beta Inc (0000000002) | Gamma LLC (0000000003) |"
+    assert lines[3] == "| revenue | $1,000 (2023-12-31) | $2,000 (2023-12-31) | $3,000 (2023-12-31) |"
+    assert lines[4] == "| eps | $1.50 (2023-12-31) | $2.25 (2023-12-31) | $3.00 (2023-12-31) |"
+    assert "| us-gaap:GrossProfit | $42 (2023-12-31)" in lines[5]
+    assert lines[6] == "| liabilities | N/A | N/A | N/A |"
+
+
+def test_peer_fetches_run_concurrently(toolkit):
+    """Test a peer group costs about one round trip of wall time."""
+    ciks = ["1", "2", "3", "1", "2", "3", "9"]
+
+    start = time.monotonic()
+    result = toolkit._compare_financials(json.dumps({"ciks": ciks}))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5
+    assert "Errors:\nCIK 0000000009: Company facts for CIK 0000000009 not available" in result
+    assert result.count("(00000000") == 3
+
+
+def test_legacy_pair_still_supported(toolkit):
+    """Test the original cik1/cik2 input keeps working."""
+    result = toolkit._compare_financials(json.dumps({"cik1": "1", "cik2": "2"}))
+
+    assert result.startswith("Financial Comparison:")
+    assert "Company 2 (CIK: 2)" in result
+
+
+def test_legacy_pair_structured_and_compact():
+    """Test cik1/cik2 honour structured and compact output like a peer group."""
+    def make(output_format):
+        config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", output_format=output_format)
+        return SECEdgarToolkit(config, backend=FixtureBackend(company_facts=FACTS))
+
+    params = json.dumps({"cik1": "1", "cik2": "2"})
+    structured = make("structured")._compare_financials(params)
+    compact = make("compact")._compare_financials(params)
+
+    assert isinstance(structured, PeerComparison)
+    assert [company.name for company in structured.companies] == ["Alpha Corp", "Beta Inc"]
+    assert structured.companies[1].values["revenue"].value == 2000
+    assert json.loads(compact) == json.loads(structured.to_compact())
+
+
+@pytest.mark.asyncio
+async def test_async_peer_table(toolkit):
+    """Test the async path renders the same table."""
+    params = json.dumps({"ciks": ["1", "2"], "metrics": ["revenue"]})
+
+    assert await toolkit._acompare_financials(params) == toolkit._compare_financials(params)
@@ -0,0 +1,116 @@
+"""Tests for streaming filing text extraction."""
+
+import json
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.filing_text import extract_filing_text, normalize_section
+
+RISK_TEXT = "Our business is subject to numerous risks. " * 40
+
+FILING = (
+    "<html><head><title>10-K</title><style>p {color: red}</style></head><body>"
+    "<div style='display:none'><ix:header>hidden dei facts</ix:header></div>"
+    "<table>"
+    "<tr><td>Item 1.</td><td>Business</td><td>3</td></tr>"
+    "<tr><td>Item 1A.</td><td>Risk Factors</td><td>10</td></tr>"
+    "<tr><td>Item 1B.</td><td>Unresolved Staff Comments</td><td>20</td></tr>"
+    "<tr><td>Item 2.</td><td>Properties</td><td>21</td></tr>"
+    "</table>"
+    "<p>Item 1. Business</p><p>We make widgets &amp; gadgets.</p>"
+    "<p>Item 1A. Risk Factors</p><p>" + RISK_TEXT + "</p>"
+    "<script>var x = '<p>Item 9</p>';</script>"
+    "<p>Item 1B. Unresolved Staff Comments</p><p>None.</p>"
+    "<p>Item 2. Properties</p><p>" + "We lease offices. " * 40 + "</p>"
+    "</body></html>"
+)
+
+
+def chunked(text, size=97):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+def test_whole_document_text():
+    """Test tags, scripts, styles and hidden XBRL are dropped and entities decoded."""
+    reader = extract_filing_text(chunked(FILING), length=100000)
+
+    assert "We make widgets & gadgets." in reader.text
+    assert "color: red" not in reader.text
+    assert "var x" not in reader.text
+    assert "hidden dei facts" not in reader.text
+    assert not reader.has_more
+
+
+def test_section_skips_table_of_contents():
+    """Test the section starts at the real heading, not the ToC entry."""
+    reader = extract_filing_text(chunked(FILING), section="Risk Factors", length=100000)
+    lines = reader.text.splitlines()
+
+    assert lines[0] == "Item 1A. Risk Factors"
+    assert lines[1] == ""
+    assert lines[2].startswith("Our business is subject")
+    assert "Unresolved" not in reader.text
+
+
+def test_short_section_is_found():
+    """Test a short section body is not mistaken for a ToC entry."""
+    reader = extract_filing_text(chunked(FILING), section="Item 1B")
+
+    assert reader.text == "Item 1B. Unresolved Staff Comments\n\nNone."
+
+
+def test_missing_section():
+    """Test an absent item is reported as not found."""
+    reader = extract_filing_text(chunked(FILING), section="7")
+
+    assert not reader.section_found
+    assert reader.text == ""
+
+
+def test_stops_reading_early():
+    """Test the stream is abandoned once the section is complete."""
+    consumed = []
+
+    def tracking_chunks():
+        for chunk in chunked(FILING + "<p>filler</p>" * 10000):
+            consumed.append(chunk)
+            yield chunk
+
+    reader = extract_filing_text(tracking_chunks(), section="1A", length=100000)
+
+    assert reader.section_found
+    assert len(consumed) < len(FILING) // 97 + 5
+
+
+def test_paging():
+    """Test offset/length pages through the section."""
+    first = extract_filing_text(chunked(FILING), section="1A", offset=0, length=100)
+    second = extract_filing_text(chunked(FILING), section="1A", offset=100, length=100)
+    whole = extract_filing_text(chunked(FILING), section="1A", length=100000)
+
+    assert first.has_more
+    assert first.text + second.text == whole.text[:200]
+
+
+def test_normalize_section():
+    """Test section names map to item numbers."""
+    assert normalize_section("Item 7") == "7"
+    assert normalize_section("item 1a.") == "1A"
+    assert normalize_section("MD&A") == "7"
+    with pytest.raises(ValueError):
+        normalize_section("the good part")
+
+
+def test_filing_content_tool(edgar_server):
+    """Test the tool streams a section and reports the next offset."""
+    url = edgar_server.add("/Archives/edgar/data/1/doc.htm", FILING.encode(), **{
+        "Content-Type": "text/html; charset=utf-8",
+    })
+    toolkit = SECEdgarToolkit(SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)"))
+
+    result = toolkit._get_filing_content(json.dumps({"url": url, "section": "1A", "length": 200}))
+
+    assert result.startswith("Item 1A content (characters 0-200):\nItem 1A. Risk Factors")
+    assert result.endswith("[More content available: call again with offset 200]")
+    assert "Please provide" in toolkit._get_filing_content("0000320193-24-000081")
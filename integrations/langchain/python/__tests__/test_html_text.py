@@ -0,0 +1,96 @@
+"""Tests for the single-pass HTML to text converter."""
+
+import time
+
+import pytest
+from sec_edgar_langchain.html_text import HTMLTextConverter, html_to_text
+
+
+def convert_in_chunks(html, size):
+    converter = HTMLTextConverter()
+    parts = [converter.feed(html[i:i + size]) for i in range(0, len(html), size)]
+    parts.append(converter.close())
+    return "".join(parts).strip()
+
+
+def test_drops_scripts_styles_and_comments():
+    """Test non-rendered content never reaches the text."""
+    html = (
+        "<html><head><title>x</title></head><body>"
+        "<style>p { color: red }</style><script>if (a < b) { x = '</p>'; }</script>"
+        "<!-- <p>commented</p> --><p>Visible</p></body></html>"
+    )
+
+    assert html_to_text(html) == "Visible"
+
+
+def test_decodes_entities():
+    """Test named and numeric entities are decoded."""
+    assert html_to_text("<p>AT&amp;T&#8217;s &lt;b&gt;&nbsp;report</p>") == "AT&T’s <b> report"
+
+
+def test_paragraphs_and_lines():
+    """Test paragraphs are separated by a blank line and divs by a line break."""
+    html = "<p>First   paragraph\nwraps.</p><p>Second.</p><div>Line one</div><div>Line <b>two</b></div>"
+
+    assert html_to_text(html) == "First paragraph wraps.\n\nSecond.\n\nLine one\nLine two"
+
+
+def test_table_rows_are_delimited():
+    """Test each row is one line of cells, with split-off symbols merged."""
+    html = (
+        "<table><tr><td></td><td><p>2023</p></td><td></td><td>2022</td></tr>"
+        "<tr><td>Net sales</td><td>$</td><td>383,285</td><td>$</td><td>394,328</td></tr>"
+        "<tr><td>Change</td><td>(2.8</td><td>)%</td></tr></table><p>After</p>"
+    )
+
+    assert html_to_text(html) == (
+        "2023 | 2022\n"
+        "Net sales | $383,285 | $394,328\n"
+        "Change | (2.8)%\n"
+        "\n"
+        "After"
+    )
+
+
+def test_mixed_case_tags():
+    """Test block and skipped tags are recognised in any letter case."""
+    html = (
+        "<Head><Title>x</Title></Head><Div>Line one</Div><DIV>Line two</div>"
+        "<Table><Tr><Td>Net sales</Td><TD>$</TD><td>383,285</td></Tr><tR><td>Next</td></tR></Table>"
+        "<P>After</P><Script>x = 1</SCRIPT>"
+    )
+
+    assert html_to_text(html) == "Line one\nLine two\n\nNet sales | $383,285\nNext\n\nAfter"
+
+
+def test_bare_less_than_is_text():
+    """Test a '<' that does not start a tag is kept."""
+    assert html_to_text("<p>a < b</p>") == "a < b"
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64])
+def test_chunk_boundaries_do_not_change_output(size):
+    """Test tags, entities and skipped elements split across chunks."""
+    html = (
+        "<div><ix:header><ix:hidden>dei</ix:hidden></ix:header></div>"
+        "<p>Profit &amp; loss</p><script>var s = '<p>no</p>';</script>"
+        "<table><tr><td>Revenue</td><td>$</td><td>1,000</td></tr></table>"
+    )
+
+    assert convert_in_chunks(html, size) == html_to_text(html)
+    assert html_to_text(html) == "Profit & loss\n\nRevenue | $1,000"
+
+
+def test_streamed_large_header_is_linear():
+    """Test a multi-MB inline XBRL header fed in chunks is skipped in one pass."""
+    hidden = "<ix:hidden><ix:nonNumeric name='dei:X'>value</ix:nonNumeric></ix:hidden>" * 80000
+    html = f"<html><body><div><ix:header>{hidden}</IX:HEADER ></div><p>Item 1. Business</p></body></html>"
+    assert len(html) > 5_000_000
+
+    started = time.perf_counter()
+    streamed = convert_in_chunks(html, 64 * 1024)
+    elapsed = time.perf_counter() - started
+
+    assert streamed == html_to_text(html) == "Item 1. Business"
+    assert elapsed < 2.0
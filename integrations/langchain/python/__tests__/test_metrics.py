@@ -0,0 +1,160 @@
+"""Tests for tool and request metrics."""
+
+import json
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.cache import SQLiteResponseCache
+from sec_edgar_langchain.metrics import Metrics, MetricEvent, endpoint_label
+
+USER_AGENT = "TestApp/1.0 (test@example.com)"
+BODY = json.dumps({"cik": "320193", "name": "Apple Inc."}).encode()
+PATH = "/submissions/CIK0000320193.json"
+
+
+def config(edgar_server, **overrides):
+    return SECEdgarConfig(user_agent=USER_AGENT, base_url=edgar_server.url(""), **overrides)
+
+
+def tool(toolkit, name):
+    return next(tool for tool in toolkit.get_tools() if tool.name == name)
+
+
+def test_histograms_and_listeners():
+    """Test events are aggregated and forwarded, even past a failing listener."""
+    metrics = Metrics(buckets=(0.1, 1.0))
+    seen = []
+
+    def broken(event):
+        raise RuntimeError("exporter down")
+
+    metrics.add_listener(broken)
+    metrics.add_listener(seen.append)
+    for duration in (0.05, 0.05, 0.5, 3.0):
+        metrics.observe_tool("sec_edgar_8k_events", duration)
+    metrics.observe_request("https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json", 0.2, status=503)
+
+    stats = metrics.snapshot().tools["sec_edgar_8k_events"]
+    assert stats.buckets == (2, 1, 1)
+    assert (stats.count, stats.max, stats.mean) == (4, 3.0, 0.9)
+    assert stats.quantile(0.5) == 0.1
+    assert stats.quantile(0.99) == 3.0
+    assert metrics.snapshot().request_errors == {"companyfacts": 1}
+    assert len(seen) == 5 and isinstance(seen[0], MetricEvent)
+
+
+def test_endpoint_labels():
+    """Test URLs map to a small fixed set of labels."""
+    assert endpoint_label("https://data.sec.gov/submissions/CIK0000320193-submissions-001.json") == "submissions"
+    assert endpoint_label("https://www.sec.gov/files/company_tickers.json") == "tickers"
+    assert endpoint_label("https://www.sec.gov/Archives/edgar/data/320193/0000320193-24-000123.txt") == "archives"
+    assert endpoint_label("https://example.com/") == "other"
+
+
+def test_toolkit_reports_tool_request_and_cache_metrics(edgar_server, tmp_path):
+    """Test one tool call records its latency, the request and the cache lookup."""
+    edgar_server.add(PATH, BODY)
+    cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"))
+
+    with SECEdgarToolkit(config(edgar_server, parsed_cache_size=0), cache=cache) as toolkit:
+        info = tool(toolkit, "sec_edgar_company_info")
+        info.invoke("320193")
+        info.invoke("320193")
+        snapshot = toolkit.metrics.snapshot()
+
+    assert snapshot.tools["sec_edgar_company_info"].count == 2
+    assert snapshot.requests["submissions"].count == 1
+    assert snapshot.bytes_received == {"submissions": len(BODY)}
+    assert snapshot.cache == {"miss": 1, "hit": 1}
+    assert snapshot.cache_hit_ratio == 0.5
+    assert snapshot.limiter_wait >= 0.0
+    cache.close()
+
+
+DOCUMENT = b"<html><body>" + b"<p>Risk factors</p>" * 20000 + b"</body></html>"
+
+
+def test_streamed_bytes_are_counted_without_content_length(edgar_server):
+    """Test a document streamed without Content-Length is sized by the bytes read."""
+    url = edgar_server.add("/Archives/doc.htm", DOCUMENT, unsized=True)
+
+    with SECEdgarToolkit(config(edgar_server)) as toolkit:
+        tool(toolkit, "sec_edgar_filing_content").invoke(json.dumps({"url": url, "length": 100000000}))
+        snapshot = toolkit.metrics.snapshot()
+
+    assert snapshot.bytes_received == {"other": len(DOCUMENT)}
+    assert snapshot.requests["other"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_bytes_are_counted_without_content_length(edgar_server):
+    """Test the async client counts streamed bytes the same way."""
+    pytest.importorskip("httpx")
+    url = edgar_server.add("/Archives/doc.htm", DOCUMENT, unsized=True)
+
+    toolkit = SECEdgarToolkit(config(edgar_server))
+    await tool(toolkit, "sec_edgar_filing_content").ainvoke(json.dumps({"url": url, "length": 100000000}))
+    await toolkit.aclose()
+
+    assert toolkit.metrics.snapshot().bytes_received == {"other": len(DOCUMENT)}
+
+
+def test_retries_and_errors_are_counted(edgar_server):
+    """Test retried attempts and failed tool calls show up per endpoint and tool."""
+    edgar_server.add(PATH, BODY)
+    edgar_server.fail(PATH, 503)
+
+    with SECEdgarToolkit(config(edgar_server, retry_backoff=0.01)) as toolkit:
+        tool(toolkit, "sec_edgar_company_info").invoke("320193")
+        tool(toolkit, "sec_edgar_company_info").invoke("789019")
+        snapshot = toolkit.metrics.snapshot()
+
+    assert snapshot.retries == {"submissions": 1}
+    assert snapshot.request_errors == {"submissions": 2}
+    assert snapshot.tool_errors == {"sec_edgar_company_info": 1}
+
+
+def test_request_timeout(edgar_server):
+    """Test a slow response fails the attempt instead of hanging the tool."""
+    edgar_server.add(PATH, BODY, delay=1.0)
+
+    with SECEdgarToolkit(config(edgar_server, request_timeout=0.1, max_retries=0)) as toolkit:
+        output = tool(toolkit, "sec_edgar_company_info").invoke("320193")
+        snapshot = toolkit.metrics.snapshot()
+
+    assert output.startswith("Error fetching company info")
+    assert snapshot.requests["submissions"].max < 1.0
+    assert snapshot.request_errors == {"submissions": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_tools_are_timed(edgar_server):
+    """Test coroutine tool calls and async requests are recorded too."""
+    edgar_server.add(PATH, BODY)
+    events = []
+
+    async with SECEdgarToolkit(config(edgar_server)) as toolkit:
+        toolkit.metrics.add_listener(events.append)
+        await tool(toolkit, "sec_edgar_company_info").ainvoke("320193")
+
+    assert [(event.kind, event.name) for event in events] == [
+        ("request", "submissions"),
+        ("tool", "sec_edgar_company_info"),
+    ]
+
+
+def test_prometheus_exporter(edgar_server):
+    """Test the exporter mirrors events into a Prometheus registry."""
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from sec_edgar_langchain.metrics import PrometheusExporter
+
+    registry = prometheus_client.CollectorRegistry()
+    edgar_server.add(PATH, BODY)
+    with SECEdgarToolkit(config(edgar_server)) as toolkit:
+        toolkit.metrics.add_listener(PrometheusExporter(registry=registry))
+        tool(toolkit, "sec_edgar_company_info").invoke("320193")
+
+    assert registry.get_sample_value(
+        "sec_edgar_tool_duration_seconds_count", {"tool": "sec_edgar_company_info"}
+    ) == 1
+    assert registry.get_sample_value("sec_edgar_response_bytes_total", {"endpoint": "submissions"}) == len(BODY)
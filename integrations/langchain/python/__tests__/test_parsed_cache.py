@@ -0,0 +1,127 @@
+"""Tests for the parsed-object cache shared by chained tool calls."""
+
+import json
+from datetime import datetime, timedelta
+
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.backends import FixtureBackend
+from sec_edgar_langchain.company_facts import load_company_facts
+from sec_edgar_langchain.parsed_cache import ParsedObjectCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def recent(days_ago):
+    return (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+
+
+SUBMISSIONS = {
+    "cik": "320193",
+    "name": "Apple Inc.",
+    "tickers": ["AAPL"],
+    "filings": {"recent": {
+        "form": ["4", "8-K", "10-Q"],
+        "filingDate": [recent(2), recent(10), recent(40)],
+        "accessionNumber": ["0000320193-24-000003", "0000320193-24-000002", "0000320193-24-000001"],
+        "primaryDocument": ["form4.xml", "a8k.htm", "a10q.htm"],
+        "primaryDocDescription": ["Statement of changes", "Notice of annual meeting results", "10-Q"],
+    }},
+}
+FACTS = {"cik": 320193, "entityName": "Apple Inc.", "facts": {"us-gaap": {"Revenues": {"units": {"USD": [
+    {"end": "2024-09-28", "val": 391035000000, "form": "10-K", "fy": 2024, "fp": "FY"},
+]}}}}}
+
+
+class FilteringBackend(FixtureBackend):
+    """Decodes only the requested concepts, like a streaming HTTP backend."""
+
+    def company_facts(self, cik, concepts=None):
+        data = super().company_facts(cik, concepts)
+        return None if data is None else load_company_facts(json.dumps(data).encode(), concepts)
+
+
+def make_toolkit(backend_class=FixtureBackend, **overrides):
+    backend = backend_class(submissions={"320193": SUBMISSIONS}, company_facts={"320193": FACTS})
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", **overrides)
+    return SECEdgarToolkit(config, backend=backend), backend
+
+
+def test_lru_eviction_and_ttl():
+    """Test entries expire after the TTL and the oldest is evicted first."""
+    clock = FakeClock()
+    cache = ParsedObjectCache(max_entries=2, ttl=10, clock=clock)
+    cache.put(("filings", "1", ()), "a")
+    cache.put(("filings", "2", ()), "b")
+    assert cache.get(("filings", "1", ())) == "a"
+    cache.put(("filings", "3", ()), "c")
+
+    assert cache.get(("filings", "2", ())) is None
+    clock.now = 11
+    assert cache.get(("filings", "1", ())) is None
+    assert cache.stats().hits == 1
+
+
+def test_invalidate_one_company():
+    """Test invalidation drops only the given CIK's entries."""
+    cache = ParsedObjectCache()
+    cache.put(("submissions", "1", None), {})
+    cache.put(("facts", "1", None), {})
+    cache.put(("facts", "2", None), {})
+
+    cache.invalidate("1")
+
+    assert list(cache) == [("facts", "2", None)]
+
+
+def test_chained_tools_fetch_submissions_once():
+    """Test info, search, 8-K and insider tools share one parsed submissions payload."""
+    toolkit, backend = make_toolkit()
+
+    assert json.loads(toolkit._get_company_info("CIK: 320193, Name: Apple Inc."))["Name"] == "Apple Inc."
+    assert len(json.loads(toolkit._search_filings('{"cik": "320193"}'))) == 3
+    events = toolkit._get_8k_events("320193")
+    insider = toolkit._get_insider_trading('{"cik": "320193", "days_back": 30}')
+
+    assert backend.calls.count(("submissions", "0000320193")) == 1
+    assert "Description: Notice of annual meeting results" in events
+    assert "Total Form 4 Filings: 1" in insider
+
+
+def test_company_facts_reused_for_covered_concepts():
+    """Test a store holding the requested concepts is reused without refetching."""
+    toolkit, backend = make_toolkit(FilteringBackend)
+
+    first = toolkit._get_company_facts('{"cik": "320193", "concepts": ["us-gaap:Revenues", "Assets"]}')
+    second = toolkit._get_company_facts('{"cik": "320193", "concepts": ["us-gaap:Revenues"]}')
+    toolkit._get_company_facts('{"cik": "320193", "concepts": ["NetIncomeLoss"]}')
+
+    assert json.loads(first)["us-gaap:Revenues"] == json.loads(second)["us-gaap:Revenues"]
+    assert backend.calls.count(("company_facts", "0000320193")) == 2
+
+
+def test_complete_company_facts_serve_every_tool():
+    """Test a backend returning the whole document is asked once across tools."""
+    toolkit, backend = make_toolkit()
+
+    toolkit._get_company_facts('{"cik": "320193", "concepts": ["us-gaap:Revenues"]}')
+    toolkit._get_company_facts("320193")
+    toolkit._compare_financials('{"ciks": ["320193"]}')
+
+    assert backend.calls.count(("company_facts", "0000320193")) == 1
+
+
+def test_cache_can_be_disabled():
+    """Test parsed_cache_size=0 fetches on every call."""
+    toolkit, backend = make_toolkit(parsed_cache_size=0)
+
+    toolkit._get_company_info("320193")
+    toolkit._get_company_info("320193")
+
+    assert backend.calls.count(("submissions", "0000320193")) == 2
+    assert len(toolkit.parsed_cache) == 0
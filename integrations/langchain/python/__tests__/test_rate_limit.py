@@ -0,0 +1,103 @@
+"""Tests for the shared token-bucket rate limiter."""
+
+import pytest
+from sec_edgar_langchain import (
+    SECEdgarConfig,
+    SECEdgarToolkit,
+    TokenBucketRateLimiter,
+    get_shared_rate_limiter,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketRateLimiter:
+    """Test token bucket behaviour."""
+
+    def test_burst_goes_out_immediately(self):
+        """Test a full bucket releases a burst without waiting."""
+        limiter = TokenBucketRateLimiter(rate=10, burst=10, clock=FakeClock())
+
+        waits = [limiter.reserve() for _ in range(10)]
+
+        assert waits == [0.0] * 10
+        assert limiter.stats().delayed == 0
+
+    def test_never_exceeds_cap_in_any_window(self):
+        """Test the 11th request waits for the one-second window to roll."""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10, burst=10, clock=clock)
+
+        starts = [clock.now + limiter.reserve() for _ in range(30)]
+
+        for i in range(10, len(starts)):
+            assert starts[i] - starts[i - 10] >= 1.0 - 1e-9
+
+    def test_spaced_calls_do_not_wait(self):
+        """Test callers already spaced at the sustained rate never sleep."""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10, burst=1, clock=clock)
+
+        for _ in range(5):
+            assert limiter.reserve() == 0.0
+            clock.now += 0.11
+
+    def test_wait_metrics(self):
+        """Test wait time is accumulated in the stats snapshot."""
+        limiter = TokenBucketRateLimiter(rate=2, burst=1, clock=FakeClock())
+
+        limiter.reserve()
+        limiter.reserve()
+        limiter.reserve()
+        stats = limiter.stats()
+
+        assert stats.acquired == 3
+        assert stats.delayed == 2
+        assert stats.max_wait == pytest.approx(1.0)
+        assert stats.total_wait == pytest.approx(1.5)
+
+    @pytest.mark.asyncio
+    async def test_acquire_async(self):
+        """Test the async path waits without blocking."""
+        limiter = TokenBucketRateLimiter(rate=1000, burst=1)
+
+        await limiter.acquire_async()
+        waited = await limiter.acquire_async()
+
+        assert waited > 0
+
+    def test_configure_keeps_throttle_from_time_zero(self):
+        """Test a 429 seen at clock time 0 still caps a reconfigured rate."""
+        limiter = TokenBucketRateLimiter(rate=10, burst=1, clock=FakeClock())
+        limiter.throttle()
+
+        limiter.configure(rate=8)
+
+        assert (limiter.rate, limiter.configured_rate) == (5, 8)
+
+    def test_invalid_arguments(self):
+        """Test non-positive rates and bursts are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(burst=0)
+
+
+def test_limiter_shared_across_toolkits():
+    """Test every toolkit in the process uses the same limiter."""
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)")
+
+    first = SECEdgarToolkit(config)
+    second = SECEdgarToolkit(config)
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is get_shared_rate_limiter()
+    assert first._client.rate_limiter is first.rate_limiter
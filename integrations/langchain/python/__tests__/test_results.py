@@ -0,0 +1,156 @@
+"""Tests for the structured and compact tool output modes."""
+
+import json
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.backends import FixtureBackend
+from sec_edgar_langchain.results import CompanyFactsResult, Filing, FilingList, PeerComparison
+
+SUBMISSIONS = {
+    "cik": "320193",
+    "name": "Apple Inc.",
+    "tickers": ["AAPL"],
+    "sic": "3571",
+    "sicDescription": "Electronic Computers",
+    "filings": {"recent": {
+        "form": ["10-K", "10-Q"],
+        "filingDate": ["2024-11-01", "2024-08-02"],
+        "accessionNumber": ["0000320193-24-000123", "0000320193-24-000081"],
+        "primaryDocument": ["aapl-20240928.htm", "aapl-20240629.htm"],
+        "primaryDocDescription": ["10-K", "10-Q"],
+    }},
+}
+FACTS = {"cik": 320193, "entityName": "Apple Inc.", "facts": {"us-gaap": {
+    "Revenues": {"label": "Revenues", "units": {"USD": [
+        {"end": "2023-09-30", "start": "2022-10-01", "val": 383285000000, "form": "10-K", "fy": 2023, "fp": "FY"},
+        {"end": "2024-09-28", "start": "2023-10-01", "val": 391035000000, "form": "10-K", "fy": 2024, "fp": "FY"},
+    ]}},
+    "EarningsPerShareBasic": {"units": {"USD/shares": [
+        {"end": "2024-09-28", "val": 6.11, "form": "10-K", "fy": 2024, "fp": "FY"},
+    ]}},
+}}}
+
+
+def make_toolkit(output_format):
+    backend = FixtureBackend(submissions={"320193": SUBMISSIONS}, company_facts={"320193": FACTS})
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", output_format=output_format)
+    return SECEdgarToolkit(config, backend=backend)
+
+
+def test_structured_mode_returns_models():
+    """Test data tools return typed results holding raw values."""
+    toolkit = make_toolkit("structured")
+
+    filings = toolkit._search_filings('{"cik": "320193", "form_type": "10-K"}')
+    facts = toolkit._get_company_facts('{"cik": "320193", "concepts": ["Revenues", "Assets"], "years": 2}')
+    peers = toolkit._compare_financials('{"ciks": ["320193"], "metrics": ["revenue", "eps"]}')
+
+    assert isinstance(filings, FilingList)
+    assert filings.filings[0].accession == "0000320193-24-000123"
+    assert isinstance(facts, CompanyFactsResult)
+    assert [value.value for value in facts.concepts[0].values] == [391035000000, 383285000000]
+    assert facts.concepts[1].unit is None
+    assert isinstance(peers, PeerComparison)
+    assert peers.companies[0].values["eps"].unit == "USD/shares"
+    assert toolkit._get_company_info("320193").sic_description == "Electronic Computers"
+
+
+def test_compact_mode_abbreviates_and_drops_unset_fields():
+    """Test compact output is minified JSON with short keys."""
+    toolkit = make_toolkit("compact")
+
+    filings = toolkit._search_filings('{"cik": "320193", "form_type": "10-K"}')
+    facts = toolkit._get_company_facts('{"cik": "320193", "concepts": ["us-gaap:Revenues"]}')
+
+    assert json.loads(filings) == {"cik": "0000320193", "form": "10-K", "filings": [{
+        "form": "10-K",
+        "date": "2024-11-01",
+        "acc": "0000320193-24-000123",
+        "doc": "aapl-20240928.htm",
+        "desc": "10-K",
+        "url": "https://www.sec.gov/Archives/edgar/data/0000320193/000032019324000123/aapl-20240928.htm",
+    }]}
+    assert "\n" not in facts
+    assert json.loads(facts)["facts"][0]["vals"] == [
+        {"v": 391035000000, "end": "2024-09-28", "start": "2023-10-01", "form": "10-K", "fp": "FY 2024"}
+    ]
+
+
+def test_compact_output_is_smaller_than_text():
+    """Test compact renderings carry the same data in fewer characters."""
+    text = make_toolkit("text")
+    compact = make_toolkit("compact")
+
+    for tool, params in [
+        ("_search_filings", '{"cik": "320193"}'),
+        ("_get_company_facts", '{"cik": "320193", "concepts": ["Revenues"], "years": 2}'),
+        ("_get_company_info", "320193"),
+    ]:
+        assert len(getattr(compact, tool)(params)) < len(getattr(text, tool)(params))
+
+
+def test_financial_statements_follow_output_format():
+    """Test compact financial statements are bare JSON and structured ones a model."""
+    compact = make_toolkit("compact")._get_financial_statements("320193")
+
+    assert json.loads(compact)
+    assert isinstance(make_toolkit("structured")._get_financial_statements("320193"), CompanyFactsResult)
+    assert make_toolkit("text")._get_financial_statements("320193").startswith("Financial Statements:\n")
+
+
+def test_text_mode_formats_from_results():
+    """Test the default text output keeps its layout."""
+    toolkit = make_toolkit("text")
+
+    summary = json.loads(toolkit._get_company_facts("320193"))
+    table = toolkit._compare_financials('{"ciks": ["320193"], "metrics": ["revenue", "eps", "assets"]}')
+
+    assert summary == {
+        "Latest Revenue": {"value": "$391,035,000,000", "period": "2024-09-28", "form": "10-K"},
+        "EPS (Basic)": {"value": "$6.11", "period": "2024-09-28", "form": "10-K"},
+    }
+    assert "| revenue | $391,035,000,000 (2024-09-28) |" in table
+    assert "| assets | N/A |" in table
+
+
+def test_insider_text_marks_missing_descriptions():
+    """Test filings without a description read N/A rather than None."""
+    result = FilingList(cik="0000320193", form_type="4", filings=[Filing(
+        form="4", filing_date="2024-11-01", accession="0000320193-24-000123",
+        primary_document="form4.xml", url="https://www.sec.gov/form4.xml",
+    )])
+
+    summary = SECEdgarToolkit._format_insider_trading(result, 30)
+
+    assert "Document: N/A" in summary
+    assert "None" not in summary
+
+
+def test_structured_results_serialize_compactly_for_the_model():
+    """Test LangChain receives the compact rendering when it builds a tool message."""
+    toolkit = make_toolkit("structured")
+    tool = next(tool for tool in toolkit.get_tools() if tool.name == "sec_edgar_filing_search")
+
+    message = tool.invoke({
+        "type": "tool_call",
+        "id": "call-1",
+        "name": tool.name,
+        "args": {"__arg1": '{"cik": "320193"}'},
+    })
+
+    assert message.content == str(toolkit._search_filings('{"cik": "320193"}'))
+    assert json.loads(message.content)["filings"][1]["acc"] == "0000320193-24-000081"
+
+
+def test_errors_stay_text_in_structured_mode():
+    """Test failures are reported as text in every mode."""
+    toolkit = make_toolkit("structured")
+
+    assert toolkit._get_company_info("789019").startswith("Error fetching company info")
+
+
+def test_unknown_output_format_is_rejected():
+    """Test the config only accepts the known modes."""
+    with pytest.raises(ValueError):
+        SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", output_format="yaml")
@@ -0,0 +1,171 @@
+"""Tests for retries, Retry-After handling and the circuit breaker."""
+
+import json
+import time
+
+import pytest
+import requests
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.client import AsyncSECEdgarHTTPClient, SECEdgarHTTPClient
+from sec_edgar_langchain.rate_limit import TokenBucketRateLimiter
+from sec_edgar_langchain.retry import CircuitOpenError, RetryPolicy, parse_retry_after
+
+USER_AGENT = "TestApp/1.0 (test@example.com)"
+BODY = json.dumps({"cik": "320193", "name": "Apple Inc."}).encode()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def fast_policy(**overrides):
+    options = {"backoff_base": 0.01, "backoff_max": 0.05}
+    options.update(overrides)
+    return RetryPolicy(**options)
+
+
+def test_parse_retry_after():
+    """Test both header forms are understood."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412500.0) == 10.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_is_jittered_and_capped():
+    """Test the backoff ceiling doubles per retry up to the maximum."""
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=4.0, jitter=lambda: 1.0)
+
+    assert [policy.backoff(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 4.0, 4.0]
+    assert RetryPolicy(jitter=lambda: 0.25).backoff(1) == 0.25
+
+
+def test_transient_errors_are_retried(edgar_server):
+    """Test 5xx responses are retried until the request succeeds."""
+    url = edgar_server.add("/submissions/CIK0000320193.json", BODY)
+    edgar_server.fail("/submissions/CIK0000320193.json", 503, 502)
+    policy = fast_policy()
+
+    with SECEdgarHTTPClient(USER_AGENT, retry_policy=policy) as client:
+        assert client.get_json(url)["name"] == "Apple Inc."
+
+    assert len(edgar_server.requests) == 3
+    assert policy.stats().retries == 2
+
+
+def test_429_throttles_the_shared_limiter(edgar_server):
+    """Test Retry-After is honoured and the limiter slows down for every caller."""
+    url = edgar_server.add("/submissions/CIK0000320193.json", BODY)
+    edgar_server.fail("/submissions/CIK0000320193.json", 429, **{"Retry-After": "0.2"})
+    limiter = TokenBucketRateLimiter(rate=10, burst=10)
+    policy = fast_policy(rate_limiter=limiter)
+
+    started = time.monotonic()
+    with SECEdgarHTTPClient(USER_AGENT, rate_limiter=limiter, retry_policy=policy) as client:
+        assert client.get_json(url)["name"] == "Apple Inc."
+
+    assert time.monotonic() - started >= 0.2
+    assert limiter.rate == 5.0 and limiter.throttled
+    assert limiter.stats().throttled == 1
+    assert policy.stats().throttled == 1
+
+
+def test_limiter_throttle_and_recover():
+    """Test a throttled limiter holds tokens back and recovers stepwise."""
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=8, burst=8, clock=clock)
+
+    limiter.throttle(hold=2.0)
+    assert limiter.reserve() == 2.0
+    assert limiter.rate == 4.0
+
+    clock.now += 10
+    limiter.recover(quiet=30)
+    assert limiter.rate == 4.0
+    clock.now += 30
+    limiter.recover(quiet=30)
+    assert limiter.rate == 8.0 and not limiter.throttled
+
+
+def test_retry_budget_caps_retries(edgar_server):
+    """Test an endpoint stops retrying once its budget is spent."""
+    url = edgar_server.add("/submissions/CIK0000320193.json", BODY)
+    edgar_server.fail("/submissions/CIK0000320193.json", 503, 503, 503)
+    policy = fast_policy(budgets={"/submissions/": 1})
+
+    with SECEdgarHTTPClient(USER_AGENT, retry_policy=policy) as client:
+        with pytest.raises(requests.HTTPError):
+            client.fetch(url)
+
+    assert len(edgar_server.requests) == 2
+    assert policy.stats().exhausted == 1
+
+
+def test_circuit_opens_and_half_opens(edgar_server):
+    """Test repeated failures make requests fail fast until the reset timeout."""
+    url = edgar_server.add("/submissions/CIK0000320193.json", BODY)
+    edgar_server.fail("/submissions/CIK0000320193.json", 500, 500)
+    clock = FakeClock()
+    policy = fast_policy(max_retries=0, failure_threshold=2, reset_timeout=30, clock=clock)
+
+    with SECEdgarHTTPClient(USER_AGENT, retry_policy=policy) as client:
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                client.fetch(url)
+        with pytest.raises(CircuitOpenError):
+            client.fetch(url)
+        assert len(edgar_server.requests) == 2
+
+        clock.now += 30
+        assert client.get_json(url)["name"] == "Apple Inc."
+
+    stats = policy.stats()
+    assert (stats.circuit_opens, stats.rejected) == (1, 1)
+
+
+def test_connection_errors_are_retried():
+    """Test requests that never get a response are retried, then raised."""
+    policy = fast_policy(max_retries=2)
+
+    with SECEdgarHTTPClient(USER_AGENT, retry_policy=policy) as client:
+        with pytest.raises(requests.ConnectionError):
+            client.get("http://127.0.0.1:1/submissions/CIK0000320193.json")
+
+    assert (policy.stats().retries, policy.stats().exhausted) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries(edgar_server):
+    """Test the async client retries plain and streaming requests."""
+    url = edgar_server.add("/Archives/edgar/data/320193/doc.htm", b"<p>Item 1A</p>")
+    edgar_server.fail("/Archives/edgar/data/320193/doc.htm", 503, 504)
+    policy = fast_policy()
+
+    async with AsyncSECEdgarHTTPClient(USER_AGENT, retry_policy=policy) as client:
+        async with client.stream(url) as response:
+            assert response.status_code == 200
+            assert await response.aread() == b"<p>Item 1A</p>"
+        edgar_server.fail("/Archives/edgar/data/320193/doc.htm", 500)
+        assert await client.fetch(url) == b"<p>Item 1A</p>"
+
+    assert policy.stats().retries == 3
+
+
+def test_toolkit_rides_out_transient_errors(edgar_server):
+    """Test a tool call succeeds through a 503 instead of reporting an error."""
+    edgar_server.add("/submissions/CIK0000320193.json", BODY)
+    edgar_server.fail("/submissions/CIK0000320193.json", 503)
+    config = SECEdgarConfig(user_agent=USER_AGENT, base_url=edgar_server.url(""), retry_backoff=0.01)
+
+    with SECEdgarToolkit(config) as toolkit:
+        assert json.loads(toolkit._get_company_info("320193"))["Name"] == "Apple Inc."
+        assert toolkit.retry_policy.stats().retries == 1
+
+    edgar_server.fail("/submissions/CIK0000320193.json", 503)
+    config = SECEdgarConfig(user_agent=USER_AGENT, base_url=edgar_server.url(""), max_retries=0)
+    with SECEdgarToolkit(config) as toolkit:
+        assert "503" in toolkit._get_company_info("320193")
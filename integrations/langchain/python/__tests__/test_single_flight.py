@@ -0,0 +1,111 @@
+"""Tests for coalescing identical concurrent fetches."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.single_flight import SingleFlight
+
+
+def test_concurrent_threads_share_one_call():
+    """Test callers arriving while a call is in flight get its result object."""
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"cik": "320193"}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: flight.do("submissions", fetch), range(8)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = flight.stats()
+    assert (stats.calls, stats.coalesced, stats.executed, stats.in_flight) == (8, 7, 1, 0)
+
+
+def test_errors_are_shared_and_not_remembered():
+    """Test waiters see the leader's exception and a later call runs again."""
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("503 Service Unavailable")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    call()
+    leader.join()
+
+    assert errors == ["503 Service Unavailable"] * 2
+    assert flight.do("key", lambda: "ok") == "ok"
+    assert flight.stats().coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_coroutines_share_one_call():
+    """Test concurrent coroutines await one fetch."""
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return ["row"]
+
+    results = await asyncio.gather(*(flight.ado("facts", fetch) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats().coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_fetch():
+    """Test cancelling one waiter leaves the shared fetch running."""
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "body"
+
+    leader = asyncio.ensure_future(flight.ado("url", fetch))
+    waiter = asyncio.ensure_future(flight.ado("url", fetch))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    assert await leader == "body"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+def test_toolkit_coalesces_duplicate_gets(edgar_server):
+    """Test concurrent tool calls for one company cost one HTTP request."""
+    body = json.dumps({"cik": "320193", "name": "Apple Inc."}).encode()
+    edgar_server.add("/submissions/CIK0000320193.json", body, delay=0.2)
+    config = SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)", base_url=edgar_server.url(""))
+
+    with SECEdgarToolkit(config) as toolkit:
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(toolkit._get_company_info, ["320193", "CIK: 320193, Name: Apple"] * 3))
+
+        assert len(edgar_server.requests) == 1
+        assert all(json.loads(result)["Name"] == "Apple Inc." for result in results)
+        assert toolkit.single_flight.stats().coalesced == 5
@@ -0,0 +1,149 @@
+"""Tests for the columnar filing index."""
+
+import json
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.backends import FixtureBackend
+from sec_edgar_langchain.submissions import FilingIndex
+
+
+def submissions(rows):
+    """Build a submissions payload from (form, date) rows, newest first."""
+    return {"filings": {"recent": {
+        "form": [form for form, _ in rows],
+        "filingDate": [date for _, date in rows],
+        "accessionNumber": [f"0000000001-24-{i:06d}" for i in range(len(rows))],
+        "primaryDocument": [f"doc{i}.htm" for i in range(len(rows))],
+        "primaryDocDescription": [form for form, _ in rows],
+    }}}
+
+
+# 300 filings: a 10-K every year-end, 10-Qs and 8-Ks in between
+ROWS = []
+for year in range(2024, 1999, -1):
+    ROWS.append(("10-K", f"{year}-12-20"))
+    for month in range(11, 0, -1):
+        ROWS.append(("10-Q" if month % 3 == 0 else "8-K", f"{year}-{month:02d}-15"))
+ROWS.insert(5, ("10-K/A", "2024-06-15"))
+
+
+def test_form_and_date_filters():
+    """Test filters match the original linear-scan semantics over all rows."""
+    index = FilingIndex.from_submissions(submissions(ROWS))
+    dates = index.column("filingDate")
+
+    rows = index.search(form_type="10-k", date_from="2001-01-01", date_to="2003-12-31")
+    assert [dates[row] for row in rows] == ["2003-12-20", "2002-12-20", "2001-12-20"]
+
+    amended = index.search(form_type="10-K", date_from="2024-01-01")
+    assert [index.column("form")[row] for row in amended] == ["10-K", "10-K/A"]
+
+    expected = [
+        i for i, (form, date) in enumerate(ROWS)
+        if "8-K" in form and "2010-03-01" <= date <= "2011-02-28"
+    ]
+    assert index.search(form_type="8-K", date_from="2010-03-01", date_to="2011-02-28") == expected
+
+
+def test_unfiltered_search_is_newest_first():
+    """Test results keep payload order and honor the limit."""
+    index = FilingIndex.from_submissions(submissions(ROWS))
+
+    assert len(index) == len(ROWS)
+    assert index.search(limit=3) == [0, 1, 2]
+    assert index.earliest_date == "2000-01-15"
+    assert index.search(form_type="S-1") == []
+
+
+def test_search_tool_sees_entire_history():
+    """Test the tool finds filings older than the first 50 rows."""
+    toolkit = SECEdgarToolkit(
+        SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)"),
+        backend=FixtureBackend(submissions={"1": submissions(ROWS)}),
+    )
+
+    result = json.loads(toolkit._search_filings(json.dumps({
+        "cik": "1", "form_type": "10-K", "date_to": "2005-12-31",
+    })))
+
+    assert len(result) == 6
+    assert result[0]["filing_date"] == "2005-12-20"
+    assert result[0]["url"].startswith("https://www.sec.gov/Archives/edgar/data/0000000001/")
+
+
+def split_history(rows, recent_size, page_size):
+    """Split rows into a submissions payload plus overflow pages, like EDGAR does."""
+    data = submissions(rows[:recent_size])
+    pages = {}
+    for start in range(recent_size, len(rows), page_size):
+        chunk = rows[start:start + page_size]
+        name = f"CIK0000000001-submissions-{len(pages) + 1:03d}.json"
+        pages[name] = submissions(chunk)["filings"]["recent"]
+        data["filings"].setdefault("files", []).append({
+            "name": name,
+            "filingCount": len(chunk),
+            "filingFrom": chunk[-1][1],
+            "filingTo": chunk[0][1],
+        })
+    return data, pages
+
+
+@pytest.fixture
+def history_toolkit(edgar_server):
+    data, pages = split_history(ROWS, recent_size=50, page_size=100)
+    edgar_server.add("/submissions/CIK0000000001.json", json.dumps(data).encode())
+    for name, page in pages.items():
+        edgar_server.add(f"/submissions/{name}", json.dumps(page).encode())
+
+    toolkit = SECEdgarToolkit(SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)"))
+    toolkit.base_url = edgar_server.url("")
+    yield toolkit
+    toolkit.close()
+
+
+def page_requests(edgar_server):
+    return sorted(path for path, _ in edgar_server.requests if "-submissions-" in path)
+
+
+def test_recent_range_skips_overflow_pages(history_toolkit, edgar_server):
+    """Test pages are not downloaded when 'recent' covers the range."""
+    result = json.loads(history_toolkit._search_filings(json.dumps({
+        "cik": "1", "form_type": "10-K", "date_from": "2022-01-01",
+    })))
+
+    assert [filing["filing_date"] for filing in result] == ["2024-12-20", "2024-06-15", "2023-12-20", "2022-12-20"]
+    assert page_requests(edgar_server) == []
+
+
+def test_old_range_fetches_only_overlapping_pages(history_toolkit, edgar_server):
+    """Test a range past 'recent' merges just the pages it overlaps."""
+    result = json.loads(history_toolkit._search_filings(json.dumps({
+        "cik": "1", "form_type": "10-K", "date_from": "2013-01-01", "date_to": "2016-12-31",
+    })))
+
+    assert [filing["filing_date"][:4] for filing in result] == ["2016", "2015", "2014", "2013"]
+    assert page_requests(edgar_server) == ["/submissions/CIK0000000001-submissions-001.json"]
+
+
+def test_open_ended_range_fetches_every_page(history_toolkit, edgar_server):
+    """Test a range with only date_to reaches back through the overflow pages."""
+    result = json.loads(history_toolkit._search_filings(json.dumps({
+        "cik": "1", "form_type": "10-K", "date_to": "2030-01-01",
+    })))
+
+    assert len(page_requests(edgar_server)) == 3
+    assert result[-1]["filing_date"] == "2006-12-20"
+
+
+@pytest.mark.asyncio
+async def test_async_search_reaches_full_history(history_toolkit, edgar_server):
+    """Test the async path fetches every needed page and matches the sync result."""
+    params = json.dumps({"cik": "1", "form_type": "10-K", "date_from": "1990-01-01"})
+
+    result = await history_toolkit._asearch_filings(params)
+
+    assert len(page_requests(edgar_server)) == 3
+    assert json.loads(result)[-1]["filing_date"] == "2006-12-20"
+    assert result == history_toolkit._search_filings(params)
+    await history_toolkit.aclose()
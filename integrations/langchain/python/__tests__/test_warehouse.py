@@ -0,0 +1,230 @@
+"""Tests for the bulk-archive warehouse."""
+
+import json
+import zipfile
+
+import pytest
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain import warehouse as warehouse_module
+from sec_edgar_langchain.warehouse import Warehouse, ingest, main
+
+
+def fact(start, end, val, fy, fp, form, filed, accn):
+    row = {"end": end, "val": val, "fy": fy, "fp": fp, "form": form, "filed": filed, "accn": accn}
+    if start:
+        row["start"] = start
+    return row
+
+
+APPLE_SUBMISSIONS = {
+    "cik": "320193",
+    "name": "Apple Inc.",
+    "tickers": ["AAPL"],
+    "exchanges": ["Nasdaq"],
+    "sicDescription": "Electronic Computers",
+    "filings": {
+        "recent": {
+            "accessionNumber": ["0000320193-24-000123", "0000320193-24-000081"],
+            "form": ["10-K", "10-Q"],
+            "filingDate": ["2024-11-01", "2024-08-02"],
+            "primaryDocument": ["aapl-20240928.htm", "aapl-20240629.htm"],
+            "primaryDocDescription": ["10-K", "10-Q"],
+        },
+        "files": [{"name": "CIK0000320193-submissions-001.json", "filingFrom": "1994-01-26", "filingTo": "2015-12-31"}],
+    },
+}
+APPLE_PAGE = {
+    "accessionNumber": ["0000320193-05-000052"],
+    "form": ["10-K"],
+    "filingDate": ["2005-12-01"],
+    "primaryDocument": ["d10k.htm"],
+    "primaryDocDescription": ["10-K"],
+}
+MICROSOFT_SUBMISSIONS = {
+    "cik": "789019",
+    "name": "MICROSOFT CORP",
+    "tickers": ["MSFT"],
+    "filings": {"recent": {
+        "accessionNumber": ["0000950170-24-087843"],
+        "form": ["10-K"],
+        "filingDate": ["2024-07-30"],
+        "primaryDocument": ["msft-20240630.htm"],
+        "primaryDocDescription": ["10-K"],
+    }, "files": []},
+}
+
+
+def company_facts(cik, name, revenues):
+    return {
+        "cik": cik,
+        "entityName": name,
+        "facts": {
+            "dei": {"EntityCommonStockSharesOutstanding": {"label": "Shares Outstanding", "units": {"shares": [
+                fact(None, "2024-10-18", 15115823000, 2024, "FY", "10-K", "2024-11-01", "x"),
+            ]}}},
+            "us-gaap": {"Revenues": {"label": "Revenues", "description": "Total revenue", "units": {"USD": revenues}}},
+        },
+    }
+
+
+APPLE_FACTS = company_facts(320193, "Apple Inc.", [
+    fact("2022-09-25", "2023-09-30", 383285000000, 2023, "FY", "10-K", "2023-11-03", "a-23"),
+    fact("2023-10-01", "2024-09-28", 391035000000, 2024, "FY", "10-K", "2024-11-01", "a-24"),
+    fact("2024-06-30", "2024-09-28", 94930000000, 2024, "FY", "10-K", "2024-11-01", "a-24"),
+])
+MICROSOFT_FACTS = company_facts(789019, "Microsoft Corporation", [
+    fact("2023-07-01", "2024-06-30", 245122000000, 2024, "FY", "10-K", "2024-07-30", "m-24"),
+])
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, payload in members.items():
+            archive.writestr(name, payload if isinstance(payload, str) else json.dumps(payload))
+    return str(path)
+
+
+@pytest.fixture
+def archives(tmp_path):
+    submissions = write_zip(tmp_path / "submissions.zip", {
+        "CIK0000320193.json": APPLE_SUBMISSIONS,
+        "CIK0000320193-submissions-001.json": APPLE_PAGE,
+        "CIK0000789019.json": MICROSOFT_SUBMISSIONS,
+    })
+    facts = write_zip(tmp_path / "companyfacts.zip", {
+        "CIK0000320193.json": APPLE_FACTS,
+        "CIK0000789019.json": MICROSOFT_FACTS,
+        "CIK0000000001.json": "{not json",
+    })
+    return submissions, facts
+
+
+@pytest.fixture
+def warehouse(tmp_path, archives):
+    path = str(tmp_path / "edgar.sqlite")
+    ingest(path, submissions=archives[0], company_facts=archives[1], workers=2)
+    with Warehouse(path) as warehouse:
+        yield warehouse
+
+
+def test_ingest_counts_rows_and_skips_bad_members(tmp_path, archives):
+    """Test members are parsed in worker processes and bad JSON is skipped."""
+    stats = ingest(str(tmp_path / "edgar.sqlite"), submissions=archives[0], company_facts=archives[1], workers=2)
+
+    assert (stats.members, stats.filings, stats.facts, stats.errors) == (6, 4, 6, 1)
+    with Warehouse(str(tmp_path / "edgar.sqlite")) as warehouse:
+        assert warehouse.counts() == {"companies": 2, "filings": 4, "concepts": 2, "facts": 6}
+
+
+def test_reingest_replaces_facts(tmp_path, archives):
+    """Test a refresh from a newer archive does not duplicate rows."""
+    path = str(tmp_path / "edgar.sqlite")
+    ingest(path, submissions=archives[0], company_facts=archives[1], workers=0)
+    ingest(path, submissions=archives[0], company_facts=archives[1], workers=0)
+
+    with Warehouse(path) as warehouse:
+        assert warehouse.counts()["facts"] == 6
+        assert warehouse.counts()["filings"] == 4
+
+
+def test_submissions_merge_overflow_pages(warehouse):
+    """Test the rebuilt payload holds the whole history newest first."""
+    data = warehouse.submissions("0000320193")
+
+    assert data["name"] == "Apple Inc."
+    assert data["filings"]["recent"]["filingDate"] == ["2024-11-01", "2024-08-02", "2005-12-01"]
+    assert data["filings"]["files"] == []
+    assert warehouse.submissions("0000000002") is None
+
+
+def test_company_facts_round_trip(warehouse):
+    """Test the rebuilt companyfacts payload and concept filtering."""
+    data = warehouse.company_facts("0000320193")
+    revenue = data["facts"]["us-gaap"]["Revenues"]
+
+    assert data["entityName"] == "Apple Inc."
+    assert revenue["description"] == "Total revenue"
+    assert revenue["units"]["USD"] == APPLE_FACTS["facts"]["us-gaap"]["Revenues"]["units"]["USD"]
+    assert isinstance(revenue["units"]["USD"][0]["val"], int)
+
+    only = warehouse.company_facts("320193", ["us-gaap:Revenues"])
+    assert list(only["facts"]) == ["us-gaap"]
+    assert warehouse.company_facts("320193", ["dei:Revenues"])["facts"] == {}
+
+
+def test_company_tickers(warehouse):
+    """Test the ticker mapping is built from submissions."""
+    tickers = warehouse.company_tickers()
+
+    assert sorted(entry["ticker"] for entry in tickers.values()) == ["AAPL", "MSFT"]
+    assert {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."} in tickers.values()
+
+
+def test_limit_loads_main_documents_before_pages(tmp_path, archives):
+    """Test a limited load takes a company's main document before its overflow pages."""
+    path = str(tmp_path / "limited.sqlite")
+    ingest(path, submissions=archives[0], workers=0, limit=1)
+
+    with Warehouse(path) as warehouse:
+        assert warehouse.submissions("320193")["name"] == "Apple Inc."
+        assert warehouse.counts()["filings"] == len(APPLE_SUBMISSIONS["filings"]["recent"]["accessionNumber"])
+    assert warehouse_module._ARCHIVES == {}
+
+
+def test_partial_warehouse_defers_tickers(tmp_path, archives):
+    """Test a warehouse loaded with --limit leaves ticker lookups to the next backend."""
+    path = str(tmp_path / "partial.sqlite")
+    ingest(path, submissions=archives[0], workers=0, limit=1)
+    with Warehouse(path) as warehouse:
+        assert warehouse.company_tickers() is None
+
+    ingest(path, company_facts=archives[1], workers=0)
+    with Warehouse(path) as warehouse:
+        assert warehouse.company_tickers() is None
+
+    ingest(path, submissions=archives[0], workers=0)
+    with Warehouse(path) as warehouse:
+        assert len(warehouse.company_tickers()) == 2
+
+
+def test_latest_facts_screen(warehouse):
+    """Test one latest value per company, largest first."""
+    rows = warehouse.latest_facts("Revenues", fiscal_period="FY")
+
+    assert [(row["cik"], row["value"]) for row in rows] == [
+        ("0000320193", 391035000000),
+        ("0000789019", 245122000000),
+    ]
+    assert rows[1]["name"] == "MICROSOFT CORP"
+
+
+def test_toolkit_serves_from_warehouse_offline(warehouse):
+    """Test tools answer from the warehouse without any HTTP request."""
+    toolkit = SECEdgarToolkit(SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)"), warehouse=warehouse)
+    toolkit.base_url = "http://127.0.0.1:9"
+    toolkit.tickers_url = "http://127.0.0.1:9/files/company_tickers.json"
+
+    assert toolkit._lookup_cik("AAPL").startswith("CIK: 0000320193, Name: Apple Inc.")
+    filings = json.loads(toolkit._search_filings('{"cik": "320193", "form_type": "10-K", "date_from": "2000-01-01"}'))
+    assert [filing["filing_date"] for filing in filings] == ["2024-11-01", "2005-12-01"]
+    assert "391,035,000,000" in toolkit._get_company_facts("320193")
+
+
+@pytest.mark.asyncio
+async def test_async_tools_use_warehouse(warehouse):
+    """Test the async path reads the warehouse too."""
+    toolkit = SECEdgarToolkit(SECEdgarConfig(user_agent="TestApp/1.0 (test@example.com)"), warehouse=warehouse)
+    toolkit.base_url = "http://127.0.0.1:9"
+
+    info = json.loads(await toolkit._aget_company_info("320193"))
+    assert info["Ticker"] == "AAPL"
+    assert "391,035,000,000" in await toolkit._aget_company_facts("320193")
+
+
+def test_cli_ingest_and_stats(tmp_path, archives, capsys):
+    """Test the sec-edgar-warehouse command."""
+    path = str(tmp_path / "cli.sqlite")
+
+    assert main(["ingest", path, "--submissions", archives[0], "--workers", "1"]) == 0
+    assert main(["stats", path]) == 0
+    assert "filings: 4" in capsys.readouterr().out
@@ -0,0 +1,126 @@
+"""Peak memory benchmark for decoding large companyfacts payloads.
+
+Builds a synthetic companyfacts document shaped like a large bank's
+(thousands of us-gaap concepts with long histories) and measures peak RSS
+of decoding it in a fresh process per mode:
+
+- ``json``: ``json.loads`` of the whole document, as the HTTP backend does by default
+- ``stream``: ``load_company_facts`` keeping only the four concepts of the
+  default company facts summary (needs ``pip install ijson``)
+
+    python benchmarks/bench_company_facts_memory.py --concepts 4000
+    python benchmarks/bench_company_facts_memory.py --file CIK0000019617.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+SUMMARY_CONCEPTS = [
+    "us-gaap:Revenues",
+    "us-gaap:NetIncomeLoss",
+    "us-gaap:Assets",
+    "us-gaap:EarningsPerShareBasic",
+]
+
+
+def synthetic_company_facts(concepts: int, periods: int) -> dict:
+    """A companyfacts payload with ``concepts`` concepts of ``periods`` reports each."""
+    def rows(seed: int) -> list:
+        out = []
+        for i in range(periods):
+            year = 2024 - i // 4
+            quarter = 4 - i % 4
+            out.append({
+                "start": f"{year}-01-01",
+                "end": f"{year}-{quarter * 3:02d}-30",
+                "val": seed * 1000 + i,
+                "accn": f"0000019617-{year % 100:02d}-{i:06d}",
+                "fy": year,
+                "fp": "FY" if quarter == 4 else f"Q{quarter}",
+                "form": "10-K" if quarter == 4 else "10-Q",
+                "filed": f"{year + 1}-02-{(i % 27) + 1:02d}",
+                "frame": f"CY{year}Q{quarter}",
+            })
+        return out
+
+    gaap = {
+        f"SyntheticConcept{n}": {
+            "label": f"Synthetic concept {n}",
+            "description": "A synthetic concept used to size the benchmark payload.",
+            "units": {"USD": rows(n)},
+        }
+        for n in range(concepts)
+    }
+    for name in ("Revenues", "NetIncomeLoss", "Assets"):
+        gaap[name] = {"label": name, "units": {"USD": rows(1)}}
+    gaap["EarningsPerShareBasic"] = {"label": "EPS", "units": {"USD/shares": rows(2)}}
+    return {"cik": 19617, "entityName": "Synthetic Bank Corp", "facts": {"us-gaap": gaap}}
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_mode(mode: str, path: str) -> None:
+    """Decode ``path`` in this process and print peak RSS and wall time as JSON."""
+    from sec_edgar_langchain.company_facts import load_company_facts
+
+    with open(path, "rb") as f:
+        body = f.read()
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "json":
+        data = json.loads(body)
+    else:
+        data = load_company_facts(body, SUMMARY_CONCEPTS)
+    elapsed = time.perf_counter() - start
+    kept = sum(len(entries) for entries in data["facts"].values())
+    print(json.dumps({"peak": peak_rss_mb(), "baseline": baseline, "seconds": elapsed, "concepts": kept}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", help="Benchmark a companyfacts JSON file on disk")
+    parser.add_argument("--concepts", type=int, default=4000, help="Synthetic concept count")
+    parser.add_argument("--periods", type=int, default=40, help="Reports per synthetic concept")
+    parser.add_argument("--run", choices=["json", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_mode(args.run, args.file)
+        return
+
+    path = args.file
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as f:
+            json.dump(synthetic_company_facts(args.concepts, args.periods), f)
+    try:
+        size = os.path.getsize(path) / (1024 * 1024)
+        print(f"Document: {size:.1f} MB")
+        for mode in ("json", "stream"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--run", mode, "--file", path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{mode:<7} peak RSS {result['peak']:8.1f} MB "
+                f"(+{result['peak'] - result['baseline']:.1f} MB over the raw body), "
+                f"{result['seconds']:.2f}s, {result['concepts']} concepts kept"
+            )
+    finally:
+        if args.file is None:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Throughput benchmark for filing HTML to text conversion.
+
+Generates a synthetic 10-K shaped like EDGAR's inline XBRL documents (styled
+divs, financial tables, entities, a hidden XBRL header) and reports MB/s for
+the single-pass converter against the stdlib ``HTMLParser`` and the legacy
+``re.sub`` pair. Pass ``--file`` to measure a real downloaded filing instead.
+
+    python benchmarks/bench_html_text.py --size-mb 20
+"""
+
+import argparse
+import re
+import time
+from html.parser import HTMLParser
+
+from sec_edgar_langchain.html_text import HTMLTextConverter
+
+_STYLE = "font-family:Helvetica,sans-serif;font-size:10pt;font-weight:400;line-height:120%"
+
+_PARAGRAPH = (
+    f'<div style="margin-top:6pt"><span style="{_STYLE}">Our business, reputation, results of '
+    "operations, financial condition and stock price can be affected by a number of factors, "
+    "whether currently known or unknown, including those described below. When any one or more "
+    "of these risks materialize from time to time, the Company&#8217;s business &amp; results "
+    "can be materially adversely affected.</span></div>\n"
+)
+
+_ROW = (
+    f'<tr><td style="{_STYLE}"><div><span>Net sales</span></div></td><td></td>'
+    '<td style="padding:2px">$</td><td style="text-align:right">'
+    '<ix:nonFraction name="us-gaap:Revenues" contextRef="c-1" unitRef="usd" decimals="-6">'
+    "383,285</ix:nonFraction></td><td></td><td>$</td><td>394,328</td><td>(2.8</td><td>)%</td></tr>\n"
+)
+
+
+def synthetic_10k(size_mb: float) -> str:
+    """Build a synthetic 10-K of roughly ``size_mb`` megabytes."""
+    head = (
+        "<html><head><title>aapl-20230930</title><style>body{margin:0}</style></head><body>"
+        '<div style="display:none"><ix:header><ix:hidden>'
+        + '<ix:nonNumeric name="dei:AmendmentFlag">false</ix:nonNumeric>' * 200
+        + "</ix:hidden></ix:header></div>\n"
+    )
+    block = (
+        '<div><span style="font-weight:700">Item 1A. Risk Factors</span></div>\n'
+        + _PARAGRAPH * 20
+        + "<table>" + _ROW * 30 + "</table>\n"
+    )
+    count = max(1, int(size_mb * 1024 * 1024 / len(block)))
+    return head + block * count + "</body></html>"
+
+
+class _StdlibConverter(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def convert_single_pass(html: str, chunk_size: int) -> int:
+    converter = HTMLTextConverter()
+    size = 0
+    for i in range(0, len(html), chunk_size):
+        size += len(converter.feed(html[i:i + chunk_size]))
+    return size + len(converter.close())
+
+
+def convert_stdlib(html: str, chunk_size: int) -> int:
+    parser = _StdlibConverter()
+    for i in range(0, len(html), chunk_size):
+        parser.feed(html[i:i + chunk_size])
+    parser.close()
+    return len("".join(parser.parts))
+
+
+def convert_regex_pair(html: str, chunk_size: int) -> int:
+    text = re.sub("<[^<]+?>", "", html)
+    return len(re.sub(r"\s+", " ", text))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", help="Benchmark a filing on disk instead of synthetic HTML")
+    parser.add_argument("--size-mb", type=float, default=20.0, help="Synthetic document size")
+    parser.add_argument("--chunk-kb", type=int, default=64, help="Feed chunk size")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8", errors="replace") as f:
+            html = f.read()
+    else:
+        html = synthetic_10k(args.size_mb)
+    megabytes = len(html.encode("utf-8")) / (1024 * 1024)
+    chunk_size = args.chunk_kb * 1024
+
+    print(f"Document: {megabytes:.1f} MB, {args.chunk_kb} KB chunks, best of {args.repeat}")
+    for name, convert in (
+        ("single-pass converter", convert_single_pass),
+        ("html.parser", convert_stdlib),
+        ("re.sub pair (legacy)", convert_regex_pair),
+    ):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            chars = convert(html, chunk_size)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<24} {megabytes / best:8.1f} MB/s  {chars:>12,} chars")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""End-to-end benchmark of SECEdgarToolkit against a local fake EDGAR server.
+
+Each simulated agent runs the tool chain of a typical research step on one
+company (CIK lookup, company info, 10-K search, company facts, 8-K events,
+insider trading, an Item 1A read and a peer comparison). Scenarios:
+
+- ``cold``: one agent, fresh toolkit and empty response cache
+- ``warm-disk``: one agent, fresh toolkit over the cache the cold run filled
+- ``warm-memory``: the same toolkit again, so parsed objects are reused
+- ``concurrent``: ``--agents`` agents (threads, or coroutines with
+  ``--async``) sharing one toolkit with an empty cache
+
+Per-tool latency percentiles come from the toolkit's metrics listener hook;
+throughput, server-side 429s, retries, rate-limiter wait and peak traced
+memory are reported per scenario. ``--json`` writes the numbers for
+run-to-run comparison.
+
+    python benchmarks/bench_toolkit.py --agents 8 --latency 0.05
+    python benchmarks/bench_toolkit.py --throttle 10 --rate 20 --async
+    python benchmarks/bench_toolkit.py --fixtures recorded/ --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from fake_edgar import TICKERS_PATH, FakeEdgarServer, document_path, load_fixtures, synthetic_fixtures
+from sec_edgar_langchain import SECEdgarConfig, SECEdgarToolkit
+from sec_edgar_langchain.metrics import MetricEvent
+
+USER_AGENT = "BenchmarkApp/1.0 (bench@example.com)"
+
+
+def tool_chain(cik: str, ticker: str, peer: str, document_url: str) -> List[Tuple[str, str]]:
+    """(tool name, input) pairs of one agent research step."""
+    return [
+        ("sec_edgar_cik_lookup", ticker),
+        ("sec_edgar_company_info", cik),
+        ("sec_edgar_filing_search", json.dumps({"cik": cik, "form_type": "10-K"})),
+        ("sec_edgar_company_facts", cik),
+        ("sec_edgar_8k_events", cik),
+        ("sec_edgar_insider_trading", json.dumps({"cik": cik, "days_back": 90})),
+        ("sec_edgar_filing_content", json.dumps({"url": document_url, "section": "Item 1A", "length": 2000})),
+        ("sec_edgar_compare_financials", json.dumps({"ciks": [cik, peer]})),
+    ]
+
+
+def companies_from(fixtures: Dict[str, bytes]) -> List[Tuple[str, str]]:
+    """(CIK, ticker) of every company the fixtures hold submissions and facts for."""
+    tickers = json.loads(fixtures[TICKERS_PATH])
+    out = []
+    for entry in tickers.values():
+        cik = f"{int(entry['cik_str']):010d}"
+        if f"/submissions/CIK{cik}.json" in fixtures and f"/api/xbrl/companyfacts/CIK{cik}.json" in fixtures:
+            out.append((cik, entry["ticker"]))
+    return out
+
+
+class Recorder:
+    """Metrics listener collecting exact per-tool durations."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = {}
+        self.errors = 0
+
+    def __call__(self, event: MetricEvent) -> None:
+        if event.kind != "tool":
+            return
+        with self._lock:
+            self.durations.setdefault(event.name, []).append(event.duration)
+            self.errors += event.error
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Benchmark:
+    def __init__(self, server: FakeEdgarServer, args: argparse.Namespace):
+        self.server = server
+        self.args = args
+        self.companies = companies_from(server.fixtures)
+        if len(self.companies) < 2:
+            raise SystemExit("Fixtures must hold submissions and companyfacts for at least two companies")
+
+    def toolkit(self, cache_dir: str) -> SECEdgarToolkit:
+        config = SECEdgarConfig(
+            user_agent=USER_AGENT,
+            base_url=self.server.url(""),
+            tickers_url=self.server.url(TICKERS_PATH),
+            cache_dir=cache_dir,
+            max_requests_per_second=self.args.rate,
+            rate_limit_delay=1.0 / self.args.rate,
+            rate_limit_burst=max(1, int(self.args.rate)),
+            max_concurrency=self.args.agents,
+            pool_maxsize=max(10, self.args.agents),
+            stream_company_facts=self.args.stream,
+        )
+        return SECEdgarToolkit(config)
+
+    def chain(self, n: int) -> List[Tuple[str, str]]:
+        cik, ticker = self.companies[n % len(self.companies)]
+        peer, _ = self.companies[(n + 1) % len(self.companies)]
+        document = document_path(cik)
+        url = self.server.url(document) if document in self.server.fixtures else self.server.url("/missing.htm")
+        return tool_chain(cik, ticker, peer, url)
+
+    def run(self, name: str, toolkit: SECEdgarToolkit, agents: int, use_async: bool = False) -> Dict[str, Any]:
+        recorder = Recorder()
+        toolkit.metrics.add_listener(recorder)
+        tools = {tool.name: tool for tool in toolkit.get_tools()}
+        chains = [self.chain(n) for n in range(agents * self.args.iterations)]
+        self.server.reset_counters()
+        retries_before = toolkit.retry_policy.stats().retries
+        wait_before = toolkit.rate_limiter.stats().total_wait
+        if self.args.memory:
+            tracemalloc.start()
+
+        started = time.perf_counter()
+        if use_async:
+            asyncio.run(self._run_async(tools, chains, agents))
+        else:
+            def agent(steps: List[Tuple[str, str]]) -> None:
+                for tool_name, tool_input in steps:
+                    tools[tool_name].invoke(tool_input)
+
+            with ThreadPoolExecutor(max_workers=agents) as pool:
+                list(pool.map(agent, chains))
+        elapsed = time.perf_counter() - started
+
+        peak = None
+        if self.args.memory:
+            peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+        toolkit.metrics.remove_listener(recorder)
+        calls = sum(len(values) for values in recorder.durations.values())
+        return {
+            "scenario": name,
+            "agents": agents,
+            "seconds": elapsed,
+            "chains_per_second": len(chains) / elapsed,
+            "calls_per_second": calls / elapsed,
+            "tool_errors": recorder.errors,
+            "requests": sum(self.server.statuses.values()),
+            "throttled": self.server.statuses.get(429, 0),
+            "retries": toolkit.retry_policy.stats().retries - retries_before,
+            "limiter_wait": toolkit.rate_limiter.stats().total_wait - wait_before,
+            "megabytes_sent": self.server.bytes_sent / (1024 * 1024),
+            "peak_traced_mb": peak,
+            "tools": {
+                tool_name: {
+                    "p50": percentile(values, 0.5),
+                    "p95": percentile(values, 0.95),
+                    "max": max(values),
+                }
+                for tool_name, values in sorted(recorder.durations.items())
+            },
+        }
+
+    @staticmethod
+    async def _run_async(tools: Dict[str, Any], chains: List[List[Tuple[str, str]]], agents: int) -> None:
+        semaphore = asyncio.Semaphore(agents)
+
+        async def agent(steps: List[Tuple[str, str]]) -> None:
+            async with semaphore:
+                for tool_name, tool_input in steps:
+                    await tools[tool_name].ainvoke(tool_input)
+
+        await asyncio.gather(*(agent(steps) for steps in chains))
+
+    def scenarios(self) -> List[Dict[str, Any]]:
+        results = []
+        cache_dir = tempfile.mkdtemp(prefix="sec-edgar-bench-")
+        try:
+            with self.toolkit(cache_dir) as toolkit:
+                results.append(self.run("cold", toolkit, agents=1))
+            with self.toolkit(cache_dir) as toolkit:
+                results.append(self.run("warm-disk", toolkit, agents=1))
+                results.append(self.run("warm-memory", toolkit, agents=1))
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        cache_dir = tempfile.mkdtemp(prefix="sec-edgar-bench-")
+        try:
+            with self.toolkit(cache_dir) as toolkit:
+                results.append(self.run(
+                    "concurrent-async" if self.args.use_async else "concurrent",
+                    toolkit,
+                    agents=self.args.agents,
+                    use_async=self.args.use_async,
+                ))
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        return results
+
+
+def report(result: Dict[str, Any]) -> None:
+    memory = f", peak traced {result['peak_traced_mb']:.1f} MB" if result["peak_traced_mb"] is not None else ""
+    print(
+        f"\n{result['scenario']} ({result['agents']} agents): {result['seconds']:.2f}s, "
+        f"{result['chains_per_second']:.2f} chains/s, {result['calls_per_second']:.1f} calls/s{memory}"
+    )
+    print(
+        f"  server: {result['requests']} requests, {result['throttled']} x 429, "
+        f"{result['megabytes_sent']:.1f} MB sent; client: {result['retries']} retries, "
+        f"{result['limiter_wait']:.2f}s limiter wait, {result['tool_errors']} tool errors"
+    )
+    for name, stats in result["tools"].items():
+        print(
+            f"  {name:<30} p50 {stats['p50'] * 1000:8.1f} ms  "
+            f"p95 {stats['p95'] * 1000:8.1f} ms  max {stats['max'] * 1000:8.1f} ms"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", help="Directory of recorded responses mirroring the SEC URL paths")
+    parser.add_argument("--companies", type=int, default=10, help="Synthetic companies")
+    parser.add_argument("--filings", type=int, default=1000, help="Filings per synthetic company")
+    parser.add_argument("--concepts", type=int, default=500, help="XBRL concepts per synthetic company")
+    parser.add_argument("--document-mb", type=float, default=5.0, help="Synthetic 10-K size")
+    parser.add_argument("--agents", type=int, default=8, help="Concurrent agents")
+    parser.add_argument("--iterations", type=int, default=1, help="Tool chains per agent")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Run agents as coroutines")
+    parser.add_argument("--rate", type=float, default=10.0, help="Client rate limit in requests per second")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency per response in seconds")
+    parser.add_argument("--throttle", type=float, help="Server answers 429 above this many requests per second")
+    parser.add_argument("--inject-429", type=float, default=0.0, help="Share of requests answered 429")
+    parser.add_argument("--stream", action="store_true", help="Enable stream_company_facts")
+    parser.add_argument("--memory", action="store_true", help="Trace peak Python memory per scenario")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    if args.fixtures:
+        fixtures = load_fixtures(args.fixtures)
+    else:
+        fixtures = synthetic_fixtures(args.companies, args.filings, args.concepts, args.document_mb)
+    server = FakeEdgarServer(fixtures, latency=args.latency, throttle=args.throttle, inject_429=args.inject_429)
+    with server:
+        print(
+            f"Fake EDGAR at {server.url()}: {len(fixtures)} responses, "
+            f"{sum(len(body) for body in fixtures.values()) / (1024 * 1024):.1f} MB, "
+            f"latency {args.latency * 1000:.0f} ms, client rate {args.rate:g}/s"
+        )
+        results = Benchmark(server, args).scenarios()
+
+    for result in results:
+        report(result)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"arguments": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Local stand-in for data.sec.gov and www.sec.gov used by the benchmarks.
+
+Serves submissions, companyfacts, company_tickers.json and filing documents
+from memory, with optional per-request latency and 429 injection (either a
+server-side rate cap or a random share of responses). Fixtures are either
+generated (companies shaped like large filers, multi-MB 10-K HTML) or
+loaded from a directory of recorded responses laid out like the SEC URL
+paths, e.g. ``submissions/CIK0000320193.json`` or
+``files/company_tickers.json``.
+
+Run standalone to point other tools at it:
+
+    python benchmarks/fake_edgar.py --port 8765 --latency 0.05 --throttle 10
+    python benchmarks/fake_edgar.py --fixtures recorded/ --inject-429 0.05
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional
+
+from bench_company_facts_memory import synthetic_company_facts
+from bench_html_text import synthetic_10k
+
+TICKERS_PATH = "/files/company_tickers.json"
+
+# Form mix of the synthetic filing histories, repeated
+FORM_CYCLE = ["4", "4", "8-K", "10-Q", "4", "8-K", "4", "10-Q", "4", "4", "10-Q", "10-K", "4", "8-K"]
+
+CONTENT_TYPES = {".json": "application/json", ".htm": "text/html", ".html": "text/html", ".txt": "text/plain"}
+
+
+def company_cik(n: int) -> str:
+    return f"{9000000 + n:010d}"
+
+
+def synthetic_submissions(cik: str, n: int, filings: int) -> dict:
+    """A submissions payload with ``filings`` filings, newest first."""
+    columns: Dict[str, List[str]] = {
+        "form": [], "filingDate": [], "accessionNumber": [], "primaryDocument": [], "primaryDocDescription": [],
+    }
+    today = time.time()
+    for i in range(filings):
+        form = FORM_CYCLE[i % len(FORM_CYCLE)]
+        date = time.strftime("%Y-%m-%d", time.gmtime(today - i * 3 * 86400))
+        columns["form"].append(form)
+        columns["filingDate"].append(date)
+        columns["accessionNumber"].append(f"{cik}-{date[2:4]}-{i:06d}")
+        columns["primaryDocument"].append(f"doc{i}.htm" if form != "4" else "form4.xml")
+        columns["primaryDocDescription"].append(f"{form} filed {date}")
+    return {
+        "cik": str(int(cik)),
+        "name": f"Synthetic Company {n}",
+        "tickers": [f"SYN{n}"],
+        "exchanges": ["Nasdaq"],
+        "sic": "3571",
+        "sicDescription": "Electronic Computers",
+        "fiscalYearEnd": "0928",
+        "stateOfIncorporation": "CA",
+        "filings": {"recent": columns, "files": []},
+    }
+
+
+def synthetic_fixtures(companies: int, filings: int, concepts: int, document_mb: float) -> Dict[str, bytes]:
+    """Responses for ``companies`` synthetic filers, keyed by URL path.
+
+    Every company gets a submissions history, a companyfacts document of
+    ``concepts`` concepts and one 10-K document; the document body is
+    shared to keep the server's own footprint small.
+    """
+    fixtures: Dict[str, bytes] = {}
+    document = synthetic_10k(document_mb).encode()
+    tickers = {}
+    for n in range(companies):
+        cik = company_cik(n)
+        submissions = synthetic_submissions(cik, n, filings)
+        facts = synthetic_company_facts(concepts, 40)
+        facts.update(cik=int(cik), entityName=submissions["name"])
+        fixtures[f"/submissions/CIK{cik}.json"] = json.dumps(submissions).encode()
+        fixtures[f"/api/xbrl/companyfacts/CIK{cik}.json"] = json.dumps(facts).encode()
+        fixtures[document_path(cik)] = document
+        tickers[str(n)] = {"cik_str": int(cik), "ticker": f"SYN{n}", "title": submissions["name"]}
+    fixtures[TICKERS_PATH] = json.dumps(tickers).encode()
+    return fixtures
+
+
+def document_path(cik: str) -> str:
+    return f"/Archives/edgar/data/{int(cik)}/{cik}24000000/annual-report.htm"
+
+
+def load_fixtures(directory: str) -> Dict[str, bytes]:
+    """Recorded responses from a directory mirroring the SEC URL paths."""
+    fixtures = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            key = "/" + os.path.relpath(path, directory).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                fixtures[key] = f.read()
+    return fixtures
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server: FakeEdgarServer = self.server
+        path = self.path.split("?", 1)[0]
+        throttled = server.admit()
+        if server.latency:
+            time.sleep(server.latency)
+        if throttled:
+            self._send(429, b"", {"Retry-After": str(server.retry_after)})
+            return
+
+        body = server.fixtures.get(path)
+        if body is None:
+            self._send(404, b"")
+            return
+        etag = server.etag(path)
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", {"ETag": etag})
+            return
+        content_type = CONTENT_TYPES.get(os.path.splitext(path)[1], "application/octet-stream")
+        self._send(200, body, {"ETag": etag, "Content-Type": content_type})
+
+    def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+        self.server.record(status, len(body))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeEdgarServer(ThreadingHTTPServer):
+    """In-memory EDGAR stand-in with latency and 429 injection."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        fixtures: Dict[str, bytes],
+        latency: float = 0.0,
+        throttle: Optional[float] = None,
+        inject_429: float = 0.0,
+        retry_after: float = 1.0,
+        port: int = 0,
+        seed: int = 0,
+    ):
+        """Create the server; call :meth:`start` to serve in a background thread.
+
+        Args:
+            fixtures: Response bodies keyed by URL path
+            latency: Seconds added to every response
+            throttle: Requests per second above which requests get 429
+            inject_429: Share of requests answered 429 regardless of rate
+            retry_after: ``Retry-After`` seconds sent with 429 responses
+            port: Port to listen on (0 picks a free one)
+            seed: Seed of the random 429 injection
+        """
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.fixtures = fixtures
+        self.latency = latency
+        self.throttle = throttle
+        self.inject_429 = inject_429
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window: Deque[float] = deque()
+        self._etags: Dict[str, str] = {}
+        self.statuses: Dict[int, int] = {}
+        self.bytes_sent = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def url(self, path: str = "") -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def etag(self, path: str) -> str:
+        etag = self._etags.get(path)
+        if etag is None:
+            etag = self._etags[path] = '"' + hashlib.md5(self.fixtures[path]).hexdigest() + '"'
+        return etag
+
+    def admit(self) -> bool:
+        """Count a request; True when it must be answered with 429."""
+        with self._lock:
+            if self.inject_429 and self._random.random() < self.inject_429:
+                return True
+            if self.throttle is None:
+                return False
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= 1.0:
+                self._window.popleft()
+            if len(self._window) >= self.throttle:
+                return True
+            self._window.append(now)
+            return False
+
+    def record(self, status: int, size: int) -> None:
+        with self._lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes_sent += size
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.statuses = {}
+            self.bytes_sent = 0
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients closing pooled keep-alive connections are expected noise
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def start(self) -> "FakeEdgarServer":
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeEdgarServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", help="Directory of recorded responses mirroring the SEC URL paths")
+    parser.add_argument("--companies", type=int, default=20, help="Synthetic companies")
+    parser.add_argument("--filings", type=int, default=1000, help="Filings per synthetic company")
+    parser.add_argument("--concepts", type=int, default=500, help="XBRL concepts per synthetic company")
+    parser.add_argument("--document-mb", type=float, default=5.0, help="Synthetic 10-K size")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--throttle", type=float, help="Answer 429 above this many requests per second")
+    parser.add_argument("--inject-429", type=float, default=0.0, help="Share of requests answered 429")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        fixtures = load_fixtures(args.fixtures)
+    else:
+        fixtures = synthetic_fixtures(args.companies, args.filings, args.concepts, args.document_mb)
+    server = FakeEdgarServer(
+        fixtures, latency=args.latency, throttle=args.throttle, inject_429=args.inject_429, port=args.port
+    )
+    print(f"Serving {len(fixtures)} responses at {server.url()} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
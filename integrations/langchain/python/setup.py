@@ -14,5 +14,14 @@ setup(
         "requests>=2.28.0",
         "python-dateutil>=2.8.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.24.0"],
+        "stream": ["ijson>=3.1"],
+        "prometheus": ["prometheus-client>=0.17.0"],
+        "otel": ["opentelemetry-api>=1.20.0"],
+    },
+    entry_points={
+        "console_scripts": ["sec-edgar-warehouse = sec_edgar_langchain.warehouse:main"],
+    },
     python_requires=">=3.8",
 )
\ No newline at end of file
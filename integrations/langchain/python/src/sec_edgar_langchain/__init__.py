@@ -1,6 +1,89 @@
 """SEC EDGAR LangChain Toolkit for Python."""
 
 from .toolkit import SECEdgarToolkit, SECEdgarConfig
+from .backends import BackendChain, CacheBackend, EdgarBackend, FixtureBackend, HTTPBackend
+from .client import AsyncSECEdgarHTTPClient, SECEdgarHTTPClient
+from .cache import CachedResponse, ResponseCache, SQLiteResponseCache
+from .company_facts import CompanyFacts, ConceptSeries, Fact
+from .filing_text import FilingTextReader, extract_filing_text
+from .html_text import HTMLTextConverter, html_to_text
+from .metrics import (
+    LatencyStats,
+    MetricEvent,
+    Metrics,
+    MetricsSnapshot,
+    OpenTelemetryExporter,
+    PrometheusExporter,
+)
+from .parsed_cache import ParsedCacheStats, ParsedObjectCache
+from .cik_index import CompanyEntry, CompanyTickerIndex
+from .results import (
+    CompanyFactsResult,
+    CompanyInfo,
+    ConceptValues,
+    FactValue,
+    Filing,
+    FilingList,
+    PeerComparison,
+    PeerCompany,
+    ToolResult,
+)
+from .rate_limit import RateLimiterStats, TokenBucketRateLimiter, get_shared_rate_limiter
+from .retry import CircuitOpenError, RetryPolicy, RetryStats
+from .single_flight import SingleFlight, SingleFlightStats
+from .submissions import FilingIndex
+from .warehouse import IngestStats, Warehouse, ingest
 
 __version__ = "0.1.0"
-__all__ = ["SECEdgarToolkit", "SECEdgarConfig"]
\ No newline at end of file
+__all__ = [
+    "SECEdgarToolkit",
+    "SECEdgarConfig",
+    "EdgarBackend",
+    "BackendChain",
+    "HTTPBackend",
+    "CacheBackend",
+    "FixtureBackend",
+    "SECEdgarHTTPClient",
+    "AsyncSECEdgarHTTPClient",
+    "CachedResponse",
+    "ResponseCache",
+    "SQLiteResponseCache",
+    "CompanyFacts",
+    "ConceptSeries",
+    "Fact",
+    "FilingTextReader",
+    "extract_filing_text",
+    "HTMLTextConverter",
+    "html_to_text",
+    "Metrics",
+    "MetricEvent",
+    "MetricsSnapshot",
+    "LatencyStats",
+    "PrometheusExporter",
+    "OpenTelemetryExporter",
+    "ParsedObjectCache",
+    "ParsedCacheStats",
+    "CompanyEntry",
+    "CompanyTickerIndex",
+    "ToolResult",
+    "CompanyInfo",
+    "CompanyFactsResult",
+    "ConceptValues",
+    "FactValue",
+    "Filing",
+    "FilingList",
+    "PeerComparison",
+    "PeerCompany",
+    "RateLimiterStats",
+    "TokenBucketRateLimiter",
+    "get_shared_rate_limiter",
+    "RetryPolicy",
+    "RetryStats",
+    "CircuitOpenError",
+    "SingleFlight",
+    "SingleFlightStats",
+    "FilingIndex",
+    "IngestStats",
+    "Warehouse",
+    "ingest",
+]
\ No newline at end of file
@@ -0,0 +1,531 @@
+"""Data sources the SEC EDGAR toolkit reads from.
+
+Tools ask an :class:`EdgarBackend` for data by meaning (a company's
+submissions, its company facts, the ticker list, a filing document) rather
+than by ``data.sec.gov`` URL, so the same tools run against:
+
+- :class:`HTTPBackend`: the live SEC APIs (through the response cache)
+- :class:`CacheBackend`: whatever the on-disk response cache holds, offline
+- :class:`~sec_edgar_langchain.warehouse.Warehouse`: a local bulk-data warehouse
+- :class:`FixtureBackend`: canned in-memory payloads for tests and load tests
+
+A :class:`BackendChain` tries several in order, so hot reads are routed to
+the fastest backend that holds the data.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .cache import ResponseCache
+from .client import AsyncSECEdgarHTTPClient, SECEdgarHTTPClient
+from .company_facts import load_company_facts
+from .metrics import Metrics
+from .rate_limit import TokenBucketRateLimiter
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
+
+SEC_DATA_URL = "https://data.sec.gov"
+SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+DOCUMENT_CHUNK_SIZE = 64 * 1024
+
+DocumentStream = ContextManager[Iterator[str]]
+AsyncDocumentStream = AsyncContextManager[AsyncIterator[str]]
+
+
+class EdgarBackend(ABC):
+    """A source of SEC EDGAR data.
+
+    Every method returns None when the backend does not hold the requested
+    data, so a :class:`BackendChain` can fall through to the next source;
+    errors while fetching data the backend should have are raised.
+
+    The async methods default to running the sync ones in the event loop's
+    executor; backends doing network I/O override them.
+    """
+
+    @abstractmethod
+    def company_tickers(self) -> Optional[Dict[str, Any]]:
+        """The ``company_tickers.json`` mapping."""
+
+    @abstractmethod
+    def submissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        """Submissions payload of a zero-padded CIK."""
+
+    def submissions_page(self, name: str) -> Optional[Dict[str, Any]]:
+        """An overflow page listed in a submissions payload's ``filings.files``."""
+        return None
+
+    @abstractmethod
+    def company_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Companyfacts payload of a zero-padded CIK.
+
+        Args:
+            cik: Zero-padded CIK
+            concepts: Concepts the caller will read; backends may use this
+                to skip decoding the rest, or ignore it
+        """
+
+    def open_document(self, url: str) -> Optional[DocumentStream]:
+        """Context manager yielding a filing document as text chunks."""
+        return None
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def acompany_tickers(self) -> Optional[Dict[str, Any]]:
+        """Async variant of :meth:`company_tickers`."""
+        return await self._run(self.company_tickers)
+
+    async def asubmissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        """Async variant of :meth:`submissions`."""
+        return await self._run(self.submissions, cik)
+
+    async def asubmissions_page(self, name: str) -> Optional[Dict[str, Any]]:
+        """Async variant of :meth:`submissions_page`."""
+        return await self._run(self.submissions_page, name)
+
+    async def acompany_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of :meth:`company_facts`."""
+        return await self._run(self.company_facts, cik, concepts)
+
+    def aopen_document(self, url: str) -> Optional[AsyncDocumentStream]:
+        """Async variant of :meth:`open_document`."""
+        stream = self.open_document(url)
+        return None if stream is None else _async_chunks(stream)
+
+    async def aclose(self) -> None:
+        """Async variant of :meth:`close`."""
+        self.close()
+
+
+@asynccontextmanager
+async def _async_chunks(stream: DocumentStream) -> AsyncIterator[AsyncIterator[str]]:
+    with stream as chunks:
+        async def iterate() -> AsyncIterator[str]:
+            for chunk in chunks:
+                yield chunk
+
+        yield iterate()
+
+
+class BackendChain(EdgarBackend):
+    """Tries backends in order and returns the first answer.
+
+    Typical chains put local sources first, e.g. ``[warehouse, http]``:
+    anything the warehouse holds never reaches the network.
+    """
+
+    def __init__(self, backends: Sequence[EdgarBackend]):
+        """Create the chain.
+
+        Args:
+            backends: Backends to consult, fastest first
+        """
+        self.backends = list(backends)
+
+    def company_tickers(self) -> Optional[Dict[str, Any]]:
+        return self._first(lambda backend: backend.company_tickers())
+
+    def submissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        return self._first(lambda backend: backend.submissions(cik))
+
+    def submissions_page(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._first(lambda backend: backend.submissions_page(name))
+
+    def company_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self._first(lambda backend: backend.company_facts(cik, concepts))
+
+    def open_document(self, url: str) -> Optional[DocumentStream]:
+        return self._first(lambda backend: backend.open_document(url))
+
+    def _first(self, call: Any) -> Any:
+        for backend in self.backends:
+            result = call(backend)
+            if result is not None:
+                return result
+        return None
+
+    async def _afirst(self, call: Any) -> Any:
+        for backend in self.backends:
+            result = await call(backend)
+            if result is not None:
+                return result
+        return None
+
+    async def acompany_tickers(self) -> Optional[Dict[str, Any]]:
+        return await self._afirst(lambda backend: backend.acompany_tickers())
+
+    async def asubmissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        return await self._afirst(lambda backend: backend.asubmissions(cik))
+
+    async def asubmissions_page(self, name: str) -> Optional[Dict[str, Any]]:
+        return await self._afirst(lambda backend: backend.asubmissions_page(name))
+
+    async def acompany_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self._afirst(lambda backend: backend.acompany_facts(cik, concepts))
+
+    def aopen_document(self, url: str) -> Optional[AsyncDocumentStream]:
+        return self._first(lambda backend: backend.aopen_document(url))
+
+
+class _EdgarURLs:
+    """URL layout of the SEC JSON APIs."""
+
+    base_url: str
+    tickers_url: str
+
+    def submissions_url(self, cik: str) -> str:
+        return f"{self.base_url}/submissions/CIK{cik}.json"
+
+    def submissions_page_url(self, name: str) -> str:
+        return f"{self.base_url}/submissions/{name}"
+
+    def company_facts_url(self, cik: str) -> str:
+        return f"{self.base_url}/api/xbrl/companyfacts/CIK{cik}.json"
+
+
+class HTTPBackend(_EdgarURLs, EdgarBackend):
+    """Live SEC EDGAR APIs over pooled, rate-limited HTTP clients.
+
+    Requests go through the response cache when one is configured, and
+    identical concurrent JSON requests are coalesced into one fetch whose
+    parsed result every caller shares. The async httpx client is created on
+    first use.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        base_url: str = SEC_DATA_URL,
+        tickers_url: str = SEC_TICKERS_URL,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        stream_company_facts: bool = False,
+        single_flight: Optional[SingleFlight] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        """Initialize the backend.
+
+        Args:
+            user_agent: User agent string required by SEC EDGAR
+            base_url: Root of the JSON APIs (a local stand-in server in tests)
+            tickers_url: URL of ``company_tickers.json``
+            rate_limiter: Limiter every request must acquire a token from
+            cache: Response cache shared by the sync and async clients
+            cache_ttls: Freshness lifetime in seconds per URL fragment
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Block when the pool is exhausted
+            stream_company_facts: Decode companyfacts incrementally, keeping
+                only the requested concepts
+            single_flight: Coalescer for concurrent identical requests
+                (default: a new one per backend)
+            retry_policy: Retry policy shared by the sync and async clients
+                (default: send every request once)
+            timeout: Seconds to wait for a connection or for response data
+            metrics: Collector of request timing, sizes and cache results
+        """
+        self.base_url = base_url
+        self.tickers_url = tickers_url
+        self.stream_company_facts = stream_company_facts
+        self.single_flight = single_flight if single_flight is not None else SingleFlight()
+        self.retry_policy = retry_policy
+        self.client = SECEdgarHTTPClient(
+            user_agent=user_agent,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            headers={"Accept": "application/json"},
+            rate_limiter=rate_limiter,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            metrics=metrics,
+        )
+        self.aclient: Optional[AsyncSECEdgarHTTPClient] = None
+        self._async_options = {
+            "user_agent": user_agent,
+            "max_connections": pool_maxsize,
+            "headers": {"Accept": "application/json"},
+            "rate_limiter": rate_limiter,
+            "cache": cache,
+            "cache_ttls": cache_ttls,
+            "retry_policy": retry_policy,
+            "timeout": timeout,
+            "metrics": metrics,
+        }
+
+    def get_async_client(self) -> AsyncSECEdgarHTTPClient:
+        """Return the async HTTP client, creating it on first use."""
+        if self.aclient is None or self.aclient.closed:
+            self.aclient = AsyncSECEdgarHTTPClient(**self._async_options)
+        return self.aclient
+
+    def _get_json(self, url: str) -> Dict[str, Any]:
+        return self.single_flight.do(url, lambda: self.client.get_json(url))
+
+    async def _aget_json(self, url: str) -> Dict[str, Any]:
+        return await self.single_flight.ado(url, lambda: self.get_async_client().get_json(url))
+
+    @staticmethod
+    def _facts_key(url: str, concepts: Optional[Iterable[str]]) -> Any:
+        # Streamed payloads only hold the requested concepts
+        return (url, None if concepts is None else frozenset(concepts))
+
+    def company_tickers(self) -> Dict[str, Any]:
+        return self._get_json(self.tickers_url)
+
+    def submissions(self, cik: str) -> Dict[str, Any]:
+        return self._get_json(self.submissions_url(cik))
+
+    def submissions_page(self, name: str) -> Dict[str, Any]:
+        return self._get_json(self.submissions_page_url(name))
+
+    def company_facts(self, cik: str, concepts: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        url = self.company_facts_url(cik)
+        if not self.stream_company_facts:
+            return self._get_json(url)
+        concepts = None if concepts is None else list(concepts)
+        return self.single_flight.do(
+            self._facts_key(url, concepts),
+            lambda: load_company_facts(self.client.fetch(url), concepts),
+        )
+
+    def open_document(self, url: str) -> Optional[DocumentStream]:
+        if not url.startswith(("http://", "https://")):
+            return None
+        return self._stream_document(url)
+
+    @contextmanager
+    def _stream_document(self, url: str) -> Iterator[Iterator[str]]:
+        with self.client.get(url, stream=True) as response:
+            response.raise_for_status()
+            if response.encoding is None:
+                response.encoding = "utf-8"
+            yield response.iter_content(chunk_size=DOCUMENT_CHUNK_SIZE, decode_unicode=True)
+
+    async def acompany_tickers(self) -> Dict[str, Any]:
+        return await self._aget_json(self.tickers_url)
+
+    async def asubmissions(self, cik: str) -> Dict[str, Any]:
+        return await self._aget_json(self.submissions_url(cik))
+
+    async def asubmissions_page(self, name: str) -> Dict[str, Any]:
+        return await self._aget_json(self.submissions_page_url(name))
+
+    async def acompany_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        url = self.company_facts_url(cik)
+        if not self.stream_company_facts:
+            return await self._aget_json(url)
+        concepts = None if concepts is None else list(concepts)
+
+        async def fetch() -> Dict[str, Any]:
+            body = await self.get_async_client().fetch(url)
+            # Incremental decoding is CPU-bound; keep it off the event loop
+            return await self._run(load_company_facts, body, concepts)
+
+        return await self.single_flight.ado(self._facts_key(url, concepts), fetch)
+
+    def aopen_document(self, url: str) -> Optional[AsyncDocumentStream]:
+        if not url.startswith(("http://", "https://")):
+            return None
+        return self._astream_document(url)
+
+    @asynccontextmanager
+    async def _astream_document(self, url: str) -> AsyncIterator[AsyncIterator[str]]:
+        async with self.get_async_client().stream(url) as response:
+            response.raise_for_status()
+            yield response.aiter_text(DOCUMENT_CHUNK_SIZE)
+
+    def close(self) -> None:
+        self.client.close()
+
+    async def aclose(self) -> None:
+        if self.aclient is not None:
+            await self.aclient.aclose()
+            self.aclient = None
+        self.close()
+
+
+class CacheBackend(_EdgarURLs, EdgarBackend):
+    """Serves whatever the response cache holds, however old, without network.
+
+    Used for offline runs against a cache warmed by earlier online ones.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache,
+        base_url: str = SEC_DATA_URL,
+        tickers_url: str = SEC_TICKERS_URL,
+    ):
+        """Initialize the backend.
+
+        Args:
+            cache: Response cache written by an :class:`HTTPBackend`
+            base_url: Root of the JSON APIs the cache was filled from
+            tickers_url: URL of ``company_tickers.json`` the cache was filled from
+        """
+        self.cache = cache
+        self.base_url = base_url
+        self.tickers_url = tickers_url
+
+    def _get(self, url: str) -> Optional[Dict[str, Any]]:
+        cached = self.cache.get(url)
+        return None if cached is None else json.loads(cached.body)
+
+    def company_tickers(self) -> Optional[Dict[str, Any]]:
+        return self._get(self.tickers_url)
+
+    def submissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        return self._get(self.submissions_url(cik))
+
+    def submissions_page(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._get(self.submissions_page_url(name))
+
+    def company_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self._get(self.company_facts_url(cik))
+
+
+@contextmanager
+def _chunked(text: str) -> Iterator[Iterator[str]]:
+    yield (text[i:i + DOCUMENT_CHUNK_SIZE] for i in range(0, len(text), DOCUMENT_CHUNK_SIZE))
+
+
+def _cik_key(cik: Any) -> str:
+    return str(cik).lstrip("0").zfill(10)
+
+
+class FixtureBackend(EdgarBackend):
+    """Canned in-memory payloads, for deterministic tests and load tests.
+
+    An optional fixed ``latency`` is added to every call (``time.sleep`` in
+    the sync methods, ``asyncio.sleep`` in the async ones) to model network
+    round trips. Every call is recorded in :attr:`calls`.
+    """
+
+    def __init__(
+        self,
+        submissions: Optional[Dict[str, Dict[str, Any]]] = None,
+        company_facts: Optional[Dict[str, Dict[str, Any]]] = None,
+        tickers: Optional[Dict[str, Any]] = None,
+        submissions_pages: Optional[Dict[str, Dict[str, Any]]] = None,
+        documents: Optional[Dict[str, str]] = None,
+        latency: float = 0.0,
+    ):
+        """Create the fixture.
+
+        Args:
+            submissions: Submissions payloads keyed by CIK (padded or not)
+            company_facts: Companyfacts payloads keyed by CIK
+            tickers: ``company_tickers.json`` mapping
+            submissions_pages: Overflow pages keyed by file name
+            documents: Filing document HTML keyed by URL
+            latency: Seconds added to every call
+        """
+        self._submissions = {_cik_key(cik): data for cik, data in (submissions or {}).items()}
+        self._company_facts = {_cik_key(cik): data for cik, data in (company_facts or {}).items()}
+        self._tickers = tickers
+        self._pages = dict(submissions_pages or {})
+        self._documents = dict(documents or {})
+        self.latency = latency
+        self.calls: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def _record(self, kind: str, key: str) -> None:
+        with self._lock:
+            self.calls.append((kind, key))
+
+    def _lookup(self, kind: str, key: str) -> Any:
+        self._record(kind, key)
+        if kind == "tickers":
+            return self._tickers
+        if kind == "submissions":
+            return self._submissions.get(_cik_key(key))
+        if kind == "submissions_page":
+            return self._pages.get(key)
+        return self._company_facts.get(_cik_key(key))
+
+    def _call(self, kind: str, key: str = "") -> Any:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._lookup(kind, key)
+
+    async def _acall(self, kind: str, key: str = "") -> Any:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._lookup(kind, key)
+
+    def company_tickers(self) -> Optional[Dict[str, Any]]:
+        return self._call("tickers")
+
+    def submissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        return self._call("submissions", cik)
+
+    def submissions_page(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._call("submissions_page", name)
+
+    def company_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self._call("company_facts", cik)
+
+    def open_document(self, url: str) -> Optional[DocumentStream]:
+        if url not in self._documents:
+            return None
+        self._record("document", url)
+        return _chunked(self._documents[url])
+
+    async def acompany_tickers(self) -> Optional[Dict[str, Any]]:
+        return await self._acall("tickers")
+
+    async def asubmissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        return await self._acall("submissions", cik)
+
+    async def asubmissions_page(self, name: str) -> Optional[Dict[str, Any]]:
+        return await self._acall("submissions_page", name)
+
+    async def acompany_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self._acall("company_facts", cik)
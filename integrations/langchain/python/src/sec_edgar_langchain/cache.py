@@ -0,0 +1,190 @@
+"""Persistent HTTP response cache for SEC EDGAR JSON endpoints."""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+# Longest matching URL fragment wins. Submissions and companyfacts change at
+# most daily; archived filing indexes never change once published.
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "/submissions/": 6 * 3600.0,
+    "/api/xbrl/companyfacts/": 24 * 3600.0,
+    "/api/xbrl/companyconcept/": 24 * 3600.0,
+    "/files/company_tickers.json": 24 * 3600.0,
+    "/Archives/edgar/data/": 30 * 24 * 3600.0,
+}
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body plus its revalidation validators."""
+
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the response was fetched or last revalidated."""
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+def ttl_for(url: str, ttls: Dict[str, float], default: float = 0.0) -> float:
+    """Return the freshness lifetime configured for a URL."""
+    best = None
+    for fragment in ttls:
+        if fragment in url and (best is None or len(fragment) > len(best)):
+            best = fragment
+    return ttls[best] if best is not None else default
+
+
+class ResponseCache(ABC):
+    """Storage interface for cached responses, keyed by URL."""
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL, if any."""
+
+    @abstractmethod
+    def put(self, response: CachedResponse) -> None:
+        """Store or replace a response."""
+
+    @abstractmethod
+    def touch(self, url: str, fetched_at: float) -> None:
+        """Mark a cached response as revalidated at ``fetched_at``."""
+
+    @abstractmethod
+    def delete(self, url: str) -> None:
+        """Drop a cached response."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every cached response."""
+
+    def close(self) -> None:
+        """Release any resources held by the cache."""
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Size-bounded LRU cache stored in a single SQLite file.
+
+    Bodies are zlib-compressed. The database runs in WAL mode so several
+    worker processes can share one cache directory.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Upper bound on the compressed size of all bodies
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " fetched_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+        body, etag, last_modified, fetched_at = row
+        return CachedResponse(
+            url=url,
+            body=zlib.decompress(body),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def put(self, response: CachedResponse) -> None:
+        compressed = zlib.compress(response.body)
+        if len(compressed) > self.max_bytes:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (url, body, size, etag, last_modified, fetched_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    response.url,
+                    compressed,
+                    len(compressed),
+                    response.etag,
+                    response.last_modified,
+                    response.fetched_at,
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        victims = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((url,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", victims)
+
+    def touch(self, url: str, fetched_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (fetched_at, time.time(), url),
+            )
+
+    def delete(self, url: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def size(self) -> int:
+        """Total compressed size of all cached bodies, in bytes."""
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return total
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,131 @@
+"""In-memory index over SEC's company_tickers.json for CIK lookups."""
+
+import bisect
+import heapq
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a company name or query for matching.
+
+    Upper-cases, replaces punctuation with spaces and collapses whitespace,
+    so ``"Apple Inc."`` and ``"apple inc"`` compare equal.
+    """
+    return _NON_ALNUM.sub(" ", name.upper()).strip()
+
+
+@dataclass(frozen=True)
+class CompanyEntry:
+    """A single row of company_tickers.json."""
+
+    cik: str
+    name: str
+    ticker: str
+    rank: int
+
+
+class CompanyTickerIndex:
+    """Prebuilt lookup structures over the SEC ticker list.
+
+    - exact ticker and CIK hash maps (O(1))
+    - normalized names in a sorted array searched with bisect (O(log n))
+    - token inverted index for multi-word, out-of-order queries
+
+    ``rank`` is the entry's position in the SEC file, which is roughly
+    ordered by company size, and is used to break ties between matches.
+    """
+
+    def __init__(self, entries: Iterable[CompanyEntry]):
+        self._entries: List[CompanyEntry] = sorted(entries, key=lambda e: e.rank)
+        self._by_ticker: Dict[str, CompanyEntry] = {}
+        self._by_cik: Dict[str, CompanyEntry] = {}
+        self._tokens: Dict[str, Set[int]] = {}
+        self._normalized: List[str] = []
+        names: List[Tuple[str, int]] = []
+
+        for position, entry in enumerate(self._entries):
+            if entry.ticker:
+                self._by_ticker.setdefault(entry.ticker.upper(), entry)
+            self._by_cik.setdefault(entry.cik, entry)
+            normalized = normalize_name(entry.name)
+            self._normalized.append(normalized)
+            names.append((normalized, position))
+            for token in normalized.split():
+                self._tokens.setdefault(token, set()).add(position)
+
+        names.sort()
+        self._names = [name for name, _ in names]
+        self._name_positions = [position for _, position in names]
+
+    @classmethod
+    def from_company_tickers(cls, data: Dict[str, Any]) -> "CompanyTickerIndex":
+        """Build the index from the raw company_tickers.json payload."""
+        entries = []
+        for key, item in data.items():
+            try:
+                rank = int(key)
+            except (TypeError, ValueError):
+                rank = len(entries)
+            entries.append(CompanyEntry(
+                cik=str(item["cik_str"]).zfill(10),
+                name=item.get("title", ""),
+                ticker=item.get("ticker", ""),
+                rank=rank,
+            ))
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def by_ticker(self, ticker: str) -> Optional[CompanyEntry]:
+        """Exact ticker lookup."""
+        return self._by_ticker.get(ticker.strip().upper())
+
+    def by_cik(self, cik: str) -> Optional[CompanyEntry]:
+        """Exact CIK lookup; accepts padded or unpadded CIKs."""
+        return self._by_cik.get(cik.strip().lstrip("0").zfill(10))
+
+    def _prefix_positions(self, prefix: str) -> List[int]:
+        start = bisect.bisect_left(self._names, prefix)
+        end = bisect.bisect_left(self._names, prefix + "\uffff", lo=start)
+        return self._name_positions[start:end]
+
+    def search(self, query: str, limit: int = 10) -> List[CompanyEntry]:
+        """Find the best matching companies for a ticker or name query.
+
+        Matches are tried in order of precision: exact ticker, exact name,
+        name prefix, all query tokens present in the name, and finally a
+        substring scan of the names. The first stage that yields results
+        wins and its results are ranked by size.
+        """
+        ticker_match = self.by_ticker(query)
+        if ticker_match is not None:
+            return [ticker_match]
+
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        positions = self._prefix_positions(normalized)
+        if not positions:
+            tokens = normalized.split()
+            postings = [self._tokens.get(token) for token in tokens]
+            if all(postings):
+                positions = sorted(set.intersection(*postings))
+        if not positions:
+            positions = [
+                p for p, name in enumerate(self._normalized) if normalized in name
+            ]
+
+        exact = [p for p in positions if self._normalized[p] == normalized]
+        ranked = heapq.nsmallest(limit, exact or positions)
+        return [self._entries[p] for p in ranked]
+
+    def lookup(self, query: str) -> Optional[CompanyEntry]:
+        """Return the single best match for a ticker or name query."""
+        matches = self.search(query, limit=1)
+        return matches[0] if matches else None
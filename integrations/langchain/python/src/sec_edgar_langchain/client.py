@@ -0,0 +1,457 @@
+"""Shared HTTP clients for SEC EDGAR requests."""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import DEFAULT_CACHE_TTLS, CachedResponse, ResponseCache, ttl_for
+from .metrics import Metrics
+from .rate_limit import TokenBucketRateLimiter
+from .retry import RetryPolicy
+
+
+def _default_headers(user_agent: str, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    merged = {
+        "User-Agent": user_agent,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+    if headers:
+        merged.update(headers)
+    return merged
+
+
+def _conditional_headers(cached: Optional[CachedResponse]) -> Dict[str, str]:
+    """Validators for revalidating a stale cache entry."""
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+# Sent when a 304 arrives with nothing cached to reuse, e.g. from a proxy
+_REFETCH_HEADERS = {"Cache-Control": "no-cache"}
+
+
+def _retry_delay(
+    policy: Optional[RetryPolicy], url: str, attempt: int, response: Any = None
+) -> Optional[float]:
+    """Seconds to wait before retrying, or None when the outcome is final."""
+    if policy is None:
+        return None
+    if response is None:
+        return policy.next_delay(url, attempt)
+    return policy.next_delay(url, attempt, response.status_code, response.headers.get("Retry-After"))
+
+
+def _observe(
+    metrics: Optional[Metrics],
+    url: str,
+    started: float,
+    wait: float,
+    attempt: int,
+    response: Any = None,
+    size: Optional[int] = None,
+) -> None:
+    """Record one attempt; ``size`` defaults to the length of the read body."""
+    if metrics is None:
+        return
+    duration = time.perf_counter() - started
+    if size is None:
+        size = len(response.content) if response is not None else 0
+    metrics.observe_request(
+        url,
+        duration=duration,
+        status=response.status_code if response is not None else None,
+        size=size,
+        limiter_wait=wait,
+        attempt=attempt,
+    )
+
+
+def _observe_stream(
+    metrics: Optional[Metrics], url: str, started: float, wait: float, attempt: int, response: requests.Response
+) -> None:
+    """Record a streamed attempt when it is closed, sized by the body bytes read.
+    
+    ``Content-Length`` is missing for chunked responses and is the
+    compressed size for gzip ones, so the decoded chunks are counted instead.
+    """
+    if metrics is None:
+        return
+    read = 0
+    stream = response.raw.stream
+    close = response.close
+    
+    def counting(*args: Any, **kwargs: Any) -> Iterator[bytes]:
+        nonlocal read
+        for chunk in stream(*args, **kwargs):
+            read += len(chunk)
+            yield chunk
+    
+    def closing() -> None:
+        close()
+        if response.close is closing:
+            response.close = close
+            _observe(metrics, url, started, wait, attempt, response, read)
+    
+    response.raw.stream = counting
+    response.close = closing
+
+
+def _observe_async_stream(
+    metrics: Optional[Metrics], url: str, started: float, wait: float, attempt: int, response: Any
+) -> None:
+    """Async variant of :func:`_observe_stream` for ``httpx`` responses."""
+    if metrics is None:
+        return
+    read = 0
+    aiter_bytes = response.aiter_bytes
+    aclose = response.aclose
+    
+    async def counting(*args: Any, **kwargs: Any) -> AsyncIterator[bytes]:
+        nonlocal read
+        async for chunk in aiter_bytes(*args, **kwargs):
+            read += len(chunk)
+            yield chunk
+    
+    async def closing() -> None:
+        await aclose()
+        if response.aclose is closing:
+            response.aclose = aclose
+            _observe(metrics, url, started, wait, attempt, response, read)
+    
+    response.aiter_bytes = counting
+    response.aclose = closing
+
+
+class SECEdgarHTTPClient:
+    """Pooled, keep-alive HTTP client shared by all SEC EDGAR tools.
+
+    A single ``requests.Session`` is kept per toolkit so TCP and TLS
+    connections to ``data.sec.gov`` and ``www.sec.gov`` are reused across
+    tool invocations instead of being re-established on every call.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        """Initialize the HTTP client.
+
+        Args:
+            user_agent: User agent string required by SEC EDGAR
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Block when the pool is exhausted instead of opening
+                extra, non-pooled connections
+            headers: Additional default headers sent with every request
+            rate_limiter: Limiter every request must acquire a token from
+            cache: Response cache consulted by ``fetch`` and ``get_json``
+            cache_ttls: Freshness lifetime in seconds per URL fragment
+            retry_policy: Retries transient failures (429, 5xx, connection
+                errors); without one every request is sent once
+            timeout: Seconds to wait for a connection or for response data;
+                None waits indefinitely
+            metrics: Collector of per-attempt timing, sizes and cache results
+        """
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.cache_ttls = DEFAULT_CACHE_TTLS if cache_ttls is None else cache_ttls
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.metrics = metrics
+        self.session = requests.Session()
+        self.session.headers.update(_default_headers(user_agent, headers))
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client has been closed."""
+        return self._closed
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Issue a GET request over the pooled session.
+        
+        Transient failures are retried as the retry policy allows, each
+        attempt taking its own rate-limiter token. The last response is
+        returned whatever its status.
+        """
+        if self._closed:
+            raise RuntimeError("SEC EDGAR HTTP client is closed")
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            if self.retry_policy is not None:
+                self.retry_policy.check(url)
+            wait = self.rate_limiter.acquire() if self.rate_limiter is not None else 0.0
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                _observe(self.metrics, url, started, wait, attempt)
+                delay = _retry_delay(self.retry_policy, url, attempt)
+                if delay is None:
+                    raise
+            else:
+                if kwargs.get("stream", False):
+                    _observe_stream(self.metrics, url, started, wait, attempt, response)
+                else:
+                    _observe(self.metrics, url, started, wait, attempt, response)
+                delay = _retry_delay(self.retry_policy, url, attempt, response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def fetch(self, url: str) -> bytes:
+        """Return the body of a URL, going through the response cache.
+
+        Fresh cache entries are served without touching the network. Stale
+        entries are revalidated with a conditional GET (``If-None-Match`` /
+        ``If-Modified-Since``) and a ``304 Not Modified`` only refreshes
+        their timestamp. A 304 with no cached entry is requested again
+        unconditionally rather than cached as an empty body.
+        """
+        if self.cache is None:
+            response = self.get(url)
+            response.raise_for_status()
+            return response.content
+
+        cached = self.cache.get(url)
+        now = time.time()
+        if cached is not None and cached.age(now) < ttl_for(url, self.cache_ttls):
+            self._observe_cache(url, "hit")
+            return cached.body
+
+        response = self.get(url, headers=_conditional_headers(cached))
+        if response.status_code == 304:
+            if cached is not None:
+                self.cache.touch(url, now)
+                self._observe_cache(url, "revalidated")
+                return cached.body
+            response.close()
+            response = self.get(url, headers=_REFETCH_HEADERS)
+            if response.status_code == 304:
+                raise requests.HTTPError(f"304 Not Modified with nothing cached for url: {url}", response=response)
+        self._observe_cache(url, "miss")
+        response.raise_for_status()
+
+        self.cache.put(CachedResponse(
+            url=url,
+            body=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=now,
+        ))
+        return response.content
+
+    def get_json(self, url: str) -> Any:
+        """Fetch a URL through the cache and decode the JSON body."""
+        return json.loads(self.fetch(url))
+
+    def _observe_cache(self, url: str, result: str) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_cache(url, result)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if not self._closed:
+            self.session.close()
+            self._closed = True
+
+    def __enter__(self) -> "SECEdgarHTTPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncSECEdgarHTTPClient:
+    """Asyncio counterpart of :class:`SECEdgarHTTPClient` built on httpx.
+
+    Shares the rate limiter and response cache with the sync client. Cache
+    reads and writes run in the default executor so SQLite I/O never blocks
+    the event loop.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        max_connections: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        """Initialize the async HTTP client.
+
+        Args:
+            user_agent: User agent string required by SEC EDGAR
+            max_connections: Maximum number of pooled keep-alive connections
+            headers: Additional default headers sent with every request
+            rate_limiter: Limiter every request must acquire a token from
+            cache: Response cache consulted by ``fetch`` and ``get_json``
+            cache_ttls: Freshness lifetime in seconds per URL fragment
+            retry_policy: Retries transient failures (429, 5xx, connection
+                errors); without one every request is sent once
+            timeout: Seconds to wait for a connection or for response data;
+                None waits indefinitely
+            metrics: Collector of per-attempt timing, sizes and cache results
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "Async SEC EDGAR tools require httpx. "
+                "Install it with: pip install 'sec-edgar-langchain[async]'"
+            ) from e
+
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.cache_ttls = DEFAULT_CACHE_TTLS if cache_ttls is None else cache_ttls
+        self.retry_policy = retry_policy
+        self.metrics = metrics
+        self._transport_errors = (httpx.TransportError,)
+        self.client = httpx.AsyncClient(
+            headers=_default_headers(user_agent, headers),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout,
+        )
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client has been closed."""
+        return self.client.is_closed
+
+    async def _send(self, url: str, stream: bool = False, **kwargs: Any) -> Any:
+        if self.closed:
+            raise RuntimeError("SEC EDGAR HTTP client is closed")
+        attempt = 0
+        while True:
+            if self.retry_policy is not None:
+                self.retry_policy.check(url)
+            wait = await self.rate_limiter.acquire_async() if self.rate_limiter is not None else 0.0
+            request = self.client.build_request("GET", url, **kwargs)
+            started = time.perf_counter()
+            try:
+                response = await self.client.send(request, stream=stream)
+            except self._transport_errors:
+                _observe(self.metrics, url, started, wait, attempt)
+                delay = _retry_delay(self.retry_policy, url, attempt)
+                if delay is None:
+                    raise
+            else:
+                if stream:
+                    _observe_async_stream(self.metrics, url, started, wait, attempt, response)
+                else:
+                    _observe(self.metrics, url, started, wait, attempt, response)
+                delay = _retry_delay(self.retry_policy, url, attempt, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        """Issue a GET request over the pooled async client, retrying like the sync client."""
+        return await self._send(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, url: str, **kwargs: Any) -> AsyncIterator[Any]:
+        """Open a streaming GET; the body is read lazily by the caller.
+        
+        Retries happen before the body is handed out, on the status line alone.
+        """
+        response = await self._send(url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def _run_in_executor(self, func: Any, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def fetch(self, url: str) -> bytes:
+        """Return the body of a URL, going through the response cache."""
+        if self.cache is None:
+            response = await self.get(url)
+            response.raise_for_status()
+            return response.content
+
+        cached = await self._run_in_executor(self.cache.get, url)
+        now = time.time()
+        if cached is not None and cached.age(now) < ttl_for(url, self.cache_ttls):
+            self._observe_cache(url, "hit")
+            return cached.body
+
+        response = await self.get(url, headers=_conditional_headers(cached))
+        if response.status_code == 304:
+            if cached is not None:
+                await self._run_in_executor(self.cache.touch, url, now)
+                self._observe_cache(url, "revalidated")
+                return cached.body
+            # httpx's raise_for_status rejects a second 304
+            response = await self.get(url, headers=_REFETCH_HEADERS)
+        self._observe_cache(url, "miss")
+        response.raise_for_status()
+
+        await self._run_in_executor(self.cache.put, CachedResponse(
+            url=url,
+            body=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=now,
+        ))
+        return response.content
+
+    async def get_json(self, url: str) -> Any:
+        """Fetch a URL through the cache and decode the JSON body."""
+        return json.loads(await self.fetch(url))
+
+    def _observe_cache(self, url: str, result: str) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_cache(url, result)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncSECEdgarHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
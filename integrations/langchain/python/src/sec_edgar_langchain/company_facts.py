@@ -0,0 +1,382 @@
+"""Concept-indexed, columnar store over XBRL companyfacts payloads."""
+
+import bisect
+import io
+import json
+from array import array
+from dataclasses import dataclass
+from typing import IO, Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Taxonomies searched, in order, when a concept is given without a prefix
+DEFAULT_TAXONOMIES = ("us-gaap", "ifrs-full", "dei", "srt")
+# Units preferred when a concept reports more than one
+PREFERRED_UNITS = ("USD", "USD/shares", "shares", "pure")
+# Payload key listing the concepts a filtered companyfacts document was cut down to
+SELECTED_CONCEPTS = "selectedConcepts"
+
+
+@dataclass(frozen=True)
+class Fact:
+    """A single reported value of an XBRL concept."""
+
+    concept: str
+    unit: str
+    value: float
+    end: str
+    start: Optional[str]
+    form: str
+    fy: Optional[int]
+    fp: str
+    accession: str
+    filed: str
+
+
+class ConceptSeries:
+    """All periods reported for one concept in one unit, as parallel columns.
+
+    companyfacts repeats a period in every filing that presents it (a
+    10-K also carries two prior years as comparatives). Rows are
+    deduplicated on ``(start, end)``: the value, form and accession come
+    from the latest filing (so restatements win), while ``fy`` / ``fp``
+    come from the first filing, whose fiscal period labels the period
+    itself. Rows are sorted by end date and, for equal end dates, longest
+    duration last, so ``latest()`` is a constant-time read and date or
+    fiscal-period selections are bisects over sorted columns.
+    """
+
+    __slots__ = (
+        "taxonomy", "concept", "unit", "label",
+        "end", "start", "value", "form", "fy", "fp", "accession", "filed",
+        "_fiscal_keys", "_fiscal_rows",
+    )
+
+    def __init__(self, taxonomy: str, concept: str, unit: str, label: str, rows: List[Dict[str, Any]]):
+        self.taxonomy = taxonomy
+        self.concept = concept
+        self.unit = unit
+        self.label = label
+
+        periods: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for row in rows:
+            if "end" not in row or "val" not in row:
+                continue
+            periods.setdefault((row.get("start", ""), row["end"]), []).append(row)
+
+        # End ascending; for one end date, earlier start (longer duration) last
+        keys = sorted(periods, key=lambda key: key[0], reverse=True)
+        keys.sort(key=lambda key: key[1])
+
+        self.end: List[str] = []
+        self.start: List[str] = []
+        self.value = array("d")
+        self.form: List[str] = []
+        self.fy = array("i")
+        self.fp: List[str] = []
+        self.accession: List[str] = []
+        self.filed: List[str] = []
+        for start, end in keys:
+            reports = periods[(start, end)]
+            first = min(reports, key=lambda row: row.get("filed", ""))
+            last = max(reports, key=lambda row: row.get("filed", ""))
+            self.end.append(end)
+            self.start.append(start)
+            self.value.append(float(last["val"]))
+            self.form.append(last.get("form", ""))
+            self.fy.append(first.get("fy") or 0)
+            self.fp.append(first.get("fp") or "")
+            self.accession.append(last.get("accn", ""))
+            self.filed.append(last.get("filed", ""))
+
+        self._fiscal_keys: Optional[List[Tuple[int, str]]] = None
+        self._fiscal_rows: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.end)
+
+    def __iter__(self) -> Iterator[Fact]:
+        return (self.fact(i) for i in range(len(self)))
+
+    @property
+    def name(self) -> str:
+        """The concept as ``taxonomy:Concept``."""
+        return f"{self.taxonomy}:{self.concept}"
+
+    def fact(self, i: int) -> Fact:
+        """The row at position ``i`` as a :class:`Fact`."""
+        value = self.value[i]
+        return Fact(
+            concept=self.name,
+            unit=self.unit,
+            value=int(value) if value.is_integer() and self.unit != "USD/shares" else value,
+            end=self.end[i],
+            start=self.start[i] or None,
+            form=self.form[i],
+            fy=self.fy[i] or None,
+            fp=self.fp[i],
+            accession=self.accession[i],
+            filed=self.filed[i],
+        )
+
+    def latest(self) -> Optional[Fact]:
+        """The most recent period.
+
+        When several periods share the latest end date (a quarter and the
+        year-to-date figure reported alongside it), the most recently filed
+        one wins, so a restatement beats the original report; periods filed
+        on the same day fall back to the longest duration.
+        """
+        if not len(self):
+            return None
+        last = len(self) - 1
+        best = last
+        i = last - 1
+        while i >= 0 and self.end[i] == self.end[last]:
+            if self.filed[i] > self.filed[best]:
+                best = i
+            i -= 1
+        return self.fact(best)
+
+    def between(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Fact]:
+        """Periods ending within ``date_from``..``date_to`` (inclusive), oldest first."""
+        lo = bisect.bisect_left(self.end, date_from) if date_from else 0
+        hi = bisect.bisect_right(self.end, date_to) if date_to else len(self)
+        return [self.fact(i) for i in range(lo, hi)]
+
+    def trailing_years(self, years: int, fp: Optional[str] = None) -> List[Fact]:
+        """Periods ending within ``years`` years of the latest one, oldest first.
+
+        Args:
+            years: Window length, counted back from the latest end date
+            fp: Only keep periods of this fiscal period ('FY', 'Q1', ...)
+        """
+        if not len(self):
+            return []
+        last = self.end[-1]
+        cutoff = f"{int(last[:4]) - years:04d}{last[4:]}"
+        lo = bisect.bisect_right(self.end, cutoff)
+        if fp is None:
+            return [self.fact(i) for i in range(lo, len(self))]
+        fp = fp.upper()
+        return [self.fact(i) for i in range(lo, len(self)) if self.fp[i] == fp]
+
+    def by_fiscal_period(self, fy: int, fp: Optional[str] = None) -> List[Fact]:
+        """Periods labelled with fiscal year ``fy`` (and period ``fp``), oldest first.
+
+        A 10-Q tags both the quarter and the year-to-date span with the same
+        fiscal period; both are returned, longest duration last.
+        """
+        if self._fiscal_keys is None:
+            order = sorted(range(len(self)), key=lambda i: (self.fy[i], self.fp[i], self.end[i], i))
+            self._fiscal_keys = [(self.fy[i], self.fp[i]) for i in order]
+            self._fiscal_rows = array("l", order)
+
+        if fp is None:
+            lo = bisect.bisect_left(self._fiscal_keys, (fy, ""))
+            hi = bisect.bisect_left(self._fiscal_keys, (fy + 1, ""))
+        else:
+            key = (fy, fp.upper())
+            lo = bisect.bisect_left(self._fiscal_keys, key)
+            hi = bisect.bisect_right(self._fiscal_keys, key)
+        return [self.fact(i) for i in self._fiscal_rows[lo:hi]]
+
+
+class CompanyFacts:
+    """Per-concept columnar store over a companyfacts payload.
+
+    Concepts are converted to :class:`ConceptSeries` on first use and kept,
+    so repeated queries never rescan the raw JSON. Any taxonomy in the
+    payload (us-gaap, ifrs-full, dei, srt, ...) is available.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        """Wrap a raw companyfacts JSON payload.
+
+        Args:
+            data: Decoded ``/api/xbrl/companyfacts/CIK##########.json``
+        """
+        self.cik = str(data.get("cik", "")).zfill(10) if data.get("cik") is not None else ""
+        self.entity_name = data.get("entityName", "")
+        self._facts: Dict[str, Dict[str, Any]] = data.get("facts", {})
+        selected = data.get(SELECTED_CONCEPTS)
+        #: Concepts a filtered payload was cut down to; None when it is complete
+        self.selected_concepts: Optional[FrozenSet[str]] = None if selected is None else frozenset(selected)
+        self._series: Dict[Tuple[str, str, str], ConceptSeries] = {}
+
+    @property
+    def taxonomies(self) -> List[str]:
+        """Taxonomies present in the payload."""
+        return list(self._facts)
+
+    def concepts(self, taxonomy: Optional[str] = None) -> List[str]:
+        """Available concepts as ``taxonomy:Concept``, optionally for one taxonomy."""
+        taxonomies = [taxonomy] if taxonomy else list(self._facts)
+        return [
+            f"{name}:{concept}"
+            for name in taxonomies
+            for concept in self._facts.get(name, {})
+        ]
+
+    def _resolve(self, concept: str) -> Optional[Tuple[str, str]]:
+        if ":" in concept:
+            taxonomy, name = concept.split(":", 1)
+            return (taxonomy, name) if name in self._facts.get(taxonomy, {}) else None
+        for taxonomy in DEFAULT_TAXONOMIES:
+            if concept in self._facts.get(taxonomy, {}):
+                return taxonomy, concept
+        return None
+
+    def units(self, concept: str) -> List[str]:
+        """Units a concept is reported in."""
+        resolved = self._resolve(concept)
+        if resolved is None:
+            return []
+        taxonomy, name = resolved
+        return list(self._facts[taxonomy][name].get("units", {}))
+
+    def series(self, concept: str, unit: Optional[str] = None) -> Optional[ConceptSeries]:
+        """Columns for a concept ('Revenues', 'us-gaap:Revenues', 'dei:...').
+
+        Args:
+            concept: Concept name, optionally prefixed with its taxonomy;
+                without a prefix us-gaap, ifrs-full, dei and srt are tried
+            unit: Unit to use; defaults to USD, USD/shares, shares, pure or
+                else the first unit reported
+        """
+        resolved = self._resolve(concept)
+        if resolved is None:
+            return None
+        taxonomy, name = resolved
+        entry = self._facts[taxonomy][name]
+        units = entry.get("units", {})
+        if unit is None:
+            unit = next((u for u in PREFERRED_UNITS if u in units), next(iter(units), None))
+        if unit not in units:
+            return None
+
+        key = (taxonomy, name, unit)
+        series = self._series.get(key)
+        if series is None:
+            series = ConceptSeries(taxonomy, name, unit, entry.get("label") or name, units[unit])
+            self._series[key] = series
+        return series
+
+    def latest(self, concept: str, unit: Optional[str] = None) -> Optional[Fact]:
+        """Most recent value of a concept, or None when it is not reported."""
+        series = self.series(concept, unit)
+        return series.latest() if series is not None else None
+
+
+def _wanted_concepts(concepts: Iterable[str]) -> Tuple[Dict[str, set], set]:
+    """Split 'taxonomy:Concept' / bare concept names into lookup sets."""
+    qualified: Dict[str, set] = {}
+    bare = set()
+    for concept in concepts:
+        if ":" in concept:
+            taxonomy, name = concept.split(":", 1)
+            qualified.setdefault(taxonomy, set()).add(name)
+        else:
+            bare.add(concept)
+    return qualified, bare
+
+
+def mark_selected(data: Dict[str, Any], concepts: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Record on a filtered payload which concepts it was cut down to.
+
+    :class:`CompanyFacts` exposes the list as ``selected_concepts``, so
+    callers caching parsed stores know whether other concepts are missing
+    or simply absent from the filing.
+    """
+    data[SELECTED_CONCEPTS] = sorted(concepts or ())
+    return data
+
+
+def load_company_facts(
+    source: Union[bytes, IO[bytes]],
+    concepts: Optional[Iterable[str]] = None,
+    taxonomies: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """Decode a companyfacts document, keeping only the requested concepts.
+
+    With the optional ``ijson`` dependency (``pip install
+    'sec-edgar-langchain[stream]'``) the document is parsed incrementally
+    and only the selected concepts are ever built as Python objects, so
+    peak memory is bounded by the largest kept concept instead of the
+    whole payload (hundreds of MB for large banks). Without ijson the
+    document is decoded with :mod:`json` and filtered afterwards.
+
+    Args:
+        source: Raw JSON bytes or a binary file object
+        concepts: Concepts to keep ('us-gaap:Revenues', or 'Revenues' for
+            any taxonomy); None keeps every concept of ``taxonomies``
+        taxonomies: Taxonomies whose concepts are all kept; None with
+            ``concepts`` unset keeps everything
+
+    Returns:
+        A payload shaped like the original (``cik``, ``entityName`` and a
+        ``facts`` mapping), suitable for :class:`CompanyFacts`. Unless
+        everything was kept, it also lists ``concepts`` under
+        :data:`SELECTED_CONCEPTS`
+    """
+    qualified, bare = _wanted_concepts(concepts or ())
+    whole = set(taxonomies or ())
+    keep_all = concepts is None and taxonomies is None
+
+    def wanted(taxonomy: str, concept: str) -> bool:
+        return (
+            keep_all
+            or taxonomy in whole
+            or concept in bare
+            or concept in qualified.get(taxonomy, ())
+        )
+
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    if ijson is None or keep_all:
+        data = json.loads(source if isinstance(source, bytes) else source.read())
+        facts = data.get("facts", {})
+        data["facts"] = {
+            taxonomy: {name: entry for name, entry in entries.items() if wanted(taxonomy, name)}
+            for taxonomy, entries in facts.items()
+        }
+        return data if keep_all else mark_selected(data, concepts)
+
+    # One event-driven pass collects every wanted concept, whichever
+    # taxonomy it lives in
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    return mark_selected(_select_concepts(ijson, stream, wanted), concepts)
+
+
+def _select_concepts(ijson: Any, stream: IO[bytes], wanted: Any) -> Dict[str, Any]:
+    """Build only the wanted concepts from a single pass of parser events."""
+    result: Dict[str, Any] = {"facts": {}}
+    builder = None
+    target: Optional[Tuple[str, str]] = None
+    depth = 0
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event == "start_map" or event == "start_array":
+                depth += 1
+            elif event == "end_map" or event == "end_array":
+                depth -= 1
+                if depth == 0:
+                    taxonomy, concept = target
+                    result["facts"].setdefault(taxonomy, {})[concept] = builder.value
+                    builder = None
+            continue
+
+        if event == "map_key" and prefix.startswith("facts.") and prefix.count(".") == 1:
+            # A concept key directly under a taxonomy
+            taxonomy = prefix[6:]
+            if wanted(taxonomy, value):
+                target = (taxonomy, value)
+                builder = ijson.ObjectBuilder()
+                depth = 0
+        elif prefix == "cik" or prefix == "entityName":
+            result[prefix] = value
+
+    return result
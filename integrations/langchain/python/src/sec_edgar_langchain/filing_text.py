@@ -0,0 +1,191 @@
+"""Streaming, section-aware text extraction for SEC filing documents."""
+
+import re
+from typing import Iterable, List, Optional
+
+from .html_text import HTMLTextConverter
+
+_WHITESPACE = re.compile(r"\s+")
+_ITEM_HEADING = re.compile(r"^item\s+(\d{1,2}[a-d]?)(?=[\s.:\-–—]|$)", re.IGNORECASE)
+
+# Common names of 10-K items, mapped to the item number
+SECTION_ALIASES = {
+    "business": "1",
+    "risk factors": "1A",
+    "unresolved staff comments": "1B",
+    "cybersecurity": "1C",
+    "properties": "2",
+    "legal proceedings": "3",
+    "market for registrant's common equity": "5",
+    "md&a": "7",
+    "mda": "7",
+    "management's discussion and analysis": "7",
+    "quantitative and qualitative disclosures about market risk": "7A",
+    "market risk": "7A",
+    "financial statements": "8",
+    "controls and procedures": "9A",
+    "executive compensation": "11",
+}
+
+# A "section" shorter than this that is immediately followed by another item
+# heading is a table-of-contents entry, not the section itself.
+_TOC_ENTRY_MAX_CHARS = 400
+
+
+def normalize_section(section: str) -> str:
+    """Map a section name ('Item 1A', '1a', 'Risk Factors') to its item number."""
+    key = section.strip().lower().replace("’", "'")
+    if key in SECTION_ALIASES:
+        return SECTION_ALIASES[key]
+    match = re.match(r"^(?:item\s*)?(\d{1,2}[a-d]?)\.?$", key)
+    if not match:
+        raise ValueError(f"Unknown filing section: {section!r}")
+    return match.group(1).upper()
+
+
+class FilingTextReader:
+    """Consume a filing in chunks and keep only the text that was asked for.
+
+    Text is produced line by line as chunks arrive. With ``section`` set,
+    lines are discarded until that item's heading is found (skipping table
+    of contents entries) and reading ends at the next item heading. Either
+    way ``feed`` returns True as soon as ``offset + length`` characters are
+    available, so the caller can stop downloading the rest of the document.
+    """
+
+    def __init__(self, section: Optional[str] = None, offset: int = 0, length: int = 5000):
+        """Initialize the reader.
+
+        Args:
+            section: Item to extract (e.g. '1A', 'Item 7', 'Risk Factors'),
+                or None for the whole document
+            offset: Character offset of the page within the extracted text
+            length: Maximum number of characters in the page
+        """
+        self.section = normalize_section(section) if section else None
+        self.offset = max(0, offset)
+        self.length = max(0, length)
+        self._converter = HTMLTextConverter()
+        self._paragraph = False
+        self._tail = ""
+        self._lines: List[str] = []
+        self._size = 0
+        self._short_candidate: Optional[List[str]] = None
+        self._capturing = self.section is None
+        self._section_found = False
+        self._finished = False
+        self._truncated = False
+
+    @property
+    def done(self) -> bool:
+        """Whether enough text has been extracted."""
+        return self._finished
+
+    @property
+    def section_found(self) -> bool:
+        """Whether the requested section's heading was seen."""
+        return self.section is None or self._section_found
+
+    @property
+    def has_more(self) -> bool:
+        """Whether text exists beyond the returned page."""
+        return self._truncated or self._size - 1 > self.offset + self.length
+
+    def feed(self, chunk: str) -> bool:
+        """Feed the next chunk of HTML; returns True once reading can stop."""
+        if self._finished:
+            return True
+        text = self._tail + self._converter.feed(chunk)
+        lines = text.split("\n")
+        self._tail = lines.pop()
+        for line in lines:
+            self._add_line(line)
+            if self._finished:
+                break
+        return self._finished
+
+    def close(self) -> None:
+        """Flush any buffered text at the end of the document."""
+        if self._finished:
+            return
+        text = self._tail + self._converter.close()
+        self._tail = ""
+        for line in text.split("\n"):
+            self._add_line(line)
+            if self._finished:
+                return
+        if not self.section_found and self._short_candidate:
+            # The only match was short: a section like "Item 1B. None."
+            self._lines = self._short_candidate
+            self._size = sum(len(line) + 1 for line in self._lines)
+            self._section_found = True
+        self._finished = True
+
+    def _add_line(self, raw: str) -> None:
+        line = _WHITESPACE.sub(" ", raw).strip()
+        if not line:
+            # Blank lines separate paragraphs; keep at most one
+            self._paragraph = bool(self._lines)
+            return
+
+        if self.section is not None:
+            heading = _ITEM_HEADING.match(line)
+            if heading:
+                item = heading.group(1).upper()
+                if item == self.section:
+                    # (Re)start capture; an earlier match was a ToC entry
+                    self._lines = []
+                    self._size = 0
+                    self._capturing = True
+                    self._section_found = True
+                elif self._capturing:
+                    if self._size > _TOC_ENTRY_MAX_CHARS:
+                        self._finished = True
+                        return
+                    self._short_candidate = self._lines
+                    self._lines = []
+                    self._size = 0
+                    self._capturing = False
+                    self._section_found = False
+
+        if not self._capturing:
+            return
+        if self._paragraph and self._lines:
+            self._lines.append("")
+            self._size += 1
+        self._paragraph = False
+        self._lines.append(line)
+        self._size += len(line) + 1
+        if self._size - 1 > self.offset + self.length and (
+            self.section is None or self._size > _TOC_ENTRY_MAX_CHARS
+        ):
+            self._truncated = True
+            self._finished = True
+
+    @property
+    def text(self) -> str:
+        """The requested page of extracted text."""
+        if not self.section_found:
+            return ""
+        return "\n".join(self._lines)[self.offset:self.offset + self.length]
+
+
+def extract_filing_text(
+    chunks: Iterable[str],
+    section: Optional[str] = None,
+    offset: int = 0,
+    length: int = 5000,
+) -> FilingTextReader:
+    """Run a :class:`FilingTextReader` over an iterable of HTML chunks.
+
+    Iteration stops as soon as the requested page is complete, so passing a
+    lazy iterator (e.g. ``response.iter_content``) avoids downloading the
+    rest of the document.
+    """
+    reader = FilingTextReader(section=section, offset=offset, length=length)
+    for chunk in chunks:
+        if reader.feed(chunk):
+            break
+    else:
+        reader.close()
+    return reader
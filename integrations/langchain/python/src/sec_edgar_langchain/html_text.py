@@ -0,0 +1,300 @@
+"""Single-pass HTML to text conversion tuned for SEC filing documents."""
+
+import re
+from html import unescape
+from typing import Dict, Iterable, List, Optional
+
+# Boundaries of these elements separate paragraphs (a blank line) ...
+_PARAGRAPH_TAGS = frozenset({
+    "address", "article", "blockquote", "center", "dl", "h1", "h2", "h3", "h4",
+    "h5", "h6", "hr", "ol", "p", "pre", "section", "title", "ul",
+})
+# ... and of these, lines
+_LINE_TAGS = frozenset({"br", "caption", "dd", "div", "dt", "li"})
+_TABLE_TAGS = frozenset({"table", "td", "th", "tr"})
+# Content of these elements is never rendered text
+_SKIP_TAGS = frozenset({"head", "ix:header", "script", "style"})
+
+
+def _alternation(tags: Iterable[str]) -> str:
+    """Regex matching any of ``tags`` in any letter case, as a trie.
+
+    A trie is markedly faster than a flat alternation; it is matched
+    case-insensitively because EDGAR documents mix cases (``<Div>``,
+    ``<TABLE>``, ``<td>``).
+    """
+    trie: Dict[str, dict] = {}
+    for tag in tags:
+        node = trie
+        for char in tag:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return "(?i:" + emit(trie) + ")"
+
+
+_BLOCK = _alternation(_PARAGRAPH_TAGS | _LINE_TAGS | _TABLE_TAGS)
+_SKIP = _alternation(_SKIP_TAGS)
+
+# The whole tokenizer is one alternation, so a document is scanned exactly
+# once. Text is matched together with the inline markup around it (span,
+# font, ix:nonFraction, comments, ...) and skipped elements are consumed
+# whole, so Python code only runs at block boundaries.
+_TOKEN = re.compile(
+    r"((?:[^<]+|<(?!/?(?:" + _BLOCK + "|" + _SKIP + r")[\s/>])[/!?]?[A-Za-z][^>]*>"
+    r"|<!--.*?-->|<!\[CDATA\[.*?\]\]>)+)"                          # 1: text
+    r"|<(/?)(" + _BLOCK + r")(?=[\s/>])([^>]*)>"                  # 2-4: block tag
+    r"|<(" + _SKIP + r")(?=[\s/>])[^>]*>.*?</(?i:\5)\s*>"         # 5: skipped element
+    r"|<(" + _SKIP + r")(?=[\s/>])"                               # 6: skipped, not yet closed
+    r"|(<)",                                                      # 7: stray or incomplete '<'
+    re.DOTALL,
+)
+_TEXT, _BLOCK_TAG, _UNCLOSED, _STRAY = 1, 4, 6, 7
+
+# Closing tags searched for while skipping an element across chunks, and how
+# much of the input to keep so a closing tag split between chunks is found
+_SKIP_CLOSE = {tag: re.compile(r"</" + re.escape(tag) + r"\s*>", re.IGNORECASE) for tag in _SKIP_TAGS}
+_SKIP_TAIL = len("</ix:header>") + 32
+
+_MARKUP = re.compile(r"<!--.*?-->|<[^>]*>", re.DOTALL)
+_PARTIAL_ENTITY = re.compile(r"&[#A-Za-z0-9]{0,31}\Z")
+
+# Line and paragraph breaks are recorded as control characters and resolved,
+# together with markup, entities and whitespace runs, in bulk on drain.
+_LINE = "\x01"
+_PARAGRAPH = "\x02"
+_CELL = "\x03"
+_BLOCK_KIND: Dict[str, str] = {}
+for _tag, _kind in [
+    *((tag, _PARAGRAPH) for tag in _PARAGRAPH_TAGS),
+    *((tag, _LINE) for tag in _LINE_TAGS),
+    ("table", "table"), ("tr", "tr"), ("td", "td"), ("th", "td"),
+]:
+    _BLOCK_KIND[_tag] = _kind
+
+_WHITESPACE = re.compile(r"\s+")
+_BREAKS = re.compile(r" ?[\x01\x02][\x01\x02 ]*")
+
+# Table cells SEC filings split off from the number they belong to
+_PREFIX_CELLS = frozenset({"$", "(", "$(", "€", "£"})
+_SUFFIX_CELLS = frozenset({")", "%", ")%", "%)"})
+
+
+def _resolve_break(match: "re.Match[str]") -> str:
+    return "\n\n" if _PARAGRAPH in match.group() else "\n"
+
+
+def _clean(raw: str) -> str:
+    """Strip inline markup, decode entities and collapse whitespace."""
+    if "<" in raw:
+        raw = _MARKUP.sub("", raw)
+    if "&" in raw:
+        raw = unescape(raw)
+    return _WHITESPACE.sub(" ", raw)
+
+
+def _rstrip(text: str) -> str:
+    """Strip trailing whitespace and pending breaks."""
+    while True:
+        stripped = text.rstrip().rstrip(_LINE + _PARAGRAPH)
+        if len(stripped) == len(text):
+            return text
+        text = stripped
+
+
+def _merge_cells(cells: List[str]) -> List[str]:
+    """Drop empty cells and re-attach currency signs and parentheses."""
+    merged: List[str] = []
+    prefix = ""
+    for cell in cells:
+        if not cell:
+            continue
+        if cell in _PREFIX_CELLS:
+            prefix += cell
+            continue
+        if cell in _SUFFIX_CELLS and merged and not prefix:
+            merged[-1] += cell
+            continue
+        merged.append(prefix + cell)
+        prefix = ""
+    if prefix:
+        merged.append(prefix)
+    return merged
+
+
+class HTMLTextConverter:
+    """Incremental, single-pass HTML to text converter.
+
+    The input is scanned once with a single precompiled tokenizer:
+
+    - ``<script>``, ``<style>``, ``<head>`` and inline XBRL headers are
+      skipped without tokenizing their content
+    - entities are decoded, including ones split across chunks
+    - paragraphs are separated by a blank line and other block elements
+      by a line break
+    - each table row becomes one line of ``" | "``-delimited cells, with
+      empty spacer cells dropped and ``$`` / ``)`` / ``%`` cells merged
+      into the adjacent value
+
+    Call :meth:`feed` with successive chunks and :meth:`close` at the end;
+    both return the text produced so far.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._out: List[str] = []
+        self._carry = ""
+        self._at_start = True
+        self._row: Optional[List[List[str]]] = None
+        # Closing tag of the element being skipped, when it spans chunks
+        self._skip: Optional["re.Pattern[str]"] = None
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk of HTML and return the text it completed."""
+        self._buffer += chunk
+        self._process(final=False)
+        return self._drain(final=False)
+
+    def close(self) -> str:
+        """Flush the remaining input and return the final text."""
+        self._process(final=True)
+        self._flush_row()
+        return self._drain(final=True)
+
+    def _process(self, final: bool) -> None:
+        if self._skip is not None and not self._skip_to_close(final):
+            return
+        buf = self._buffer
+        end = len(buf)
+        pos = 0
+        out = self._out
+
+        for match in _TOKEN.finditer(buf):
+            kind = match.lastindex
+            if kind == _TEXT:
+                text = match.group(1)
+                pos = match.end()
+                if not final and pos == end and "&" in text:
+                    # An entity split across chunks is decoded with the next one
+                    partial = _PARTIAL_ENTITY.search(text)
+                    if partial is not None:
+                        text = text[:partial.start()]
+                        pos = match.start() + partial.start()
+                if self._row is None:
+                    out.append(text)
+                else:
+                    self._cell(text)
+                continue
+
+            if kind == _BLOCK_TAG:
+                block = _BLOCK_KIND[match.group(3).lower()]
+                # Fast paths for the two most frequent tags in filings
+                if block == _LINE and self._row is None:
+                    out.append(_LINE)
+                elif block == "td" and self._row is not None:
+                    if not match.group(2):
+                        self._row.append([])
+                else:
+                    self._block(match.group(2), block)
+            elif kind == _UNCLOSED:
+                if final:
+                    pos = end  # an unclosed element runs to the end
+                else:
+                    # Drop the element so far and only look for its closing
+                    # tag in later chunks, instead of rescanning it each time
+                    self._skip = _SKIP_CLOSE[match.group(6).lower()]
+                    pos = max(match.end(), end - _SKIP_TAIL)
+                break
+            elif kind == _STRAY:
+                start = match.start()
+                if not final and (buf.startswith("<!", start) or buf.find(">", start) < 0):
+                    break  # incomplete markup; wait for the next chunk
+                if buf.startswith("<!--", start):
+                    pos = end  # an unterminated comment runs to the end
+                    break
+                # Escaped so the bulk markup pass leaves it alone
+                if self._row is None:
+                    out.append("&lt;")
+                else:
+                    self._cell("&lt;")
+            pos = match.end()
+
+        self._buffer = buf[pos:]
+
+    def _skip_to_close(self, final: bool) -> bool:
+        """Drop input up to the closing tag of the skipped element.
+
+        Returns whether it was found; if not, only a tail long enough to
+        hold the start of a split closing tag is kept.
+        """
+        buf = self._buffer
+        close = self._skip.search(buf)
+        if close is None:
+            self._buffer = "" if final else buf[-_SKIP_TAIL:]
+            return False
+        self._skip = None
+        self._buffer = buf[close.end():]
+        return True
+
+    def _block(self, closing: str, block: str) -> None:
+        if block == "tr":
+            self._flush_row()
+            if not closing:
+                self._row = []
+        elif block == "td":
+            if not closing:
+                if self._row is None:
+                    self._row = []
+                self._row.append([])
+        elif block == "table":
+            self._flush_row()
+            self._out.append(_PARAGRAPH)
+        elif self._row is not None:
+            self._cell(" ")
+        else:
+            self._out.append(block)
+
+    def _cell(self, text: str) -> None:
+        if not self._row:
+            self._row.append([])
+        self._row[-1].append(text)
+
+    def _flush_row(self) -> None:
+        row = self._row
+        self._row = None
+        if not row:
+            return
+        cells = _clean(_CELL.join("".join(cell) for cell in row)).split(_CELL)
+        cells = _merge_cells([cell.strip() for cell in cells])
+        if cells:
+            # Re-escaped so the drain pass does not treat cell text as markup
+            line = " | ".join(cells).replace("&", "&amp;").replace("<", "&lt;")
+            self._out.append(_LINE + line + _LINE)
+
+    def _drain(self, final: bool) -> str:
+        text = self._carry + _clean("".join(self._out))
+        self._out = []
+        body = _rstrip(text)
+        # Trailing whitespace and breaks may still merge with what follows
+        self._carry = "" if final else text[len(body):]
+        if not body:
+            return ""
+
+        body = _BREAKS.sub(_resolve_break, body)
+        if self._at_start:
+            body = body.lstrip(" \n")
+            self._at_start = not body
+        return body
+
+
+def html_to_text(html: str) -> str:
+    """Convert a complete HTML document to text."""
+    converter = HTMLTextConverter()
+    return converter.feed(html) + converter.close()
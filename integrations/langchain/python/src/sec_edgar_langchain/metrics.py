@@ -0,0 +1,371 @@
+"""Timing and throughput metrics for SEC EDGAR tools and requests."""
+
+import bisect
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets (the last one is open)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# URL fragment -> endpoint label; labels stay low-cardinality for exporters
+ENDPOINT_LABELS: Dict[str, str] = {
+    "/submissions/": "submissions",
+    "/api/xbrl/companyfacts/": "companyfacts",
+    "/api/xbrl/companyconcept/": "companyconcept",
+    "company_tickers.json": "tickers",
+    "/Archives/edgar/data/": "archives",
+}
+
+
+def endpoint_label(url: str) -> str:
+    """Label of the SEC endpoint a URL belongs to, or 'other'."""
+    for fragment, label in ENDPOINT_LABELS.items():
+        if fragment in url:
+            return label
+    return "other"
+
+
+@dataclass(frozen=True)
+class MetricEvent:
+    """One observation passed to metrics listeners.
+
+    ``kind`` is ``"tool"`` (a tool invocation), ``"request"`` (one HTTP
+    attempt; ``attempt > 0`` marks a retry) or ``"cache"`` (a response
+    cache lookup, with ``result`` ``"hit"``, ``"revalidated"`` or
+    ``"miss"``). ``name`` is the tool name or the endpoint label.
+    """
+
+    kind: str
+    name: str
+    duration: float = 0.0
+    error: bool = False
+    size: int = 0
+    status: Optional[int] = None
+    limiter_wait: float = 0.0
+    attempt: int = 0
+    result: Optional[str] = None
+
+
+MetricsListener = Callable[[MetricEvent], None]
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Latency histogram of one tool or endpoint."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    bounds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    # Observations per bucket; the last entry counts those above every bound
+    buckets: Tuple[int, ...] = ()
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (``max`` for the open bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Aggregated metrics since creation or the last reset."""
+
+    tools: Dict[str, LatencyStats] = field(default_factory=dict)
+    tool_errors: Dict[str, int] = field(default_factory=dict)
+    requests: Dict[str, LatencyStats] = field(default_factory=dict)
+    request_errors: Dict[str, int] = field(default_factory=dict)
+    retries: Dict[str, int] = field(default_factory=dict)
+    bytes_received: Dict[str, int] = field(default_factory=dict)
+    cache: Dict[str, int] = field(default_factory=dict)
+    limiter_wait: float = 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of cache lookups answered without downloading the body."""
+        lookups = sum(self.cache.values())
+        served = self.cache.get("hit", 0) + self.cache.get("revalidated", 0)
+        return served / lookups if lookups else 0.0
+
+
+class _Histogram:
+    __slots__ = ("bounds", "buckets", "count", "total", "max")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def stats(self) -> LatencyStats:
+        return LatencyStats(
+            count=self.count, total=self.total, max=self.max, bounds=self.bounds, buckets=tuple(self.buckets)
+        )
+
+
+def _increment(counter: Dict[str, Any], key: str, amount: Any = 1) -> None:
+    counter[key] = counter.get(key, 0) + amount
+
+
+class Metrics:
+    """Thread-safe collector of tool and request metrics.
+
+    Aggregates per-tool and per-endpoint latency histograms, bytes
+    received, cache results, rate-limiter wait time and retries, and
+    forwards every observation to registered listeners (callbacks or
+    exporters such as :class:`PrometheusExporter`). A listener that raises
+    is logged and never fails the observed call.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """Create the collector.
+
+        Args:
+            buckets: Upper bounds in seconds of the latency histogram buckets
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._listeners: List[MetricsListener] = []
+        self.reset()
+
+    def add_listener(self, listener: MetricsListener) -> None:
+        """Call ``listener`` with every :class:`MetricEvent` from now on."""
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: MetricsListener) -> None:
+        """Stop calling a listener added with :meth:`add_listener`."""
+        with self._lock:
+            self._listeners = [registered for registered in self._listeners if registered is not listener]
+
+    def observe_tool(self, name: str, duration: float, error: bool = False, size: int = 0) -> None:
+        """Record a tool invocation; ``size`` is the length of its text output."""
+        self.emit(MetricEvent(kind="tool", name=name, duration=duration, error=error, size=size))
+
+    def observe_request(
+        self,
+        url: str,
+        duration: float,
+        status: Optional[int] = None,
+        size: int = 0,
+        limiter_wait: float = 0.0,
+        attempt: int = 0,
+    ) -> None:
+        """Record one HTTP attempt; ``status`` is None when no response arrived."""
+        self.emit(MetricEvent(
+            kind="request",
+            name=endpoint_label(url),
+            duration=duration,
+            error=status is None or status >= 400,
+            size=size,
+            status=status,
+            limiter_wait=limiter_wait,
+            attempt=attempt,
+        ))
+
+    def observe_cache(self, url: str, result: str) -> None:
+        """Record a response cache lookup: 'hit', 'revalidated' or 'miss'."""
+        self.emit(MetricEvent(kind="cache", name=endpoint_label(url), result=result))
+
+    def emit(self, event: MetricEvent) -> None:
+        """Aggregate an event and pass it to the listeners."""
+        with self._lock:
+            if event.kind == "tool":
+                self._histogram(self._tools, event.name).observe(event.duration)
+                if event.error:
+                    _increment(self._tool_errors, event.name)
+            elif event.kind == "request":
+                self._histogram(self._requests, event.name).observe(event.duration)
+                if event.error:
+                    _increment(self._request_errors, event.name)
+                if event.attempt:
+                    _increment(self._retries, event.name)
+                _increment(self._bytes, event.name, event.size)
+                self._limiter_wait += event.limiter_wait
+            elif event.kind == "cache" and event.result:
+                _increment(self._cache, event.result)
+            listeners = self._listeners
+
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.warning("Metrics listener %r failed", listener, exc_info=True)
+
+    def _histogram(self, histograms: Dict[str, _Histogram], name: str) -> _Histogram:
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = _Histogram(self.buckets)
+        return histogram
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return the aggregated metrics."""
+        with self._lock:
+            return MetricsSnapshot(
+                tools={name: histogram.stats() for name, histogram in self._tools.items()},
+                tool_errors=dict(self._tool_errors),
+                requests={name: histogram.stats() for name, histogram in self._requests.items()},
+                request_errors=dict(self._request_errors),
+                retries=dict(self._retries),
+                bytes_received=dict(self._bytes),
+                cache=dict(self._cache),
+                limiter_wait=self._limiter_wait,
+            )
+
+    def reset(self) -> None:
+        """Clear the aggregated metrics; listeners stay registered."""
+        with self._lock:
+            self._tools: Dict[str, _Histogram] = {}
+            self._tool_errors: Dict[str, int] = {}
+            self._requests: Dict[str, _Histogram] = {}
+            self._request_errors: Dict[str, int] = {}
+            self._retries: Dict[str, int] = {}
+            self._bytes: Dict[str, int] = {}
+            self._cache: Dict[str, int] = {}
+            self._limiter_wait = 0.0
+
+
+class PrometheusExporter:
+    """Metrics listener updating ``prometheus_client`` collectors.
+
+    Usage::
+
+        toolkit.metrics.add_listener(PrometheusExporter())
+        prometheus_client.start_http_server(9000)
+    """
+
+    def __init__(
+        self,
+        registry: Any = None,
+        namespace: str = "sec_edgar",
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        """Register the collectors.
+
+        Args:
+            registry: Collector registry (default: the global one)
+            namespace: Prefix of the metric names
+            buckets: Latency histogram bucket bounds in seconds
+        """
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError(
+                "The Prometheus exporter requires prometheus-client. "
+                "Install it with: pip install 'sec-edgar-langchain[prometheus]'"
+            ) from e
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        options = {"namespace": namespace, "registry": registry}
+        self.tool_duration = prometheus_client.Histogram(
+            "tool_duration_seconds", "Tool invocation latency", ["tool"], buckets=buckets, **options
+        )
+        self.tool_errors = prometheus_client.Counter(
+            "tool_errors_total", "Tool invocations that returned an error", ["tool"], **options
+        )
+        self.request_duration = prometheus_client.Histogram(
+            "request_duration_seconds", "HTTP attempt latency, excluding rate-limiter wait",
+            ["endpoint", "status"], buckets=buckets, **options
+        )
+        self.request_bytes = prometheus_client.Counter(
+            "response_bytes_total", "Response bytes received", ["endpoint"], **options
+        )
+        self.retries = prometheus_client.Counter(
+            "retries_total", "Retried HTTP attempts", ["endpoint"], **options
+        )
+        self.cache = prometheus_client.Counter(
+            "cache_lookups_total", "Response cache lookups", ["endpoint", "result"], **options
+        )
+        self.limiter_wait = prometheus_client.Counter(
+            "rate_limiter_wait_seconds_total", "Time spent waiting for rate-limiter tokens", **options
+        )
+
+    def __call__(self, event: MetricEvent) -> None:
+        if event.kind == "tool":
+            self.tool_duration.labels(tool=event.name).observe(event.duration)
+            if event.error:
+                self.tool_errors.labels(tool=event.name).inc()
+        elif event.kind == "request":
+            status = str(event.status) if event.status is not None else "none"
+            self.request_duration.labels(endpoint=event.name, status=status).observe(event.duration)
+            self.request_bytes.labels(endpoint=event.name).inc(event.size)
+            if event.attempt:
+                self.retries.labels(endpoint=event.name).inc()
+            if event.limiter_wait:
+                self.limiter_wait.inc(event.limiter_wait)
+        elif event.kind == "cache":
+            self.cache.labels(endpoint=event.name, result=event.result).inc()
+
+
+class OpenTelemetryExporter:
+    """Metrics listener recording into OpenTelemetry instruments."""
+
+    def __init__(self, meter: Any = None):
+        """Create the instruments.
+
+        Args:
+            meter: OpenTelemetry meter (default: one from the global meter provider)
+        """
+        try:
+            from opentelemetry import metrics as otel_metrics
+        except ImportError as e:
+            raise ImportError(
+                "The OpenTelemetry exporter requires opentelemetry-api. "
+                "Install it with: pip install 'sec-edgar-langchain[otel]'"
+            ) from e
+
+        if meter is None:
+            meter = otel_metrics.get_meter("sec_edgar_langchain")
+        self.tool_duration = meter.create_histogram(
+            "sec_edgar.tool.duration", unit="s", description="Tool invocation latency"
+        )
+        self.request_duration = meter.create_histogram(
+            "sec_edgar.request.duration", unit="s", description="HTTP attempt latency, excluding rate-limiter wait"
+        )
+        self.request_bytes = meter.create_counter(
+            "sec_edgar.response.size", unit="By", description="Response bytes received"
+        )
+        self.retries = meter.create_counter("sec_edgar.retries", description="Retried HTTP attempts")
+        self.cache = meter.create_counter("sec_edgar.cache.lookups", description="Response cache lookups")
+        self.limiter_wait = meter.create_counter(
+            "sec_edgar.rate_limiter.wait", unit="s", description="Time spent waiting for rate-limiter tokens"
+        )
+
+    def __call__(self, event: MetricEvent) -> None:
+        if event.kind == "tool":
+            self.tool_duration.record(event.duration, {"tool": event.name, "error": event.error})
+        elif event.kind == "request":
+            attributes = {"endpoint": event.name, "status": event.status if event.status is not None else 0}
+            self.request_duration.record(event.duration, attributes)
+            self.request_bytes.add(event.size, {"endpoint": event.name})
+            if event.attempt:
+                self.retries.add(1, {"endpoint": event.name})
+            if event.limiter_wait:
+                self.limiter_wait.add(event.limiter_wait)
+        elif event.kind == "cache":
+            self.cache.add(1, {"endpoint": event.name, "result": event.result})
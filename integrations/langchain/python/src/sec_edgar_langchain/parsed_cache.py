@@ -0,0 +1,119 @@
+"""In-memory LRU of parsed per-company objects shared by chained tool calls."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+
+# Keys are (kind, cik, variant): e.g. ("filings", "0000320193", pages)
+CacheKey = Tuple[str, str, Hashable]
+
+
+@dataclass
+class ParsedCacheStats:
+    """Snapshot of parsed-object cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+
+
+class ParsedObjectCache:
+    """Thread-safe, size- and age-bounded LRU of parsed objects.
+
+    An agent typically chains several tools on one company (info, filing
+    search, 8-K events, facts). Keeping the parsed :class:`FilingIndex` /
+    :class:`CompanyFacts` for a short while lets those calls skip both the
+    fetch and the parse. Entries are shared between callers and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is
+                dropped; 0 disables caching
+            ttl: Seconds an entry is served for after it was stored
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return a fresh entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store an entry, evicting the least recently used beyond ``max_entries``."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def find(self, kind: str, cik: str, accept: Callable[[Hashable], bool]) -> Optional[Any]:
+        """Return the first fresh ``kind`` entry for ``cik`` whose variant is accepted."""
+        with self._lock:
+            candidates = [key for key in self._entries if key[0] == kind and key[1] == cik and accept(key[2])]
+        for key in candidates:
+            value = self.get(key)
+            if value is not None:
+                return value
+        return None
+
+    def get_or_build(self, key: CacheKey, build: Callable[[], Any]) -> Any:
+        """Return the cached entry for ``key``, building and storing it on a miss.
+
+        The build runs outside the lock; concurrent misses may build twice,
+        with the HTTP layer coalescing their fetches.
+        """
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, cik: Optional[str] = None) -> None:
+        """Drop every entry of one company, or all entries."""
+        with self._lock:
+            if cik is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[1] == cik]:
+                    del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[CacheKey]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def stats(self) -> ParsedCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return ParsedCacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries))
@@ -0,0 +1,243 @@
+"""Process-wide token-bucket rate limiter for SEC EDGAR requests."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Optional
+
+SEC_MAX_REQUESTS_PER_SECOND = 10.0
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Snapshot of rate limiter wait-time metrics."""
+
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+
+    @property
+    def average_wait(self) -> float:
+        """Mean wait per acquired token, in seconds."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class TokenBucketRateLimiter:
+    """Thread-safe and asyncio-aware token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``, so
+    callers that are already spaced out never wait while bursts of up to
+    ``burst`` requests go out immediately. In addition no more than
+    ``burst`` requests are released within any ``burst / rate`` second
+    window, which keeps the SEC cap over every one-second window rather
+    than only on average.
+
+    Each caller reserves its slot under a short lock and then sleeps
+    outside of it (``time.sleep`` for threads, ``asyncio.sleep`` for
+    coroutines), so threads and event loops can share one limiter.
+
+    When the server answers 429 the limiter can be throttled below its
+    configured rate (see :meth:`throttle` / :meth:`recover`), slowing every
+    caller that shares it rather than only the one that was rejected.
+    """
+
+    def __init__(
+        self,
+        rate: float = SEC_MAX_REQUESTS_PER_SECOND,
+        burst: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests released back to back
+            clock: Monotonic clock, injectable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = float(rate)
+        self._configured_rate = float(rate)
+        self._burst = int(burst)
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._history: Deque[float] = deque(maxlen=self._burst)
+        self._hold_until = 0.0
+        self._throttled_at: Optional[float] = None
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._throttle_count = 0
+
+    @property
+    def rate(self) -> float:
+        """Current sustained requests per second, lowered while throttled."""
+        return self._rate
+
+    @property
+    def configured_rate(self) -> float:
+        """Sustained requests per second when not throttled."""
+        return self._configured_rate
+
+    @property
+    def throttled(self) -> bool:
+        """Whether the rate is currently below the configured one."""
+        return self._rate < self._configured_rate
+
+    @property
+    def burst(self) -> int:
+        """Maximum number of back-to-back requests."""
+        return self._burst
+
+    def configure(self, rate: Optional[float] = None, burst: Optional[int] = None) -> None:
+        """Change the rate and/or burst size in place."""
+        with self._lock:
+            self._refill(self._clock())
+            if rate is not None:
+                if rate <= 0:
+                    raise ValueError("rate must be positive")
+                self._configured_rate = float(rate)
+                self._rate = min(self._rate, self._configured_rate) if self._throttled_at is not None else self._configured_rate
+            if burst is not None:
+                if burst < 1:
+                    raise ValueError("burst must be at least 1")
+                self._burst = int(burst)
+                self._tokens = min(self._tokens, float(burst))
+                self._history = deque(self._history, maxlen=self._burst)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve one token and return how long the caller must wait."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            start = now
+            if self._tokens < 0:
+                start = now + (-self._tokens) / self._rate
+            if len(self._history) == self._burst:
+                window = self._burst / self._rate
+                start = max(start, self._history[0] + window)
+            start = max(start, self._hold_until)
+            self._history.append(start)
+
+            wait = start - now
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return max(wait, 0.0)
+
+    def acquire(self) -> float:
+        """Block the calling thread until a token is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait for a token without blocking the event loop.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def throttle(self, hold: float = 0.0, factor: float = 0.5, floor: float = 1.0) -> None:
+        """Slow down after the server signalled overload (HTTP 429).
+
+        Args:
+            hold: Seconds during which no token is released, e.g. the
+                response's ``Retry-After``
+            factor: Multiplier applied to the current rate
+            floor: Rate the limiter is never throttled below
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._rate = min(self._rate, max(floor, self._rate * factor))
+            self._hold_until = max(self._hold_until, now + hold)
+            self._throttled_at = now
+            self._throttle_count += 1
+
+    def recover(self, quiet: float = 30.0, factor: float = 2.0) -> None:
+        """Step a throttled rate back up once ``quiet`` seconds passed since the last 429.
+
+        Each step multiplies the rate by ``factor`` and restarts the quiet
+        period, until the configured rate is reached.
+        """
+        with self._lock:
+            if self._throttled_at is None:
+                return
+            now = self._clock()
+            if now - self._throttled_at < quiet:
+                return
+            self._refill(now)
+            self._rate = min(self._configured_rate, self._rate * factor)
+            self._throttled_at = None if self._rate >= self._configured_rate else now
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of the wait-time metrics."""
+        with self._lock:
+            return RateLimiterStats(
+                acquired=self._acquired,
+                delayed=self._delayed,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+                throttled=self._throttle_count,
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the wait-time metrics."""
+        with self._lock:
+            self._acquired = 0
+            self._delayed = 0
+            self._total_wait = 0.0
+            self._max_wait = 0.0
+            self._throttle_count = 0
+
+
+_shared_limiter: Optional[TokenBucketRateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(
+    rate: float = SEC_MAX_REQUESTS_PER_SECOND, burst: int = 10
+) -> TokenBucketRateLimiter:
+    """Get or create the process-wide rate limiter.
+
+    The SEC cap applies to the whole process, so every toolkit shares one
+    limiter. When toolkits ask for different limits the strictest one wins.
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = TokenBucketRateLimiter(rate=rate, burst=burst)
+        elif rate < _shared_limiter.configured_rate or burst < _shared_limiter.burst:
+            _shared_limiter.configure(
+                rate=min(rate, _shared_limiter.configured_rate),
+                burst=min(burst, _shared_limiter.burst),
+            )
+        return _shared_limiter
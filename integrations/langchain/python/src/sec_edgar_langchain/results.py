@@ -0,0 +1,112 @@
+"""Typed tool results for the structured and compact output modes.
+
+With ``output_format="structured"`` the toolkit's data tools return these
+models instead of text. Nothing is serialized until LangChain stringifies the
+observation for the model, and that rendering is the compact one. With
+``output_format="compact"`` tools return the compact rendering directly:
+minified JSON with abbreviated keys and without unset fields.
+"""
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class ToolResult(BaseModel):
+    """Base class of structured tool results."""
+
+    def to_compact(self) -> str:
+        """Render as minified JSON with abbreviated keys, omitting unset fields."""
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+
+    def __str__(self) -> str:
+        return self.to_compact()
+
+
+# What a tool function returns: text, or a result model in structured mode
+ToolOutput = Union[str, ToolResult]
+
+
+class CompanyInfo(ToolResult):
+    """Company details from the submissions API."""
+
+    name: Optional[str] = None
+    cik: Optional[str] = None
+    ticker: Optional[str] = None
+    exchange: Optional[str] = None
+    sic: Optional[str] = None
+    sic_description: Optional[str] = Field(default=None, serialization_alias="sic_desc")
+    industry: Optional[str] = None
+    fiscal_year_end: Optional[str] = Field(default=None, serialization_alias="fye")
+    state: Optional[str] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+    website: Optional[str] = None
+    employees: Optional[Union[int, str]] = None
+    description: Optional[str] = Field(default=None, serialization_alias="desc")
+
+
+class Filing(ToolResult):
+    """One filing from a company's filing index."""
+
+    form: str
+    filing_date: str = Field(serialization_alias="date")
+    accession: str = Field(serialization_alias="acc")
+    primary_document: str = Field(serialization_alias="doc")
+    description: Optional[str] = Field(default=None, serialization_alias="desc")
+    url: str
+
+
+class FilingList(ToolResult):
+    """Filings matching a search, newest first."""
+
+    cik: str
+    form_type: Optional[str] = Field(default=None, serialization_alias="form")
+    date_from: Optional[str] = Field(default=None, serialization_alias="from")
+    date_to: Optional[str] = Field(default=None, serialization_alias="to")
+    filings: List[Filing] = Field(default_factory=list)
+
+
+class FactValue(ToolResult):
+    """One reported period of a concept, with its raw numeric value."""
+
+    value: Union[int, float] = Field(serialization_alias="v")
+    period: str = Field(serialization_alias="end")
+    start: Optional[str] = None
+    form: str
+    fiscal_period: Optional[str] = Field(default=None, serialization_alias="fp")
+    # Only set where the enclosing result does not carry the unit
+    unit: Optional[str] = Field(default=None, serialization_alias="u")
+
+
+class ConceptValues(ToolResult):
+    """Selected periods of one XBRL concept; ``unit`` is None when it is not reported."""
+
+    concept: str
+    label: Optional[str] = None
+    unit: Optional[str] = None
+    values: List[FactValue] = Field(default_factory=list, serialization_alias="vals")
+
+
+class CompanyFactsResult(ToolResult):
+    """XBRL facts selected for one company."""
+
+    cik: str
+    entity_name: Optional[str] = Field(default=None, serialization_alias="name")
+    concepts: List[ConceptValues] = Field(default_factory=list, serialization_alias="facts")
+
+
+class PeerCompany(ToolResult):
+    """One company's column of a peer comparison."""
+
+    cik: str
+    name: Optional[str] = None
+    values: Dict[str, FactValue] = Field(default_factory=dict, serialization_alias="vals")
+    error: Optional[str] = Field(default=None, serialization_alias="err")
+
+
+class PeerComparison(ToolResult):
+    """Latest value of each metric for a peer group; unreported metrics are absent."""
+
+    metrics: List[str]
+    companies: List[PeerCompany] = Field(default_factory=list)
@@ -0,0 +1,277 @@
+"""Retries with jittered exponential backoff for transient SEC EDGAR errors."""
+
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Deque, Dict, Optional
+
+from .rate_limit import TokenBucketRateLimiter
+
+# Responses worth another attempt: rate limited or a transient server error
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Retries allowed per minute, keyed by URL fragment (longest match wins)
+DEFAULT_RETRY_BUDGETS: Dict[str, int] = {
+    "": 60,
+    "/Archives/edgar/data/": 20,
+}
+
+# Limiter slow-down applied per 429, and the floor it never drops below
+THROTTLE_FACTOR = 0.5
+MIN_THROTTLED_RATE = 1.0
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while its endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(
+            f"SEC EDGAR endpoint {endpoint or '*'} is failing; not retrying for {retry_in:.1f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Snapshot of retry and circuit breaker counters."""
+
+    retries: int = 0
+    throttled: int = 0
+    exhausted: int = 0
+    rejected: int = 0
+    circuit_opens: int = 0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait according to a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class _Endpoint:
+    __slots__ = ("retries", "failures", "opened_at")
+
+    def __init__(self):
+        self.retries: Deque[float] = deque()
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+
+class RetryPolicy:
+    """Decides whether and when a failed SEC EDGAR request is sent again.
+
+    Transient failures (429, 5xx, connection errors) are retried after a
+    full-jitter exponential backoff, or after the server's ``Retry-After``
+    when it sends one. Each endpoint (URL fragment of ``budgets``) may only
+    spend a bounded number of retries per ``budget_window``, so a sustained
+    outage does not multiply the load.
+
+    Two feedback loops protect the SEC and the caller:
+
+    - A 429 throttles the shared rate limiter: its rate is cut and no token
+      is released until ``Retry-After`` has passed, for every toolkit using
+      that limiter. Successful requests restore the configured rate in steps
+      once no 429 has been seen for ``recovery_interval`` seconds.
+    - ``failure_threshold`` consecutive 5xx or connection failures on an
+      endpoint open its circuit: requests fail fast with
+      :class:`CircuitOpenError` for ``reset_timeout`` seconds, after which a
+      trial request decides whether it closes again.
+
+    One policy is shared by a backend's sync and async clients and is
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_retry_after: float = 120.0,
+        budgets: Optional[Dict[str, int]] = None,
+        budget_window: float = 60.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        recovery_interval: float = 30.0,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        clock: Callable[[], float] = time.monotonic,
+        jitter: Callable[[], float] = random.random,
+    ):
+        """Create the policy.
+
+        Args:
+            max_retries: Retries per request after the first attempt; 0 disables
+            backoff_base: Backoff ceiling of the first retry in seconds,
+                doubled on each further retry
+            backoff_max: Upper bound of the backoff ceiling
+            max_retry_after: Longest ``Retry-After`` honoured; the request
+                fails instead of waiting longer
+            budgets: Retries allowed per ``budget_window`` keyed by URL
+                fragment (default: ``DEFAULT_RETRY_BUDGETS``); URLs matching
+                no fragment are not budgeted
+            budget_window: Length of the budget window in seconds
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds an open circuit rejects requests
+            recovery_interval: Seconds without a 429 before the limiter rate
+                is stepped back up
+            rate_limiter: Limiter throttled on 429 responses
+            clock: Monotonic time source
+            jitter: Uniform random source in [0, 1)
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.budgets = DEFAULT_RETRY_BUDGETS if budgets is None else budgets
+        self.budget_window = budget_window
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.recovery_interval = recovery_interval
+        self.rate_limiter = rate_limiter
+        self._clock = clock
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._retries = 0
+        self._throttled = 0
+        self._exhausted = 0
+        self._rejected = 0
+        self._circuit_opens = 0
+
+    def endpoint(self, url: str) -> str:
+        """The budget fragment a URL is accounted under."""
+        best = None
+        for fragment in self.budgets:
+            if fragment in url and (best is None or len(fragment) > len(best)):
+                best = fragment
+        return best if best is not None else ""
+
+    def _state(self, endpoint: str) -> _Endpoint:
+        state = self._endpoints.get(endpoint)
+        if state is None:
+            state = self._endpoints[endpoint] = _Endpoint()
+        return state
+
+    def check(self, url: str) -> None:
+        """Raise :class:`CircuitOpenError` if the URL's endpoint is rejecting requests."""
+        endpoint = self.endpoint(url)
+        with self._lock:
+            state = self._state(endpoint)
+            if state.opened_at is None:
+                return
+            remaining = state.opened_at + self.reset_timeout - self._clock()
+            if remaining <= 0:
+                # Half-open: let requests through; the next outcome decides
+                return
+            self._rejected += 1
+        raise CircuitOpenError(endpoint, remaining)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt + 1``."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return self._jitter() * ceiling
+
+    def next_delay(
+        self,
+        url: str,
+        attempt: int,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Record the outcome of an attempt and return the delay before retrying.
+
+        Args:
+            url: Requested URL
+            attempt: Attempts already retried for this request (0 for the first)
+            status: HTTP status, or None when the request failed without a response
+            retry_after: The response's ``Retry-After`` header, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None to stop retrying
+        """
+        if status is not None and status not in RETRY_STATUSES:
+            self._succeeded(url)
+            return None
+
+        wait = parse_retry_after(retry_after) if status in (429, 503) else None
+        endpoint = self.endpoint(url)
+        with self._lock:
+            now = self._clock()
+            state = self._state(endpoint)
+            if status == 429:
+                self._throttled += 1
+            else:
+                state.failures += 1
+                if state.failures >= self.failure_threshold and (
+                    state.opened_at is None or now - state.opened_at >= self.reset_timeout
+                ):
+                    state.opened_at = now
+                    self._circuit_opens += 1
+
+            retries = state.retries
+            while retries and now - retries[0] >= self.budget_window:
+                retries.popleft()
+            budget = self.budgets.get(endpoint)
+            give_up = (
+                attempt >= self.max_retries
+                or (budget is not None and len(retries) >= budget)
+                or (state.opened_at is not None and now - state.opened_at < self.reset_timeout)
+                or (wait is not None and wait > self.max_retry_after)
+            )
+            if give_up:
+                self._exhausted += 1
+            else:
+                retries.append(now)
+                self._retries += 1
+
+        if wait is None:
+            wait = self.backoff(attempt)
+        if status == 429 and self.rate_limiter is not None:
+            self.rate_limiter.throttle(
+                hold=min(wait, self.max_retry_after), factor=THROTTLE_FACTOR, floor=MIN_THROTTLED_RATE
+            )
+        return None if give_up else wait
+
+    def _succeeded(self, url: str) -> None:
+        endpoint = self.endpoint(url)
+        with self._lock:
+            state = self._state(endpoint)
+            state.failures = 0
+            state.opened_at = None
+        if self.rate_limiter is not None:
+            self.rate_limiter.recover(quiet=self.recovery_interval)
+
+    def stats(self) -> RetryStats:
+        """Return a snapshot of the retry counters."""
+        with self._lock:
+            return RetryStats(
+                retries=self._retries,
+                throttled=self._throttled,
+                exhausted=self._exhausted,
+                rejected=self._rejected,
+                circuit_opens=self._circuit_opens,
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the retry counters."""
+        with self._lock:
+            self._retries = 0
+            self._throttled = 0
+            self._exhausted = 0
+            self._rejected = 0
+            self._circuit_opens = 0
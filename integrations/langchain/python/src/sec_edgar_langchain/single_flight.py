@@ -0,0 +1,137 @@
+"""Coalescing of identical concurrent fetches (single-flight)."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Snapshot of request coalescing counters."""
+
+    calls: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+    @property
+    def executed(self) -> int:
+        """Calls that actually ran, i.e. were not served by another caller's fetch."""
+        return self.calls - self.coalesced
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome.
+
+    The first caller for a key (the leader) runs the fetch; callers arriving
+    while it is in flight wait for it and receive the same result object,
+    or the same exception. Nothing is cached once the call completes, so a
+    later caller triggers a fresh fetch.
+
+    Shared results must be treated as read-only by callers.
+
+    Threads and coroutines are coalesced separately: :meth:`do` blocks the
+    calling thread, :meth:`ado` awaits an ``asyncio`` future on the running
+    loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self._total = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` unless a call for ``key`` is in flight; then wait for it."""
+        with self._lock:
+            self._total += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of :meth:`do`; ``func`` returns the awaitable to share."""
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        with self._lock:
+            self._total += 1
+            future = self._async_calls.get(slot)
+            leader = future is None
+            if leader:
+                future = self._async_calls[slot] = loop.create_future()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            try:
+                # Shielded so a cancelled waiter does not cancel the shared fetch
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # The leader was cancelled, not us: fetch again
+                    return await self.ado(key, func)
+                raise
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Marked retrieved so a future nobody waited on does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._async_calls[slot]
+
+    def stats(self) -> SingleFlightStats:
+        """Return a snapshot of the coalescing counters."""
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._total,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls) + len(self._async_calls),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the coalescing counters."""
+        with self._lock:
+            self._total = 0
+            self._coalesced = 0
@@ -0,0 +1,182 @@
+"""Columnar index over the filings listed in a submissions payload."""
+
+import bisect
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Columns of ``filings.recent`` (and of the overflow pages) kept by the index
+_COLUMNS = ("form", "filingDate", "accessionNumber", "primaryDocument", "primaryDocDescription")
+
+
+def overflow_pages(
+    data: Dict[str, Any], date_from: Optional[str] = None, date_to: Optional[str] = None
+) -> List[str]:
+    """Names of the ``filings.files`` pages a date range needs.
+
+    Large filers only get their latest ~1000 filings in ``filings.recent``;
+    older history is split into extra JSON pages. Pages are only needed when
+    the range reaches back past the oldest ``recent`` filing (a range with
+    only ``date_to`` reaches back indefinitely), and then only those whose
+    ``filingFrom``..``filingTo`` span overlaps the range.
+    """
+    filings = data.get("filings", {})
+    files = filings.get("files") or []
+    if not files or not (date_from or date_to):
+        return []
+
+    recent_dates = filings.get("recent", {}).get("filingDate") or []
+    earliest = min(recent_dates) if recent_dates else None
+    if earliest is not None and date_from and date_from >= earliest:
+        return []
+
+    names = []
+    for page in sorted(files, key=lambda f: f.get("filingTo", ""), reverse=True):
+        if date_from and page.get("filingTo") and page["filingTo"] < date_from:
+            continue
+        if date_to and page.get("filingFrom") and page["filingFrom"] > date_to:
+            continue
+        names.append(page["name"])
+    return names
+
+
+class FilingIndex:
+    """Columnar view of a company's filings with prebuilt filter indexes.
+
+    The submissions API already returns ``filings.recent`` as parallel
+    arrays; those lists are kept as-is (no per-row dicts) and indexed once:
+
+    - ``form -> row indexes``, each sorted by filing date, so a form-type
+      filter only visits the handful of distinct form names
+    - a global date-sorted row index, so date ranges are two bisects
+
+    Rows are numbered in payload order, which is newest first.
+    """
+
+    def __init__(self, columns: Dict[str, List[Any]]):
+        """Build the index from parallel column lists.
+
+        Args:
+            columns: Lists keyed by submissions column name ('form',
+                'filingDate', 'accessionNumber', 'primaryDocument',
+                'primaryDocDescription'); missing columns are treated as empty
+        """
+        size = len(columns.get("form", []))
+        self._columns: Dict[str, List[Any]] = {}
+        for name in _COLUMNS:
+            column = columns.get(name) or []
+            if len(column) < size:
+                column = list(column) + [""] * (size - len(column))
+            self._columns[name] = column
+
+        forms = self._columns["form"]
+        dates = self._columns["filingDate"]
+        # Ties on a date keep payload (newest first) order once reversed
+        order = sorted(range(size), key=lambda row: (dates[row], -row))
+
+        self._rows = array("l", order)
+        self._dates = [dates[row] for row in order]
+        self._by_form: Dict[str, Tuple[array, List[str]]] = {}
+        grouped: Dict[str, List[int]] = {}
+        for row in order:
+            grouped.setdefault(forms[row].upper(), []).append(row)
+        for form, rows in grouped.items():
+            self._by_form[form] = (array("l", rows), [dates[row] for row in rows])
+
+    @classmethod
+    def from_submissions(
+        cls, data: Dict[str, Any], pages: Iterable[Dict[str, List[Any]]] = ()
+    ) -> "FilingIndex":
+        """Index a raw submissions payload.
+
+        Args:
+            data: Submissions JSON; its ``filings.recent`` columns are indexed
+            pages: Overflow pages from ``filings.files`` (same columnar
+                shape as ``recent``) to merge in, newest first
+        """
+        recent = data.get("filings", {}).get("recent", {})
+        pages = list(pages)
+        if not pages:
+            return cls(recent)
+
+        columns: Dict[str, List[Any]] = {}
+        for name in _COLUMNS:
+            merged: List[Any] = []
+            for page in [recent, *pages]:
+                size = len(page.get("form", []))
+                column = page.get(name) or []
+                merged.extend(column[:size])
+                merged.extend([""] * (size - len(column)))
+            columns[name] = merged
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def forms(self) -> List[str]:
+        """Distinct (upper-cased) form types present."""
+        return sorted(self._by_form)
+
+    @property
+    def earliest_date(self) -> Optional[str]:
+        """Oldest filing date in the index."""
+        return self._dates[0] if self._dates else None
+
+    def column(self, name: str) -> List[Any]:
+        """The raw column list for ``name``."""
+        return self._columns[name]
+
+    @staticmethod
+    def _date_slice(
+        rows: array, dates: List[str], date_from: Optional[str], date_to: Optional[str]
+    ) -> Iterable[int]:
+        lo = bisect.bisect_left(dates, date_from) if date_from else 0
+        hi = bisect.bisect_right(dates, date_to) if date_to else len(dates)
+        return rows[lo:hi]
+
+    def search(
+        self,
+        form_type: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """Rows matching the filters, newest first.
+
+        Args:
+            form_type: Case-insensitive substring of the form type, as in
+                the original scan ('10-K' also matches '10-K/A')
+            date_from: Earliest filing date (YYYY-MM-DD), inclusive
+            date_to: Latest filing date (YYYY-MM-DD), inclusive
+            limit: Maximum number of rows to return
+        """
+        if not form_type:
+            matches: List[int] = list(self._date_slice(self._rows, self._dates, date_from, date_to))
+        else:
+            query = form_type.upper()
+            groups = [group for form, group in self._by_form.items() if query in form]
+            if len(groups) == 1:
+                matches = list(self._date_slice(*groups[0], date_from, date_to))
+            else:
+                dates = self._columns["filingDate"]
+                matches = []
+                for rows, form_dates in groups:
+                    matches.extend(self._date_slice(rows, form_dates, date_from, date_to))
+                matches.sort(key=lambda row: (dates[row], -row))
+
+        matches.reverse()
+        return matches if limit is None else matches[:limit]
+
+    def filing(self, row: int, cik: str) -> Dict[str, str]:
+        """The filing at ``row`` in the toolkit's output format."""
+        columns = self._columns
+        accession = columns["accessionNumber"][row]
+        document = columns["primaryDocument"][row]
+        return {
+            "form": columns["form"][row],
+            "filing_date": columns["filingDate"][row],
+            "accession": accession,
+            "primary_document": document,
+            "description": columns["primaryDocDescription"][row],
+            "url": f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession.replace('-', '')}/{document}",
+        }
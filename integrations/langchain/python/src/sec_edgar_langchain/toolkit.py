@@ -1,14 +1,90 @@
 """SEC EDGAR Toolkit for LangChain agents."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import json
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+import logging
+import os
+import threading
+import time
 from langchain_core.tools import Tool
-from typing import List
-from abc import ABC
 from pydantic import BaseModel, Field
 
+from .backends import (
+    SEC_DATA_URL,
+    SEC_TICKERS_URL,
+    BackendChain,
+    CacheBackend,
+    EdgarBackend,
+    HTTPBackend,
+)
+from .cache import DEFAULT_CACHE_TTLS, ResponseCache, SQLiteResponseCache
+from .cik_index import CompanyEntry, CompanyTickerIndex
+from .client import AsyncSECEdgarHTTPClient, SECEdgarHTTPClient
+from .company_facts import CompanyFacts, Fact
+from .filing_text import FilingTextReader, extract_filing_text
+from .metrics import Metrics
+from .parsed_cache import ParsedObjectCache
+from .retry import DEFAULT_RETRY_BUDGETS, RetryPolicy
+from .results import (
+    CompanyFactsResult,
+    CompanyInfo,
+    ConceptValues,
+    FactValue,
+    Filing,
+    FilingList,
+    PeerComparison,
+    PeerCompany,
+    ToolOutput,
+    ToolResult,
+)
+from .rate_limit import (
+    SEC_MAX_REQUESTS_PER_SECOND,
+    TokenBucketRateLimiter,
+    get_shared_rate_limiter,
+)
+from .single_flight import SingleFlight
+from .submissions import FilingIndex, overflow_pages
+from .warehouse import Warehouse
+
+
+logger = logging.getLogger(__name__)
+
+# Comparison metric -> us-gaap concepts to try, in order of preference
+COMPARISON_METRICS: Dict[str, Tuple[str, ...]] = {
+    "revenue": ("Revenues", "RevenueFromContractWithCustomerExcludingAssessedTax", "SalesRevenueNet"),
+    "net_income": ("NetIncomeLoss",),
+    "assets": ("Assets",),
+    "liabilities": ("Liabilities",),
+    "equity": ("StockholdersEquity",),
+    "cash": ("CashAndCashEquivalentsAtCarryingValue",),
+    "operating_income": ("OperatingIncomeLoss",),
+    "eps": ("EarningsPerShareBasic",),
+}
+DEFAULT_COMPARISON_METRICS = ["revenue", "net_income", "assets"]
+
+# Company facts summary shown when no concepts are requested: label -> us-gaap concept
+COMPANY_FACTS_SUMMARY = {
+    "Latest Revenue": "Revenues",
+    "Latest Net Income": "NetIncomeLoss",
+    "Total Assets": "Assets",
+    "EPS (Basic)": "EarningsPerShareBasic",
+}
+
+FILING_PAGE_LENGTH = 5000
+# Filings returned by sec_edgar_filing_search; matching spans the full index
+FILING_SEARCH_LIMIT = 20
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cik(cik: str) -> str:
+    if "CIK:" in cik:
+        cik = cik.split("CIK:")[1].split(",")[0].strip()
+    return cik.strip().lstrip('0').zfill(10)
+
 
 class SECEdgarConfig(BaseModel):
     """Configuration for SEC EDGAR toolkit."""
@@ -19,7 +95,116 @@ class SECEdgarConfig(BaseModel):
     )
     rate_limit_delay: float = Field(
         default=0.1,
-        description="Delay between API calls in seconds (SEC requires 10 requests/second max)"
+        description="Minimum average delay between API calls in seconds; caps the request rate at "
+                    "1 / rate_limit_delay (SEC requires 10 requests/second max)"
+    )
+    max_requests_per_second: float = Field(
+        default=SEC_MAX_REQUESTS_PER_SECOND,
+        description="Sustained request rate of the process-wide token bucket"
+    )
+    rate_limit_burst: int = Field(
+        default=10,
+        description="Maximum number of requests released back to back by the token bucket"
+    )
+    ticker_index_ttl: float = Field(
+        default=86400.0,
+        description="Seconds before the in-memory company_tickers.json index is refreshed"
+    )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the persistent HTTP response cache (disabled when unset)"
+    )
+    cache_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        description="Upper bound on the compressed size of the response cache"
+    )
+    cache_ttls: Dict[str, float] = Field(
+        default_factory=lambda: dict(DEFAULT_CACHE_TTLS),
+        description="Freshness lifetime in seconds per URL fragment; stale entries are revalidated"
+    )
+    request_timeout: Optional[float] = Field(
+        default=30.0,
+        description="Seconds to wait for a connection or for response data before the attempt "
+                    "fails (and is retried); None waits indefinitely"
+    )
+    max_retries: int = Field(
+        default=4,
+        description="Retries of a request after a 429, 5xx or connection error; 0 disables"
+    )
+    retry_backoff: float = Field(
+        default=0.5,
+        description="Backoff ceiling of the first retry in seconds, doubled per retry (full jitter); "
+                    "a Retry-After header takes precedence"
+    )
+    retry_backoff_max: float = Field(
+        default=30.0,
+        description="Upper bound of the retry backoff ceiling in seconds"
+    )
+    retry_budgets: Dict[str, int] = Field(
+        default_factory=lambda: dict(DEFAULT_RETRY_BUDGETS),
+        description="Retries allowed per minute per URL fragment, bounding retry load during outages"
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive 5xx or connection failures on an endpoint before requests to it fail fast"
+    )
+    circuit_reset_timeout: float = Field(
+        default=30.0,
+        description="Seconds a failing endpoint is not contacted before a trial request"
+    )
+    pool_connections: int = Field(
+        default=4,
+        description="Number of per-host connection pools kept alive (data.sec.gov, www.sec.gov, ...)"
+    )
+    pool_maxsize: int = Field(
+        default=10,
+        description="Maximum number of keep-alive connections kept per host"
+    )
+    pool_block: bool = Field(
+        default=False,
+        description="Block when a host's pool is exhausted instead of opening extra connections"
+    )
+    max_concurrency: int = Field(
+        default=10,
+        description="Maximum number of concurrent fetches for multi-company tools such as peer comparison"
+    )
+    stream_company_facts: bool = Field(
+        default=False,
+        description="Decode companyfacts incrementally, keeping only the concepts a tool needs "
+                    "(uses ijson when installed; see the 'stream' extra)"
+    )
+    warehouse_path: Optional[str] = Field(
+        default=None,
+        description="SQLite warehouse built by 'sec-edgar-warehouse ingest'; submissions, company facts "
+                    "and tickers it holds are served offline instead of over HTTP"
+    )
+    parsed_cache_size: int = Field(
+        default=32,
+        description="Parsed per-company objects (filing indexes, company facts) kept in memory for "
+                    "chained tool calls; 0 disables"
+    )
+    parsed_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a parsed per-company object is reused before it is fetched again"
+    )
+    offline: bool = Field(
+        default=False,
+        description="Never touch the network: serve only what the warehouse and the response cache "
+                    "(at any age) hold"
+    )
+    base_url: str = Field(
+        default=SEC_DATA_URL,
+        description="Root of the SEC JSON APIs (submissions, company facts); point at a local stand-in for tests"
+    )
+    tickers_url: str = Field(
+        default=SEC_TICKERS_URL,
+        description="URL of company_tickers.json"
+    )
+    output_format: Literal["text", "compact", "structured"] = Field(
+        default="text",
+        description="Data tool output: 'text' (indented JSON and reports), 'compact' (minified JSON "
+                    "with abbreviated keys) or 'structured' (result models from "
+                    "sec_edgar_langchain.results, serialized compactly only when shown to the model)"
     )
 
 
@@ -35,398 +220,1181 @@ class SECEdgarToolkit:
     - Getting company facts and metadata
     """
     
-    def __init__(self, config: SECEdgarConfig):
+    def __init__(
+        self,
+        config: SECEdgarConfig,
+        cache: Optional[ResponseCache] = None,
+        warehouse: Optional[Warehouse] = None,
+        backend: Optional[EdgarBackend] = None,
+        metrics: Optional[Metrics] = None,
+    ):
         """Initialize the SEC EDGAR toolkit.
         
+        By default data is read from the warehouse (if configured), then over
+        HTTP through the response cache; with ``offline`` the HTTP backend is
+        replaced by the cache alone.
+        
         Args:
             config: Configuration object with user_agent and optional rate limiting
+            cache: Response cache to use instead of the one configured by ``cache_dir``
+            warehouse: Bulk-data warehouse to use instead of the one configured
+                by ``warehouse_path``
+            backend: Data source to use instead of the configured chain, e.g.
+                a :class:`~sec_edgar_langchain.backends.FixtureBackend`
+            metrics: Metrics collector to report to, e.g. one shared by
+                several toolkits (default: a new one)
         """
         self.config = config
-        self.base_url = "https://data.sec.gov"
         self.headers = {
             "User-Agent": config.user_agent,
             "Accept": "application/json"
         }
+        rate = config.max_requests_per_second
+        if config.rate_limit_delay > 0:
+            rate = min(rate, 1.0 / config.rate_limit_delay)
+        self._rate_limiter = get_shared_rate_limiter(rate=rate, burst=config.rate_limit_burst)
+        self._owns_cache = cache is None and config.cache_dir is not None
+        if self._owns_cache:
+            cache = SQLiteResponseCache(
+                os.path.join(config.cache_dir, "responses.sqlite3"),
+                max_bytes=config.cache_max_bytes,
+            )
+        self._cache = cache
+        self._owns_warehouse = backend is None and warehouse is None and config.warehouse_path is not None
+        if self._owns_warehouse:
+            warehouse = Warehouse(config.warehouse_path)
+        self._warehouse = warehouse
+        self._single_flight = SingleFlight()
+        self._metrics = metrics if metrics is not None else Metrics()
+        self._parsed = ParsedObjectCache(config.parsed_cache_size, config.parsed_cache_ttl)
+        self._retry_policy = RetryPolicy(
+            max_retries=config.max_retries,
+            backoff_base=config.retry_backoff,
+            backoff_max=config.retry_backoff_max,
+            budgets=config.retry_budgets,
+            failure_threshold=config.circuit_failure_threshold,
+            reset_timeout=config.circuit_reset_timeout,
+            rate_limiter=self._rate_limiter,
+        )
+        self._http: Optional[HTTPBackend] = None
+        if backend is None:
+            backends: List[EdgarBackend] = []
+            if warehouse is not None:
+                backends.append(warehouse)
+            if not config.offline:
+                self._http = HTTPBackend(
+                    user_agent=config.user_agent,
+                    base_url=config.base_url,
+                    tickers_url=config.tickers_url,
+                    rate_limiter=self._rate_limiter,
+                    cache=self._cache,
+                    cache_ttls=config.cache_ttls,
+                    pool_connections=config.pool_connections,
+                    pool_maxsize=config.pool_maxsize,
+                    pool_block=config.pool_block,
+                    stream_company_facts=config.stream_company_facts,
+                    single_flight=self._single_flight,
+                    retry_policy=self._retry_policy,
+                    timeout=config.request_timeout,
+                    metrics=self._metrics,
+                )
+                backends.append(self._http)
+            elif self._cache is not None:
+                backends.append(CacheBackend(self._cache, config.base_url, config.tickers_url))
+            backend = backends[0] if len(backends) == 1 else BackendChain(backends)
+        self._backend = backend
+        self._ticker_index: Optional[CompanyTickerIndex] = None
+        self._ticker_index_loaded_at = 0.0
+        self._ticker_index_lock = threading.Lock()
+    
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        """The process-wide limiter shared by all toolkits."""
+        return self._rate_limiter
+    
+    @property
+    def metrics(self) -> Metrics:
+        """Tool and request metrics; register callbacks or exporters with ``add_listener``."""
+        return self._metrics
+    
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry and circuit breaker policy of the HTTP clients."""
+        return self._retry_policy
+    
+    @property
+    def single_flight(self) -> SingleFlight:
+        """Coalescer of the toolkit's concurrent identical HTTP requests."""
+        return self._single_flight
+    
+    @property
+    def parsed_cache(self) -> ParsedObjectCache:
+        """Parsed submissions, filing indexes and company facts reused across tool calls."""
+        return self._parsed
+    
+    @property
+    def backend(self) -> EdgarBackend:
+        """The data source the tools read from."""
+        return self._backend
+    
+    @property
+    def base_url(self) -> str:
+        """Root of the SEC JSON APIs used by the HTTP backend."""
+        return self._http.base_url if self._http is not None else self.config.base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        if self._http is not None:
+            self._http.base_url = value
+    
+    @property
+    def tickers_url(self) -> str:
+        """URL of company_tickers.json used by the HTTP backend."""
+        return self._http.tickers_url if self._http is not None else self.config.tickers_url
+    
+    @tickers_url.setter
+    def tickers_url(self, value: str) -> None:
+        if self._http is not None:
+            self._http.tickers_url = value
+    
+    @property
+    def _client(self) -> Optional[SECEdgarHTTPClient]:
+        return self._http.client if self._http is not None else None
+    
+    @property
+    def _aclient(self) -> Optional[AsyncSECEdgarHTTPClient]:
+        return self._http.aclient if self._http is not None else None
+    
+    def close(self) -> None:
+        """Close the toolkit's pooled HTTP connections, response cache and warehouse."""
+        if self._http is not None:
+            self._http.close()
+        if self._owns_cache and self._cache is not None:
+            self._cache.close()
+            self._owns_cache = False
+        if self._owns_warehouse and self._warehouse is not None:
+            self._warehouse.close()
+            self._owns_warehouse = False
+    
+    def __enter__(self) -> "SECEdgarToolkit":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    async def aclose(self) -> None:
+        """Close the async and sync HTTP clients and the response cache."""
+        if self._http is not None:
+            await self._http.aclose()
+        self.close()
+    
+    async def __aenter__(self) -> "SECEdgarToolkit":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
     
     def get_tools(self) -> List[Tool]:
         """Get all available SEC EDGAR tools.
         
+        Every tool has both a sync ``func`` and an async ``coroutine``, so
+        async agents never block the event loop on network I/O. Both report
+        their latency to :attr:`metrics`.
+        
         Returns:
             List of LangChain Tool objects
         """
-        return [
+        tools = [
             Tool(
                 name="sec_edgar_cik_lookup",
                 description="Look up a company's CIK (Central Index Key) number by name or ticker symbol. "
                            "Input: company name or ticker. Output: CIK number and company info.",
-                func=self._lookup_cik
+                func=self._lookup_cik,
+                coroutine=self._alookup_cik
             ),
             Tool(
                 name="sec_edgar_company_info",
                 description="Get detailed company information from SEC EDGAR. "
                            "Input: CIK number or ticker. Output: Company details including name, SIC, location, fiscal year end.",
-                func=self._get_company_info
+                func=self._get_company_info,
+                coroutine=self._aget_company_info
             ),
             Tool(
                 name="sec_edgar_company_facts",
                 description="Get XBRL company facts (financial data points). "
-                           "Input: CIK number. Output: All available XBRL facts including revenues, assets, etc.",
-                func=self._get_company_facts
+                           "Input: CIK number, or JSON with 'cik' and optional 'concepts' (any us-gaap, ifrs-full or dei "
+                           "concept, e.g. ['us-gaap:GrossProfit', 'dei:EntityCommonStockSharesOutstanding']), "
+                           "'years' (trailing window) or 'fiscal_year' / 'fiscal_period' (e.g. 2023, 'FY'). "
+                           "Output: Latest revenues, net income, assets and EPS, or the requested concepts' values.",
+                func=self._get_company_facts,
+                coroutine=self._aget_company_facts
             ),
             Tool(
                 name="sec_edgar_filing_search",
                 description="Search for SEC filings by company and form type. "
                            "Input: JSON with 'cik' and optional 'form_type' (10-K, 10-Q, 8-K, etc.), 'date_from', 'date_to'. "
                            "Output: List of filings with dates and URLs.",
-                func=self._search_filings
+                func=self._search_filings,
+                coroutine=self._asearch_filings
             ),
             Tool(
                 name="sec_edgar_filing_content",
                 description="Extract and parse content from a specific SEC filing. "
-                           "Input: Filing URL or accession number. Output: Parsed filing content.",
-                func=self._get_filing_content
+                           "Input: Filing URL, or JSON with 'url' and optional 'section' (e.g. 'Item 1A', "
+                           "'Item 7', 'Risk Factors'), 'offset' and 'length' to page through long documents. "
+                           "Output: Parsed filing text.",
+                func=self._get_filing_content,
+                coroutine=self._aget_filing_content
             ),
             Tool(
                 name="sec_edgar_financial_statements",
                 description="Extract financial statements from 10-K or 10-Q filings. "
                            "Input: JSON with 'cik' and 'period' (e.g., '2023-Q4' or '2023'). "
                            "Output: Income statement, balance sheet, and cash flow data.",
-                func=self._get_financial_statements
+                func=self._get_financial_statements,
+                coroutine=self._aget_financial_statements
             ),
             Tool(
                 name="sec_edgar_insider_trading",
                 description="Get insider trading data (Form 4 filings). "
                            "Input: JSON with 'cik' and optional 'days_back' (default 90). "
                            "Output: Recent insider transactions with amounts and dates.",
-                func=self._get_insider_trading
+                func=self._get_insider_trading,
+                coroutine=self._aget_insider_trading
             ),
             Tool(
                 name="sec_edgar_8k_events",
                 description="Get recent 8-K material events for a company. "
                            "Input: CIK number. Output: List of recent 8-K events with descriptions.",
-                func=self._get_8k_events
+                func=self._get_8k_events,
+                coroutine=self._aget_8k_events
             ),
             Tool(
                 name="sec_edgar_compare_financials",
-                description="Compare financial metrics between two companies. "
-                           "Input: JSON with 'cik1', 'cik2', and 'metrics' list. "
-                           "Output: Side-by-side comparison of requested metrics.",
-                func=self._compare_financials
+                description="Compare financial metrics across a peer group of companies. "
+                           "Input: JSON with 'ciks' list (or 'cik1' and 'cik2') and optional 'metrics' list "
+                           "(revenue, net_income, assets, liabilities, equity, cash, operating_income, eps, "
+                           "or any XBRL concept such as 'us-gaap:GrossProfit'). "
+                           "Output: Side-by-side table with one column per company.",
+                func=self._compare_financials,
+                coroutine=self._acompare_financials
             )
         ]
+        for tool in tools:
+            tool.func = self._timed(tool.name, tool.func)
+            tool.coroutine = self._atimed(tool.name, tool.coroutine)
+        return tools
+    
+    def _observe_tool(self, name: str, started: float, output: Any) -> None:
+        error = output is None or (isinstance(output, str) and output.startswith("Error"))
+        self._metrics.observe_tool(
+            name,
+            duration=time.perf_counter() - started,
+            error=error,
+            size=len(output) if isinstance(output, str) else 0,
+        )
+    
+    def _timed(self, name: str, func: Callable[..., ToolOutput]) -> Callable[..., ToolOutput]:
+        """Wrap a tool function to report its latency to :attr:`metrics`."""
+        @wraps(func)
+        def run(*args: Any, **kwargs: Any) -> ToolOutput:
+            started = time.perf_counter()
+            output = None
+            try:
+                output = func(*args, **kwargs)
+                return output
+            finally:
+                self._observe_tool(name, started, output)
+        return run
+    
+    def _atimed(self, name: str, coroutine: Callable[..., Any]) -> Callable[..., Any]:
+        """Async variant of :meth:`_timed`."""
+        @wraps(coroutine)
+        async def run(*args: Any, **kwargs: Any) -> ToolOutput:
+            started = time.perf_counter()
+            output = None
+            try:
+                output = await coroutine(*args, **kwargs)
+                return output
+            finally:
+                self._observe_tool(name, started, output)
+        return run
+    
+    @staticmethod
+    def _require(data: Optional[Dict[str, Any]], what: str) -> Dict[str, Any]:
+        if data is None:
+            raise LookupError(f"{what} not available from any data source")
+        return data
+    
+    def _company_tickers(self) -> Dict[str, Any]:
+        return self._require(self._backend.company_tickers(), "Company tickers")
+    
+    async def _acompany_tickers(self) -> Dict[str, Any]:
+        return self._require(await self._backend.acompany_tickers(), "Company tickers")
+    
+    def _submissions(self, cik: str) -> Dict[str, Any]:
+        return self._require(self._backend.submissions(cik), f"Submissions for CIK {cik}")
+    
+    async def _asubmissions(self, cik: str) -> Dict[str, Any]:
+        return self._require(await self._backend.asubmissions(cik), f"Submissions for CIK {cik}")
+    
+    def _submissions_page(self, name: str) -> Dict[str, Any]:
+        return self._require(self._backend.submissions_page(name), f"Submissions page {name}")
+    
+    async def _asubmissions_page(self, name: str) -> Dict[str, Any]:
+        return self._require(await self._backend.asubmissions_page(name), f"Submissions page {name}")
     
-    def _make_request(self, url: str) -> Dict[str, Any]:
-        """Make HTTP request to SEC EDGAR API with rate limiting."""
-        import time
-        time.sleep(self.config.rate_limit_delay)
+    def _request_company_facts(self, cik: str, concepts: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetch a companyfacts payload; backends may decode only ``concepts``."""
+        return self._require(self._backend.company_facts(cik, concepts), f"Company facts for CIK {cik}")
+    
+    async def _arequest_company_facts(self, cik: str, concepts: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Async variant of :meth:`_request_company_facts`."""
+        return self._require(
+            await self._backend.acompany_facts(cik, concepts), f"Company facts for CIK {cik}"
+        )
+    
+    # Parsed objects shared by chained tool calls (see ParsedObjectCache)
+    
+    def _cached_submissions(self, cik: str) -> Dict[str, Any]:
+        return self._parsed.get_or_build(("submissions", cik, None), lambda: self._submissions(cik))
+    
+    async def _acached_submissions(self, cik: str) -> Dict[str, Any]:
+        key = ("submissions", cik, None)
+        data = self._parsed.get(key)
+        if data is None:
+            data = await self._asubmissions(cik)
+            self._parsed.put(key, data)
+        return data
+    
+    def _cached_company_facts(self, cik: str, concepts: Optional[List[str]]) -> Optional[CompanyFacts]:
+        """A cached store covering ``concepts`` (or everything)."""
+        wanted = None if concepts is None else frozenset(concepts)
+        return self._parsed.find(
+            "facts", cik, lambda variant: variant is None or (wanted is not None and wanted <= variant)
+        )
+    
+    def _store_company_facts(self, cik: str, facts: CompanyFacts) -> CompanyFacts:
+        # Keyed by what the payload holds: backends that ignore ``concepts``
+        # return the whole document, which then serves every later request
+        self._parsed.put(("facts", cik, facts.selected_concepts), facts)
+        return facts
+    
+    def _company_facts(self, cik: str, concepts: Optional[List[str]] = None) -> CompanyFacts:
+        """Company facts store for ``cik``; backends may decode only ``concepts``."""
+        facts = self._cached_company_facts(cik, concepts)
+        if facts is None:
+            facts = self._store_company_facts(cik, CompanyFacts(self._request_company_facts(cik, concepts)))
+        return facts
+    
+    async def _acompany_facts(self, cik: str, concepts: Optional[List[str]] = None) -> CompanyFacts:
+        """Async variant of :meth:`_company_facts`."""
+        facts = self._cached_company_facts(cik, concepts)
+        if facts is None:
+            facts = self._store_company_facts(cik, CompanyFacts(await self._arequest_company_facts(cik, concepts)))
+        return facts
+    
+    @staticmethod
+    def _normalize_cik(cik: str) -> str:
+        """Extract a zero-padded CIK from raw tool input such as 'CIK: 320193, Name: ...'.
         
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        Memoized: agents pass the same few CIK strings between tools.
+        """
+        return _normalize_cik(cik)
+    
+    @staticmethod
+    def _parse_params(params: Any) -> Dict[str, Any]:
+        """Parse JSON tool input, treating plain strings as a CIK."""
+        if isinstance(params, str):
+            return json.loads(params) if params.startswith('{') else {"cik": params}
+        return params
+    
+    def _ticker_index_stale(self, now: float) -> bool:
+        return (
+            self._ticker_index is None
+            or now - self._ticker_index_loaded_at > self.config.ticker_index_ttl
+        )
+    
+    def _get_ticker_index(self) -> CompanyTickerIndex:
+        """Return the company ticker index, loading it once per TTL."""
+        with self._ticker_index_lock:
+            now = time.monotonic()
+            if self._ticker_index_stale(now):
+                try:
+                    tickers = self._company_tickers()
+                    self._ticker_index = CompanyTickerIndex.from_company_tickers(tickers)
+                    self._ticker_index_loaded_at = now
+                except Exception:
+                    if self._ticker_index is None:
+                        raise
+                    logger.warning("Refreshing company tickers failed, serving stale index", exc_info=True)
+            return self._ticker_index
+    
+    async def _aget_ticker_index(self) -> CompanyTickerIndex:
+        """Async variant of :meth:`_get_ticker_index`."""
+        if not self._ticker_index_stale(time.monotonic()):
+            return self._ticker_index
+        # Coroutines missing the index share one load, as threads do via the lock
+        return await self._single_flight.ado("ticker_index", self._aload_ticker_index)
+    
+    async def _aload_ticker_index(self) -> CompanyTickerIndex:
+        now = time.monotonic()
+        if not self._ticker_index_stale(now):
+            # Another load finished while this one waited to start
+            return self._ticker_index
+        try:
+            tickers = await self._acompany_tickers()
+        except Exception:
+            if self._ticker_index is None:
+                raise
+            logger.warning("Refreshing company tickers failed, serving stale index", exc_info=True)
+            return self._ticker_index
+        index = CompanyTickerIndex.from_company_tickers(tickers)
+        with self._ticker_index_lock:
+            self._ticker_index = index
+            self._ticker_index_loaded_at = now
+        return index
+    
+    @staticmethod
+    def _find_company(company: str, index: CompanyTickerIndex) -> Optional[CompanyEntry]:
+        if company.isdigit():
+            return index.by_cik(company)
+        return index.lookup(company)
+    
+    @staticmethod
+    def _format_cik_lookup(company: str, entry: Optional[CompanyEntry]) -> str:
+        if entry is not None:
+            return f"CIK: {entry.cik}, Name: {entry.name}, Ticker: {entry.ticker or 'N/A'}"
+        return f"Company '{company}' not found in SEC EDGAR database"
     
     def _lookup_cik(self, company: str) -> str:
         """Look up company CIK by name or ticker."""
         # Clean input
         company = company.strip().upper()
+        entry = self._find_company(company, self._get_ticker_index())
         
-        # Try ticker lookup first
-        url = f"{self.base_url}/submissions/CIK{company.zfill(10)}.json"
-        try:
-            data = self._make_request(url)
-            return f"CIK: {data['cik']}, Name: {data['name']}"
-        except:
-            pass
+        if entry is None and company.isdigit():
+            # Registrants without a listed ticker only appear in submissions
+            try:
+                data = self._cached_submissions(company.zfill(10))
+                return f"CIK: {data['cik']}, Name: {data['name']}"
+            except Exception:
+                pass
         
-        # Search by company name
-        tickers_url = "https://www.sec.gov/files/company_tickers.json"
-        response = requests.get(tickers_url, headers=self.headers)
-        tickers = response.json()
+        return self._format_cik_lookup(company, entry)
+    
+    async def _alookup_cik(self, company: str) -> str:
+        """Async variant of :meth:`_lookup_cik`."""
+        company = company.strip().upper()
+        entry = self._find_company(company, await self._aget_ticker_index())
         
-        for item in tickers.values():
-            if company in item.get('ticker', '').upper() or company in item.get('title', '').upper():
-                cik = str(item['cik_str']).zfill(10)
-                return f"CIK: {cik}, Name: {item['title']}, Ticker: {item.get('ticker', 'N/A')}"
+        if entry is None and company.isdigit():
+            try:
+                data = await self._acached_submissions(company.zfill(10))
+                return f"CIK: {data['cik']}, Name: {data['name']}"
+            except Exception:
+                pass
         
-        return f"Company '{company}' not found in SEC EDGAR database"
+        return self._format_cik_lookup(company, entry)
     
-    def _get_company_info(self, cik: str) -> str:
-        """Get detailed company information."""
-        # Extract CIK if full response provided
-        if "CIK:" in cik:
-            cik = cik.split("CIK:")[1].split(",")[0].strip()
+    def _render(self, result: ToolResult, text: Callable[[Any], str]) -> ToolOutput:
+        """Return a tool result in the configured output format.
         
-        cik = cik.strip().lstrip('0').zfill(10)
-        url = f"{self.base_url}/submissions/CIK{cik}.json"
+        Args:
+            result: Structured result of the tool
+            text: Renders ``result`` in the default text format
+        """
+        output_format = self.config.output_format
+        if output_format == "structured":
+            return result
+        if output_format == "compact":
+            return result.to_compact()
+        return text(result)
+    
+    @staticmethod
+    def _company_info(data: Dict[str, Any]) -> CompanyInfo:
+        business = data.get('addresses', {}).get('business') or {}
+        address = None
+        if business:
+            address = (
+                f"{business.get('street1') or ''}, "
+                f"{business.get('city') or ''}, "
+                f"{business.get('stateOrCountry') or ''} "
+                f"{business.get('zipCode') or ''}"
+            )
+        cik = data.get("cik")
+        return CompanyInfo(
+            name=data.get("name"),
+            cik=str(cik) if cik is not None else None,
+            ticker=data["tickers"][0] if data.get("tickers") else None,
+            exchange=data["exchanges"][0] if data.get("exchanges") else None,
+            sic=data.get("sic") or None,
+            sic_description=data.get("sicDescription") or None,
+            industry=data.get("category") or None,
+            fiscal_year_end=data.get("fiscalYearEnd") or None,
+            state=data.get("stateOfIncorporation") or None,
+            phone=data.get("phone") or None,
+            address=address,
+            website=data.get("website") or None,
+            employees=data.get("employeeCount"),
+            description=data.get("description") or None,
+        )
+    
+    @staticmethod
+    def _format_company_info(info: CompanyInfo) -> str:
+        text = {
+            "Name": info.name,
+            "CIK": info.cik,
+            "Ticker": info.ticker or "N/A",
+            "Exchange": info.exchange or "N/A",
+            "SIC": f"{info.sic} - {info.sic_description}",
+            "Industry": info.industry or "N/A",
+            "Fiscal Year End": info.fiscal_year_end or "N/A",
+            "State": info.state or "N/A",
+            "Phone": info.phone or "N/A",
+            "Address": info.address or "N/A",
+            "Website": info.website or "N/A",
+            "Employees": info.employees if info.employees is not None else "N/A",
+            "Description": info.description or "N/A"
+        }
         
+        return json.dumps(text, indent=2)
+    
+    def _get_company_info(self, cik: str) -> ToolOutput:
+        """Get detailed company information."""
         try:
-            data = self._make_request(url)
-            
-            info = {
-                "Name": data.get("name"),
-                "CIK": data.get("cik"),
-                "Ticker": data.get("tickers", ["N/A"])[0] if data.get("tickers") else "N/A",
-                "Exchange": data.get("exchanges", ["N/A"])[0] if data.get("exchanges") else "N/A",
-                "SIC": f"{data.get('sic')} - {data.get('sicDescription')}",
-                "Industry": data.get("category", "N/A"),
-                "Fiscal Year End": data.get("fiscalYearEnd", "N/A"),
-                "State": data.get("stateOfIncorporation", "N/A"),
-                "Phone": data.get("phone", "N/A"),
-                "Address": f"{data.get('addresses', {}).get('business', {}).get('street1', '')}, "
-                          f"{data.get('addresses', {}).get('business', {}).get('city', '')}, "
-                          f"{data.get('addresses', {}).get('business', {}).get('stateOrCountry', '')} "
-                          f"{data.get('addresses', {}).get('business', {}).get('zipCode', '')}",
-                "Website": data.get("website", "N/A"),
-                "Employees": data.get("employeeCount", "N/A"),
-                "Description": data.get("description", "N/A")
-            }
-            
-            return json.dumps(info, indent=2)
+            data = self._cached_submissions(self._normalize_cik(cik))
+            return self._render(self._company_info(data), self._format_company_info)
         except Exception as e:
             return f"Error fetching company info: {str(e)}"
     
-    def _get_company_facts(self, cik: str) -> str:
-        """Get XBRL company facts."""
-        # Extract CIK if needed
-        if "CIK:" in cik:
-            cik = cik.split("CIK:")[1].split(",")[0].strip()
-        
-        cik = cik.strip().lstrip('0').zfill(10)
-        url = f"{self.base_url}/api/xbrl/companyfacts/CIK{cik}.json"
-        
+    async def _aget_company_info(self, cik: str) -> ToolOutput:
+        """Async variant of :meth:`_get_company_info`."""
         try:
-            data = self._make_request(url)
-            facts = data.get("facts", {})
-            
-            # Extract key financial metrics
+            data = await self._acached_submissions(self._normalize_cik(cik))
+            return self._render(self._company_info(data), self._format_company_info)
+        except Exception as e:
+            return f"Error fetching company info: {str(e)}"
+    
+    def _parse_facts_params(self, params: Any) -> Dict[str, Any]:
+        params = self._parse_params(params)
+        concepts = params.get("concepts") or []
+        if isinstance(concepts, str):
+            concepts = [c.strip() for c in concepts.split(",") if c.strip()]
+        fiscal_year = params.get("fiscal_year")
+        years = params.get("years")
+        return {
+            "cik": self._normalize_cik(str(params.get("cik", ""))),
+            "concepts": concepts,
+            "years": int(years) if years else None,
+            "fiscal_year": int(fiscal_year) if fiscal_year else None,
+            "fiscal_period": params.get("fiscal_period") or None,
+        }
+    
+    @staticmethod
+    def _facts_concepts(concepts: List[str]) -> List[str]:
+        """Concepts the company facts tool will read, for streaming decode."""
+        return list(concepts) or [f"us-gaap:{concept}" for concept in COMPANY_FACTS_SUMMARY.values()]
+    
+    @staticmethod
+    def _fact_value(fact: Fact, with_unit: bool = False) -> FactValue:
+        return FactValue(
+            value=fact.value,
+            period=fact.end,
+            start=fact.start or None,
+            form=fact.form,
+            fiscal_period=f"{fact.fp} {fact.fy}" if fact.fy else None,
+            unit=fact.unit if with_unit else None,
+        )
+    
+    @staticmethod
+    def _fact_summary(value: FactValue, unit: str) -> Dict[str, Any]:
+        summary = {
+            "value": SECEdgarToolkit._format_value(value.value, unit),
+            "period": value.period,
+            "form": value.form,
+        }
+        if value.start:
+            summary["start"] = value.start
+        if value.fiscal_period:
+            summary["fiscal_period"] = value.fiscal_period
+        return summary
+    
+    def _select_company_facts(
+        self,
+        facts: CompanyFacts,
+        cik: str,
+        concepts: Optional[List[str]] = None,
+        years: Optional[int] = None,
+        fiscal_year: Optional[int] = None,
+        fiscal_period: Optional[str] = None,
+    ) -> CompanyFactsResult:
+        """Pick the requested periods, or the latest key metrics when no concepts are given."""
+        selected: List[ConceptValues] = []
+        if not concepts:
+            # Key financial metrics
+            for concept in COMPANY_FACTS_SUMMARY.values():
+                series = facts.series(f"us-gaap:{concept}")
+                fact = series.latest() if series is not None else None
+                if fact is not None:
+                    selected.append(ConceptValues(
+                        concept=series.name, label=series.label, unit=series.unit, values=[self._fact_value(fact)]
+                    ))
+        
+        for concept in concepts or []:
+            series = facts.series(concept)
+            if series is None:
+                selected.append(ConceptValues(concept=concept))
+                continue
+            if fiscal_year is not None:
+                periods = series.by_fiscal_period(fiscal_year, fiscal_period)
+            elif years:
+                periods = series.trailing_years(years, fiscal_period)
+            else:
+                latest = series.latest()
+                periods = [latest] if latest is not None else []
+            selected.append(ConceptValues(
+                concept=series.name,
+                label=series.label,
+                unit=series.unit,
+                values=[self._fact_value(fact) for fact in reversed(periods)],
+            ))
+        return CompanyFactsResult(cik=cik, entity_name=facts.entity_name or None, concepts=selected)
+    
+    def _format_company_facts(self, result: CompanyFactsResult, summary: bool = False) -> str:
+        if summary:
+            labels = {f"us-gaap:{concept}": label for label, concept in COMPANY_FACTS_SUMMARY.items()}
             metrics = {}
-            
-            # US-GAAP facts
-            if "us-gaap" in facts:
-                gaap = facts["us-gaap"]
-                
-                # Revenue
-                if "Revenues" in gaap:
-                    revenues = gaap["Revenues"]["units"]["USD"]
-                    latest_revenue = max(revenues, key=lambda x: x["end"])
-                    metrics["Latest Revenue"] = {
-                        "value": f"${latest_revenue['val']:,.0f}",
-                        "period": latest_revenue["end"],
-                        "form": latest_revenue["form"]
-                    }
-                
-                # Net Income
-                if "NetIncomeLoss" in gaap:
-                    net_income = gaap["NetIncomeLoss"]["units"]["USD"]
-                    latest_ni = max(net_income, key=lambda x: x["end"])
-                    metrics["Latest Net Income"] = {
-                        "value": f"${latest_ni['val']:,.0f}",
-                        "period": latest_ni["end"],
-                        "form": latest_ni["form"]
-                    }
-                
-                # Total Assets
-                if "Assets" in gaap:
-                    assets = gaap["Assets"]["units"]["USD"]
-                    latest_assets = max(assets, key=lambda x: x["end"])
-                    metrics["Total Assets"] = {
-                        "value": f"${latest_assets['val']:,.0f}",
-                        "period": latest_assets["end"],
-                        "form": latest_assets["form"]
-                    }
-                
-                # EPS
-                if "EarningsPerShareBasic" in gaap:
-                    eps = gaap["EarningsPerShareBasic"]["units"]["USD/shares"]
-                    latest_eps = max(eps, key=lambda x: x["end"])
-                    metrics["EPS (Basic)"] = {
-                        "value": f"${latest_eps['val']:.2f}",
-                        "period": latest_eps["end"],
-                        "form": latest_eps["form"]
-                    }
-            
+            for entry in result.concepts:
+                value = entry.values[0]
+                metrics[labels[entry.concept]] = {
+                    "value": self._format_value(value.value, entry.unit),
+                    "period": value.period,
+                    "form": value.form,
+                }
             return json.dumps(metrics, indent=2) if metrics else "No financial facts available"
-            
+        
+        results: Dict[str, Any] = {}
+        for entry in result.concepts:
+            if entry.unit is None:
+                results[entry.concept] = "Not reported"
+                continue
+            results[entry.concept] = {
+                "label": entry.label,
+                "unit": entry.unit,
+                "values": [self._fact_summary(value, entry.unit) for value in entry.values],
+            }
+        return json.dumps(results, indent=2)
+    
+    def _render_company_facts(self, facts: CompanyFacts, query: Dict[str, Any]) -> ToolOutput:
+        result = self._select_company_facts(facts, **query)
+        return self._render(result, lambda r: self._format_company_facts(r, summary=not query["concepts"]))
+    
+    def _get_company_facts(self, params: str) -> ToolOutput:
+        """Get XBRL company facts."""
+        try:
+            query = self._parse_facts_params(params)
+            facts = self._company_facts(query["cik"], self._facts_concepts(query["concepts"]))
+            return self._render_company_facts(facts, query)
+        except Exception as e:
+            return f"Error fetching company facts: {str(e)}"
+    
+    async def _aget_company_facts(self, params: str) -> ToolOutput:
+        """Async variant of :meth:`_get_company_facts`."""
+        try:
+            query = self._parse_facts_params(params)
+            facts = await self._acompany_facts(query["cik"], self._facts_concepts(query["concepts"]))
+            return self._render_company_facts(facts, query)
         except Exception as e:
             return f"Error fetching company facts: {str(e)}"
     
-    def _search_filings(self, params: str) -> str:
+    def _parse_search_params(self, params: Any) -> Dict[str, str]:
+        params = self._parse_params(params)
+        return {
+            "cik": self._normalize_cik(params.get("cik", "")),
+            "form_type": params.get("form_type", ""),
+            "date_from": params.get("date_from", ""),
+            "date_to": params.get("date_to", ""),
+        }
+    
+    def _load_filing_index(self, cik: str, date_from: str = "", date_to: str = "") -> FilingIndex:
+        """Index a company's filings, pulling in overflow pages the date range needs.
+        
+        Older history of large filers lives in ``filings.files`` pages; they
+        are only fetched (concurrently, through the response cache) when the
+        range reaches back past ``filings.recent``. Indexes are kept in the
+        parsed-object cache per set of merged pages.
+        """
+        data = self._cached_submissions(cik)
+        names = overflow_pages(data, date_from, date_to)
+        key = ("filings", cik, tuple(names))
+        index = self._parsed.get(key)
+        if index is not None:
+            return index
+        
+        pages: List[Dict[str, Any]] = []
+        if names:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(names), self.config.max_concurrency))) as pool:
+                pages = list(pool.map(self._submissions_page, names))
+        index = FilingIndex.from_submissions(data, pages)
+        self._parsed.put(key, index)
+        return index
+    
+    async def _aload_filing_index(self, cik: str, date_from: str = "", date_to: str = "") -> FilingIndex:
+        """Async variant of :meth:`_load_filing_index`."""
+        data = await self._acached_submissions(cik)
+        names = overflow_pages(data, date_from, date_to)
+        key = ("filings", cik, tuple(names))
+        index = self._parsed.get(key)
+        if index is not None:
+            return index
+        
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def fetch(name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._asubmissions_page(name)
+        
+        pages = await asyncio.gather(*(fetch(name) for name in names))
+        index = FilingIndex.from_submissions(data, pages)
+        self._parsed.put(key, index)
+        return index
+    
+    @staticmethod
+    def _select_filings(
+        index: FilingIndex, cik: str, form_type: str, date_from: str, date_to: str
+    ) -> FilingList:
+        rows = index.search(form_type, date_from, date_to, limit=FILING_SEARCH_LIMIT)
+        return FilingList(
+            cik=cik,
+            form_type=form_type or None,
+            date_from=date_from or None,
+            date_to=date_to or None,
+            filings=[Filing(**index.filing(row, cik)) for row in rows],
+        )
+    
+    def _find_filings(self, search: Dict[str, str]) -> FilingList:
+        """Filings matching parsed search params, newest first."""
+        index = self._load_filing_index(search["cik"], search["date_from"], search["date_to"])
+        return self._select_filings(index, **search)
+    
+    async def _afind_filings(self, search: Dict[str, str]) -> FilingList:
+        """Async variant of :meth:`_find_filings`."""
+        index = await self._aload_filing_index(search["cik"], search["date_from"], search["date_to"])
+        return self._select_filings(index, **search)
+    
+    @staticmethod
+    def _format_filings(result: FilingList) -> str:
+        if not result.filings:
+            return f"No {result.form_type or ''} filings found for CIK {result.cik}"
+        
+        return json.dumps([filing.model_dump() for filing in result.filings], indent=2)
+    
+    def _search_filings(self, params: str) -> ToolOutput:
         """Search for SEC filings."""
         try:
-            # Parse input parameters
-            if isinstance(params, str):
-                params = json.loads(params) if params.startswith('{') else {"cik": params}
-            
-            cik = params.get("cik", "").strip()
-            if "CIK:" in cik:
-                cik = cik.split("CIK:")[1].split(",")[0].strip()
-            
-            cik = cik.lstrip('0').zfill(10)
-            form_type = params.get("form_type", "")
-            date_from = params.get("date_from", "")
-            date_to = params.get("date_to", "")
-            
-            url = f"{self.base_url}/submissions/CIK{cik}.json"
-            data = self._make_request(url)
-            
-            recent_filings = data.get("filings", {}).get("recent", {})
-            
-            results = []
-            for i in range(min(len(recent_filings.get("form", [])), 50)):  # Limit to 50 most recent
-                form = recent_filings["form"][i]
-                
-                # Filter by form type if specified
-                if form_type and form_type.upper() not in form.upper():
-                    continue
-                
-                filing_date = recent_filings["filingDate"][i]
-                
-                # Filter by date range if specified
-                if date_from and filing_date < date_from:
-                    continue
-                if date_to and filing_date > date_to:
-                    continue
-                
-                results.append({
-                    "form": form,
-                    "filing_date": filing_date,
-                    "accession": recent_filings["accessionNumber"][i],
-                    "primary_document": recent_filings["primaryDocument"][i],
-                    "description": recent_filings.get("primaryDocDescription", [""])[i],
-                    "url": f"https://www.sec.gov/Archives/edgar/data/{cik}/{recent_filings['accessionNumber'][i].replace('-', '')}/{recent_filings['primaryDocument'][i]}"
-                })
-            
-            if not results:
-                return f"No {form_type if form_type else ''} filings found for CIK {cik}"
-            
-            return json.dumps(results[:20], indent=2)  # Return top 20 results
-            
+            search = self._parse_search_params(params)
+            return self._render(self._find_filings(search), self._format_filings)
+        except Exception as e:
+            return f"Error searching filings: {str(e)}"
+    
+    async def _asearch_filings(self, params: str) -> ToolOutput:
+        """Async variant of :meth:`_search_filings`."""
+        try:
+            search = self._parse_search_params(params)
+            return self._render(await self._afind_filings(search), self._format_filings)
         except Exception as e:
             return f"Error searching filings: {str(e)}"
     
-    def _get_filing_content(self, filing_url: str) -> str:
-        """Extract content from a specific filing."""
+    @staticmethod
+    def _parse_filing_content_params(params: str) -> Dict[str, Any]:
+        params = params.strip()
+        if params.startswith('{'):
+            parsed = json.loads(params)
+        else:
+            parsed = {"url": params}
+        return {
+            "url": parsed.get("url", "").strip(),
+            "section": parsed.get("section") or None,
+            "offset": int(parsed.get("offset", 0)),
+            "length": int(parsed.get("length", FILING_PAGE_LENGTH)),
+        }
+    
+    @staticmethod
+    def _format_filing_content(reader: FilingTextReader) -> str:
+        if not reader.section_found:
+            return f"Section Item {reader.section} not found in filing"
+        
+        text = reader.text
+        end = reader.offset + len(text)
+        label = f"Item {reader.section}" if reader.section else "Filing"
+        content = f"{label} content (characters {reader.offset}-{end}):\n{text}"
+        if reader.has_more:
+            content += f"\n\n[More content available: call again with offset {end}]"
+        return content
+    
+    def _get_filing_content(self, params: str) -> str:
+        """Extract content from a specific filing.
+        
+        The document is streamed and parsed incrementally; the download stops
+        as soon as the requested section or page has been extracted.
+        """
         try:
+            params = self._parse_filing_content_params(params)
+            
             # Handle accession number or full URL
-            if not filing_url.startswith("http"):
+            if not params["url"].startswith("http"):
                 return "Please provide a full filing URL from sec_edgar_filing_search"
             
-            # Get filing content (limited to text extraction for demo)
-            response = requests.get(filing_url, headers=self.headers)
-            response.raise_for_status()
+            document = self._backend.open_document(params["url"])
+            if document is None:
+                return f"Filing document not available: {params['url']}"
+            with document as chunks:
+                reader = extract_filing_text(
+                    chunks,
+                    section=params["section"],
+                    offset=params["offset"],
+                    length=params["length"],
+                )
             
-            content = response.text[:5000]  # Limit content for demo
-            
-            # Basic parsing - remove HTML tags
-            import re
-            text = re.sub('<[^<]+?>', '', content)
-            text = re.sub(r'\s+', ' ', text).strip()
+            return self._format_filing_content(reader)
+        
+        except Exception as e:
+            return f"Error fetching filing content: {str(e)}"
+    
+    async def _aget_filing_content(self, params: str) -> str:
+        """Async variant of :meth:`_get_filing_content`."""
+        try:
+            params = self._parse_filing_content_params(params)
+            if not params["url"].startswith("http"):
+                return "Please provide a full filing URL from sec_edgar_filing_search"
             
-            return f"Filing content (first 5000 chars):\n{text[:5000]}"
+            reader = FilingTextReader(
+                section=params["section"], offset=params["offset"], length=params["length"]
+            )
+            document = self._backend.aopen_document(params["url"])
+            if document is None:
+                return f"Filing document not available: {params['url']}"
+            async with document as chunks:
+                async for chunk in chunks:
+                    if reader.feed(chunk):
+                        break
+                else:
+                    reader.close()
             
+            return self._format_filing_content(reader)
+        
         except Exception as e:
             return f"Error fetching filing content: {str(e)}"
     
-    def _get_financial_statements(self, params: str) -> str:
+    def _format_financial_statements(self, facts_response: ToolOutput) -> ToolOutput:
+        if self.config.output_format != "text":
+            # Structured and compact results pass through untouched
+            return facts_response
+        return f"Financial Statements:\n{facts_response}"
+    
+    def _get_financial_statements(self, params: str) -> ToolOutput:
         """Extract financial statements from recent filings."""
         try:
-            params = json.loads(params) if isinstance(params, str) and params.startswith('{') else {"cik": params}
+            params = self._parse_params(params)
             cik = params.get("cik", "").strip()
             period = params.get("period", "latest")
             
             # Get company facts for financial data
             facts_response = self._get_company_facts(cik)
             
-            return f"Financial Statements:\n{facts_response}"
-            
+            return self._format_financial_statements(facts_response)
+        
         except Exception as e:
             return f"Error fetching financial statements: {str(e)}"
     
-    def _get_insider_trading(self, params: str) -> str:
-        """Get insider trading data from Form 4 filings."""
+    async def _aget_financial_statements(self, params: str) -> ToolOutput:
+        """Async variant of :meth:`_get_financial_statements`."""
         try:
-            params = json.loads(params) if isinstance(params, str) and params.startswith('{') else {"cik": params}
+            params = self._parse_params(params)
             cik = params.get("cik", "").strip()
-            days_back = params.get("days_back", 90)
-            
-            # Calculate date range
-            date_from = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
             
-            # Search for Form 4 filings
-            search_params = {
-                "cik": cik,
-                "form_type": "4",
-                "date_from": date_from
-            }
-            
-            filings = self._search_filings(json.dumps(search_params))
-            
-            if "Error" in filings or "No" in filings:
-                return f"No insider trading data found for the last {days_back} days"
-            
-            filings_data = json.loads(filings)
-            
-            summary = f"Insider Trading Activity (Last {days_back} days):\n"
-            summary += f"Total Form 4 Filings: {len(filings_data)}\n\n"
-            
-            for filing in filings_data[:10]:  # Show last 10 transactions
-                summary += f"Date: {filing['filing_date']}\n"
-                summary += f"Form: {filing['form']}\n"
-                summary += f"Document: {filing['description']}\n"
-                summary += "-" * 40 + "\n"
-            
-            return summary
+            facts_response = await self._aget_company_facts(cik)
             
+            return self._format_financial_statements(facts_response)
+        
+        except Exception as e:
+            return f"Error fetching financial statements: {str(e)}"
+    
+    def _insider_search_params(self, params: Any) -> Tuple[Dict[str, str], int]:
+        params = self._parse_params(params)
+        days_back = params.get("days_back", 90)
+        
+        # Search for Form 4 filings in the date range
+        search_params = self._parse_search_params({
+            "cik": params.get("cik", "").strip(),
+            "form_type": "4",
+            "date_from": (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        })
+        return search_params, days_back
+    
+    @staticmethod
+    def _format_insider_trading(result: FilingList, days_back: int) -> str:
+        if not result.filings:
+            return f"No insider trading data found for the last {days_back} days"
+        
+        summary = f"Insider Trading Activity (Last {days_back} days):\n"
+        summary += f"Total Form 4 Filings: {len(result.filings)}\n\n"
+        
+        for filing in result.filings[:10]:  # Show last 10 transactions
+            summary += f"Date: {filing.filing_date}\n"
+            summary += f"Form: {filing.form}\n"
+            summary += f"Document: {filing.description or 'N/A'}\n"
+            summary += "-" * 40 + "\n"
+        
+        return summary
+    
+    def _get_insider_trading(self, params: str) -> ToolOutput:
+        """Get insider trading data from Form 4 filings."""
+        try:
+            search_params, days_back = self._insider_search_params(params)
+            return self._render(
+                self._find_filings(search_params), lambda r: self._format_insider_trading(r, days_back)
+            )
+        
+        except Exception as e:
+            return f"Error fetching insider trading data: {str(e)}"
+    
+    async def _aget_insider_trading(self, params: str) -> ToolOutput:
+        """Async variant of :meth:`_get_insider_trading`."""
+        try:
+            search_params, days_back = self._insider_search_params(params)
+            return self._render(
+                await self._afind_filings(search_params), lambda r: self._format_insider_trading(r, days_back)
+            )
+        
         except Exception as e:
             return f"Error fetching insider trading data: {str(e)}"
     
-    def _get_8k_events(self, cik: str) -> str:
+    def _8k_search_params(self, cik: str) -> Dict[str, str]:
+        return self._parse_search_params({
+            "cik": cik,
+            "form_type": "8-K",
+            "date_from": (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
+        })
+    
+    @staticmethod
+    def _format_8k_events(result: FilingList) -> str:
+        if not result.filings:
+            return "No recent 8-K events found"
+        
+        events = f"Recent 8-K Material Events:\n"
+        events += f"Total 8-K Filings (Last 90 days): {len(result.filings)}\n\n"
+        
+        for filing in result.filings[:5]:  # Show last 5 events
+            events += f"Date: {filing.filing_date}\n"
+            events += f"Description: {filing.description if filing.description is not None else 'N/A'}\n"
+            events += f"URL: {filing.url}\n"
+            events += "-" * 40 + "\n"
+        
+        return events
+    
+    def _get_8k_events(self, cik: str) -> ToolOutput:
         """Get recent 8-K material events."""
         try:
-            # Search for 8-K filings
-            search_params = {
-                "cik": cik,
-                "form_type": "8-K",
-                "date_from": (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
-            }
-            
-            filings = self._search_filings(json.dumps(search_params))
-            
-            if "Error" in filings or "No" in filings:
-                return "No recent 8-K events found"
-            
-            filings_data = json.loads(filings)
-            
-            events = f"Recent 8-K Material Events:\n"
-            events += f"Total 8-K Filings (Last 90 days): {len(filings_data)}\n\n"
-            
-            for filing in filings_data[:5]:  # Show last 5 events
-                events += f"Date: {filing['filing_date']}\n"
-                events += f"Description: {filing.get('description', 'N/A')}\n"
-                events += f"URL: {filing['url']}\n"
-                events += "-" * 40 + "\n"
-            
-            return events
-            
+            return self._render(self._find_filings(self._8k_search_params(cik)), self._format_8k_events)
+        
         except Exception as e:
             return f"Error fetching 8-K events: {str(e)}"
     
-    def _compare_financials(self, params: str) -> str:
-        """Compare financial metrics between two companies."""
+    async def _aget_8k_events(self, cik: str) -> ToolOutput:
+        """Async variant of :meth:`_get_8k_events`."""
         try:
-            params = json.loads(params)
+            return self._render(await self._afind_filings(self._8k_search_params(cik)), self._format_8k_events)
+        
+        except Exception as e:
+            return f"Error fetching 8-K events: {str(e)}"
+    
+    @staticmethod
+    def _format_comparison(cik1: str, facts1: ToolOutput, cik2: str, facts2: ToolOutput) -> str:
+        comparison = f"Financial Comparison:\n"
+        comparison += f"Company 1 (CIK: {cik1}):\n{facts1}\n\n"
+        comparison += f"Company 2 (CIK: {cik2}):\n{facts2}\n"
+        return comparison
+    
+    @staticmethod
+    def _latest_metric(facts: CompanyFacts, metric: str) -> Optional[Fact]:
+        """Latest reported value of a comparison metric or raw XBRL concept."""
+        concepts = COMPARISON_METRICS.get(metric.lower())
+        if concepts is None:
+            return facts.latest(metric)
+        for concept in concepts:
+            fact = facts.latest(f"us-gaap:{concept}")
+            if fact is not None:
+                return fact
+        return None
+    
+    @staticmethod
+    def _format_value(value: float, unit: Optional[str]) -> str:
+        if unit == "USD":
+            return f"${value:,.0f}"
+        if unit == "USD/shares":
+            return f"${value:.2f}"
+        return f"{value:,}"
+    
+    def _format_metric_value(self, value: Optional[FactValue]) -> str:
+        if value is None:
+            return "N/A"
+        return f"{self._format_value(value.value, value.unit)} ({value.period})"
+    
+    def _peer_comparison(
+        self, results: List[Tuple[str, Optional[CompanyFacts], Optional[str]]], metrics: List[str]
+    ) -> PeerComparison:
+        """Latest value of each metric per company; metrics a company does not report are left out."""
+        companies = []
+        for cik, facts, error in results:
+            if facts is None:
+                companies.append(PeerCompany(cik=cik, error=error))
+                continue
+            values = {}
+            for metric in metrics:
+                fact = self._latest_metric(facts, metric)
+                if fact is not None:
+                    values[metric] = self._fact_value(fact, with_unit=True)
+            companies.append(PeerCompany(cik=cik, name=facts.entity_name or None, values=values))
+        return PeerComparison(metrics=metrics, companies=companies)
+    
+    def _format_peer_comparison(self, comparison: PeerComparison) -> str:
+        """Render one column per company and one row per metric."""
+        headers = ["Metric"]
+        errors = []
+        for company in comparison.companies:
+            if company.error is not None:
+                headers.append(f"CIK {company.cik}")
+                errors.append(f"CIK {company.cik}: {company.error}")
+            else:
+                headers.append(f"{company.name or 'Unknown'} ({company.cik})")
+        
+        rows = [
+            "| " + " | ".join(headers) + " |",
+            "|" + "---|" * len(headers),
+        ]
+        for metric in comparison.metrics:
+            cells = [metric]
+            for company in comparison.companies:
+                cells.append(
+                    "error" if company.error is not None else self._format_metric_value(company.values.get(metric))
+                )
+            rows.append("| " + " | ".join(cells) + " |")
+        
+        comparison_text = f"Peer Comparison ({len(comparison.companies)} companies):\n" + "\n".join(rows) + "\n"
+        if errors:
+            comparison_text += "\nErrors:\n" + "\n".join(errors) + "\n"
+        return comparison_text
+    
+    def _peer_group_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Treat the original ``cik1`` / ``cik2`` pair as a peer group outside text mode.
+        
+        Only the text format keeps the legacy side-by-side layout; structured
+        and compact output always come from :class:`PeerComparison`.
+        """
+        if "ciks" in params or self.config.output_format == "text":
+            return params
+        return {**params, "ciks": [params.get("cik1", ""), params.get("cik2", "")]}
+    
+    def _parse_peer_params(self, params: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        ciks = []
+        for cik in params.get("ciks", []):
+            normalized = self._normalize_cik(str(cik))
+            if normalized not in ciks:
+                ciks.append(normalized)
+        metrics = params.get("metrics") or DEFAULT_COMPARISON_METRICS
+        return ciks, list(metrics)
+    
+    @staticmethod
+    def _metric_concepts(metrics: List[str]) -> List[str]:
+        """XBRL concepts that comparison metrics may be read from."""
+        concepts = []
+        for metric in metrics:
+            candidates = COMPARISON_METRICS.get(metric.lower())
+            if candidates is None:
+                concepts.append(metric)
+            else:
+                concepts.extend(f"us-gaap:{concept}" for concept in candidates)
+        return concepts
+    
+    def _fetch_peer_facts(
+        self, ciks: List[str], concepts: Optional[List[str]] = None
+    ) -> List[Tuple[str, Optional[CompanyFacts], Optional[str]]]:
+        """Fetch company facts for every CIK concurrently, bounded by the rate limiter."""
+        def fetch(cik: str) -> Tuple[str, Optional[CompanyFacts], Optional[str]]:
+            try:
+                return cik, self._company_facts(cik, concepts), None
+            except Exception as e:
+                return cik, None, str(e)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(len(ciks), self.config.max_concurrency))) as pool:
+            return list(pool.map(fetch, ciks))
+    
+    async def _afetch_peer_facts(
+        self, ciks: List[str], concepts: Optional[List[str]] = None
+    ) -> List[Tuple[str, Optional[CompanyFacts], Optional[str]]]:
+        """Async variant of :meth:`_fetch_peer_facts`."""
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def fetch(cik: str) -> Tuple[str, Optional[CompanyFacts], Optional[str]]:
+            async with semaphore:
+                try:
+                    return cik, await self._acompany_facts(cik, concepts), None
+                except Exception as e:
+                    return cik, None, str(e)
+        
+        return list(await asyncio.gather(*(fetch(cik) for cik in ciks)))
+    
+    def _compare_financials(self, params: str) -> ToolOutput:
+        """Compare financial metrics between companies.
+        
+        Accepts either a peer group (``ciks``) or the original ``cik1`` /
+        ``cik2`` pair. Companies are always fetched concurrently.
+        """
+        try:
+            params = self._peer_group_params(json.loads(params))
+            
+            if "ciks" in params:
+                ciks, metrics = self._parse_peer_params(params)
+                if not ciks:
+                    return "Please provide at least one CIK in 'ciks'"
+                results = self._fetch_peer_facts(ciks, self._metric_concepts(metrics))
+                return self._render(self._peer_comparison(results, metrics), self._format_peer_comparison)
+            
             cik1 = params.get("cik1", "").strip()
             cik2 = params.get("cik2", "").strip()
-            metrics = params.get("metrics", ["revenue", "net_income", "assets"])
             
             # Get facts for both companies
-            facts1 = self._get_company_facts(cik1)
-            facts2 = self._get_company_facts(cik2)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                facts1, facts2 = pool.map(self._get_company_facts, [cik1, cik2])
             
-            comparison = f"Financial Comparison:\n"
-            comparison += f"Company 1 (CIK: {cik1}):\n{facts1}\n\n"
-            comparison += f"Company 2 (CIK: {cik2}):\n{facts2}\n"
+            return self._format_comparison(cik1, facts1, cik2, facts2)
+        
+        except Exception as e:
+            return f"Error comparing financials: {str(e)}"
+    
+    async def _acompare_financials(self, params: str) -> ToolOutput:
+        """Async variant of :meth:`_compare_financials`."""
+        try:
+            params = self._peer_group_params(json.loads(params))
+            
+            if "ciks" in params:
+                ciks, metrics = self._parse_peer_params(params)
+                if not ciks:
+                    return "Please provide at least one CIK in 'ciks'"
+                results = await self._afetch_peer_facts(ciks, self._metric_concepts(metrics))
+                return self._render(self._peer_comparison(results, metrics), self._format_peer_comparison)
             
-            return comparison
+            cik1 = params.get("cik1", "").strip()
+            cik2 = params.get("cik2", "").strip()
             
+            facts1, facts2 = await asyncio.gather(
+                self._aget_company_facts(cik1),
+                self._aget_company_facts(cik2),
+            )
+            
+            return self._format_comparison(cik1, facts1, cik2, facts2)
+        
         except Exception as e:
-            return f"Error comparing financials: {str(e)}"
\ No newline at end of file
+            return f"Error comparing financials: {str(e)}"
@@ -0,0 +1,545 @@
+"""Local SQLite warehouse built from SEC's nightly bulk archives.
+
+SEC publishes every company's submissions and XBRL company facts as two
+zip archives, refreshed nightly:
+
+- ``submissions.zip``: one ``CIK##########.json`` per registrant, plus
+  ``CIK##########-submissions-###.json`` overflow pages for large filers
+- ``companyfacts.zip``: one ``CIK##########.json`` companyfacts document per
+  registrant
+
+:func:`ingest` streams the archives member by member (nothing is extracted
+to disk), parses members in a process pool and loads them into one SQLite
+file. :class:`Warehouse` then answers the toolkit's submissions, company
+facts and ticker requests offline, and runs universe-wide queries that
+would otherwise take hours of rate-limited API calls.
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .backends import EdgarBackend
+from .company_facts import _wanted_concepts, mark_selected
+
+logger = logging.getLogger(__name__)
+
+BULK_SUBMISSIONS_URL = "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip"
+BULK_COMPANY_FACTS_URL = "https://www.sec.gov/Archives/edgar/daily-index/xbrl/companyfacts.zip"
+
+# Members parsed per worker task; large enough to amortize pickling overhead
+MEMBERS_PER_TASK = 32
+
+_MEMBER = re.compile(r"CIK(\d{10})(?:-submissions-\d+)?\.json$")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS companies ("
+    " cik INTEGER PRIMARY KEY,"
+    " name TEXT,"
+    " tickers TEXT,"
+    " info BLOB)",
+    "CREATE TABLE IF NOT EXISTS filings ("
+    " cik INTEGER NOT NULL,"
+    " accession TEXT NOT NULL,"
+    " form TEXT,"
+    " filing_date TEXT,"
+    " primary_document TEXT,"
+    " description TEXT,"
+    " PRIMARY KEY (cik, accession)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS filings_form ON filings (form, filing_date)",
+    "CREATE TABLE IF NOT EXISTS concepts ("
+    " taxonomy TEXT NOT NULL,"
+    " concept TEXT NOT NULL,"
+    " label TEXT,"
+    " description TEXT,"
+    " PRIMARY KEY (taxonomy, concept)) WITHOUT ROWID",
+    # ``val`` has no declared type so integers stay integers
+    "CREATE TABLE IF NOT EXISTS facts ("
+    " cik INTEGER NOT NULL,"
+    " taxonomy TEXT NOT NULL,"
+    " concept TEXT NOT NULL,"
+    " unit TEXT NOT NULL,"
+    " start TEXT,"
+    " end TEXT NOT NULL,"
+    " val,"
+    " accn TEXT,"
+    " fy INTEGER,"
+    " fp TEXT,"
+    " form TEXT,"
+    " filed TEXT,"
+    " frame TEXT)",
+    "CREATE INDEX IF NOT EXISTS facts_company ON facts (cik, concept)",
+    "CREATE INDEX IF NOT EXISTS facts_concept ON facts (concept, unit, end)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+)
+
+_FILING_COLUMNS = ("accessionNumber", "form", "filingDate", "primaryDocument", "primaryDocDescription")
+
+
+@dataclass
+class IngestStats:
+    """Row counts loaded by one :func:`ingest` run."""
+
+    members: int = 0
+    companies: int = 0
+    filings: int = 0
+    facts: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+
+# -- worker side -------------------------------------------------------------
+
+# Archives opened by this (worker) process, reused across tasks
+_ARCHIVES: Dict[str, zipfile.ZipFile] = {}
+
+
+def _open_archive(path: str) -> zipfile.ZipFile:
+    archive = _ARCHIVES.get(path)
+    if archive is None:
+        archive = _ARCHIVES[path] = zipfile.ZipFile(path)
+    return archive
+
+
+def _close_archive(path: str) -> None:
+    archive = _ARCHIVES.pop(path, None)
+    if archive is not None:
+        archive.close()
+
+
+def _filing_rows(cik: int, columns: Dict[str, List[Any]]) -> List[Tuple[Any, ...]]:
+    accessions = columns.get("accessionNumber") or []
+    rows = []
+    for row, accession in enumerate(accessions):
+        values = [cik, accession]
+        for name in _FILING_COLUMNS[1:]:
+            column = columns.get(name) or []
+            values.append(column[row] if row < len(column) else "")
+        rows.append(tuple(values))
+    return rows
+
+
+def _parse_submissions(cik: int, data: Dict[str, Any], page: bool) -> Dict[str, Any]:
+    if page:
+        return {"cik": cik, "filings": _filing_rows(cik, data)}
+    info = {key: value for key, value in data.items() if key != "filings"}
+    return {
+        "cik": cik,
+        "name": data.get("name"),
+        "tickers": json.dumps(data.get("tickers") or []),
+        "info": zlib.compress(json.dumps(info).encode("utf-8")),
+        "filings": _filing_rows(cik, data.get("filings", {}).get("recent", {})),
+    }
+
+
+def _parse_company_facts(cik: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    concepts = []
+    facts = []
+    for taxonomy, entries in (data.get("facts") or {}).items():
+        for concept, entry in entries.items():
+            concepts.append((taxonomy, concept, entry.get("label"), entry.get("description")))
+            for unit, rows in (entry.get("units") or {}).items():
+                for row in rows:
+                    facts.append((
+                        cik, taxonomy, concept, unit, row.get("start"), row.get("end"),
+                        row.get("val"), row.get("accn"), row.get("fy"), row.get("fp"),
+                        row.get("form"), row.get("filed"), row.get("frame"),
+                    ))
+    return {"cik": cik, "name": data.get("entityName"), "concepts": concepts, "facts": facts}
+
+
+def _parse_members(path: str, kind: str, names: Sequence[str]) -> List[Dict[str, Any]]:
+    """Parse a batch of archive members into rows (runs in a worker process)."""
+    archive = _open_archive(path)
+    results = []
+    for name in names:
+        cik = int(_MEMBER.search(name).group(1))
+        try:
+            data = json.loads(archive.read(name))
+            if kind == "submissions":
+                result = _parse_submissions(cik, data, page="-submissions-" in name)
+            else:
+                result = _parse_company_facts(cik, data)
+        except Exception as e:
+            result = {"cik": cik, "error": f"{name}: {e}"}
+        results.append(result)
+    return results
+
+
+# -- loader side -------------------------------------------------------------
+
+def _connect(path: str) -> sqlite3.Connection:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    return conn
+
+
+def _write(conn: sqlite3.Connection, kind: str, results: List[Dict[str, Any]], stats: IngestStats) -> None:
+    conn.execute("BEGIN")
+    for result in results:
+        stats.members += 1
+        if "error" in result:
+            stats.errors += 1
+            logger.warning("Skipping unreadable archive member %s", result["error"])
+            continue
+        cik = result["cik"]
+        if kind == "submissions":
+            if "info" in result:
+                conn.execute(
+                    "INSERT INTO companies (cik, name, tickers, info) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (cik) DO UPDATE SET"
+                    " name = excluded.name, tickers = excluded.tickers, info = excluded.info",
+                    (cik, result["name"], result["tickers"], result["info"]),
+                )
+                stats.companies += 1
+            conn.executemany(
+                "INSERT OR REPLACE INTO filings"
+                " (cik, accession, form, filing_date, primary_document, description)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                result["filings"],
+            )
+            stats.filings += len(result["filings"])
+        else:
+            # Keep the submissions name if both archives were loaded
+            conn.execute(
+                "INSERT INTO companies (cik, name) VALUES (?, ?)"
+                " ON CONFLICT (cik) DO UPDATE SET name = COALESCE(companies.name, excluded.name)",
+                (cik, result["name"]),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO concepts (taxonomy, concept, label, description)"
+                " VALUES (?, ?, ?, ?)",
+                result["concepts"],
+            )
+            # A company's facts are replaced wholesale on every refresh
+            conn.execute("DELETE FROM facts WHERE cik = ?", (cik,))
+            conn.executemany(
+                "INSERT INTO facts (cik, taxonomy, concept, unit, start, end, val,"
+                " accn, fy, fp, form, filed, frame) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                result["facts"],
+            )
+            stats.companies += 1
+            stats.facts += len(result["facts"])
+    conn.execute("COMMIT")
+
+
+def _batches(names: List[str], size: int) -> Iterator[List[str]]:
+    for start in range(0, len(names), size):
+        yield names[start:start + size]
+
+
+def _archive_members(path: str, limit: Optional[int]) -> List[str]:
+    with zipfile.ZipFile(path) as archive:
+        names = [name for name in archive.namelist() if _MEMBER.search(name)]
+    # Each main submissions document before its overflow pages, so a
+    # limited load never holds pages without the company they belong to
+    names.sort(key=lambda name: (_MEMBER.search(name).group(1), "-submissions-" in name, name))
+    return names if limit is None else names[:limit]
+
+
+def _load_archive(
+    conn: sqlite3.Connection,
+    path: str,
+    kind: str,
+    workers: int,
+    limit: Optional[int],
+    stats: IngestStats,
+) -> None:
+    names = _archive_members(path, limit)
+    batches = _batches(names, MEMBERS_PER_TASK)
+    if workers <= 1:
+        try:
+            for batch in batches:
+                _write(conn, kind, _parse_members(path, kind, batch), stats)
+        finally:
+            # Worker processes release theirs on exit; this one stays alive
+            _close_archive(path)
+        return
+
+    # A bounded window of in-flight tasks keeps parsed rows from piling up
+    # in memory while the single SQLite writer catches up.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Set[Future] = set()
+        for batch in batches:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _write(conn, kind, future.result(), stats)
+            pending.add(pool.submit(_parse_members, path, kind, batch))
+        for future in pending:
+            _write(conn, kind, future.result(), stats)
+
+
+def ingest(
+    path: str,
+    submissions: Optional[str] = None,
+    company_facts: Optional[str] = None,
+    workers: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> IngestStats:
+    """Load SEC bulk archives into a warehouse, creating it if needed.
+
+    Re-running with a newer archive refreshes the warehouse in place:
+    companies and filings are upserted, and each company's facts are
+    replaced.
+
+    Args:
+        path: Warehouse SQLite file
+        submissions: Path of ``submissions.zip``
+        company_facts: Path of ``companyfacts.zip``
+        workers: Parser processes (default: CPU count); 0 or 1 parses in
+            this process
+        limit: Load only the first ``limit`` members of each archive
+
+    Returns:
+        Counts of the rows loaded
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    stats = IngestStats()
+    started = time.monotonic()
+    conn = _connect(path)
+    try:
+        for kind, archive in (("submissions", submissions), ("companyfacts", company_facts)):
+            if archive is None:
+                continue
+            _load_archive(conn, archive, kind, workers, limit, stats)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (f"{kind}_ingested_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+            )
+            if limit is None:
+                # Every registrant is present; a later partial run keeps that true
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, '1')", (f"{kind}_complete",))
+    finally:
+        conn.close()
+    stats.seconds = time.monotonic() - started
+    return stats
+
+
+class Warehouse(EdgarBackend):
+    """Read access to a warehouse built by :func:`ingest`.
+
+    As a toolkit backend, submissions and company facts are rebuilt in the
+    shape of the ``data.sec.gov`` JSON APIs, so the tools' formatting code
+    is unchanged. Submissions come back with the whole filing history in
+    ``filings.recent`` (no overflow pages to fetch).
+    """
+
+    def __init__(self, path: str):
+        """Open an existing warehouse.
+
+        Args:
+            path: Warehouse SQLite file
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No SEC EDGAR warehouse at {path}; build one with 'sec-edgar-warehouse ingest'")
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = _connect(path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "Warehouse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """Run a read query against the warehouse tables and return all rows."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def counts(self) -> Dict[str, int]:
+        """Row count of each table."""
+        return {
+            table: self.execute(f"SELECT COUNT(*) FROM {table}")[0][0]
+            for table in ("companies", "filings", "concepts", "facts")
+        }
+
+    def submissions(self, cik: str) -> Optional[Dict[str, Any]]:
+        """Submissions payload for ``cik``, with every filing in ``recent``."""
+        rows = self.execute("SELECT info FROM companies WHERE cik = ?", (int(cik),))
+        if not rows or rows[0][0] is None:
+            return None
+        data = json.loads(zlib.decompress(rows[0][0]))
+        filings = self.execute(
+            "SELECT accession, form, filing_date, primary_document, description FROM filings"
+            " WHERE cik = ? ORDER BY filing_date DESC, accession DESC",
+            (int(cik),),
+        )
+        columns = list(zip(*filings)) or [()] * len(_FILING_COLUMNS)
+        data["filings"] = {
+            "recent": {name: list(column) for name, column in zip(_FILING_COLUMNS, columns)},
+            "files": [],
+        }
+        return data
+
+    def company_facts(
+        self, cik: str, concepts: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Companyfacts payload for ``cik``.
+
+        Args:
+            cik: Company CIK
+            concepts: Concepts to include ('us-gaap:Revenues', or 'Revenues'
+                for any taxonomy); None includes all
+        """
+        sql = (
+            "SELECT f.taxonomy, f.concept, f.unit, f.start, f.end, f.val, f.accn, f.fy,"
+            " f.fp, f.form, f.filed, f.frame, c.label, c.description FROM facts f"
+            " LEFT JOIN concepts c ON c.taxonomy = f.taxonomy AND c.concept = f.concept"
+            " WHERE f.cik = ?"
+        )
+        params: List[Any] = [int(cik)]
+        qualified: Dict[str, set] = {}
+        bare: set = set()
+        if concepts is not None:
+            qualified, bare = _wanted_concepts(concepts)
+            names = bare.union(*qualified.values())
+            if not names:
+                names = {""}
+            sql += f" AND f.concept IN ({', '.join('?' * len(names))})"
+            params.extend(sorted(names))
+        rows = self.execute(sql + " ORDER BY f.rowid", params)
+        if not rows and not self.execute("SELECT 1 FROM facts WHERE cik = ? LIMIT 1", (int(cik),)):
+            return None
+
+        facts: Dict[str, Dict[str, Any]] = {}
+        for (taxonomy, concept, unit, start, end, val, accn, fy, fp, form, filed, frame,
+             label, description) in rows:
+            if concepts is not None and concept not in bare and concept not in qualified.get(taxonomy, ()):
+                continue
+            entry = facts.setdefault(taxonomy, {}).get(concept)
+            if entry is None:
+                entry = facts[taxonomy][concept] = {"label": label, "description": description, "units": {}}
+            fact = {"end": end, "val": val, "accn": accn, "fy": fy, "fp": fp, "form": form, "filed": filed}
+            if start is not None:
+                fact["start"] = start
+            if frame is not None:
+                fact["frame"] = frame
+            entry["units"].setdefault(unit, []).append(fact)
+
+        name = self.execute("SELECT name FROM companies WHERE cik = ?", (int(cik),))
+        data = {"cik": int(cik), "entityName": name[0][0] if name else None, "facts": facts}
+        return data if concepts is None else mark_selected(data, concepts)
+
+    def company_tickers(self) -> Optional[Dict[str, Any]]:
+        """``company_tickers.json``-shaped mapping built from submissions.
+
+        None unless a whole ``submissions.zip`` was loaded: a partial
+        mapping would hide every company missing from it.
+        """
+        if not self.execute("SELECT 1 FROM meta WHERE key = 'submissions_complete'"):
+            return None
+        rows = self.execute(
+            "SELECT cik, name, tickers FROM companies WHERE tickers IS NOT NULL ORDER BY cik"
+        )
+        tickers: Dict[str, Any] = {}
+        for cik, name, symbols in rows:
+            for ticker in json.loads(symbols):
+                tickers[str(len(tickers))] = {"cik_str": cik, "ticker": ticker, "title": name}
+        return tickers or None
+
+    def latest_facts(
+        self,
+        concept: str,
+        unit: str = "USD",
+        fiscal_period: Optional[str] = None,
+        taxonomy: str = "us-gaap",
+    ) -> List[Dict[str, Any]]:
+        """Each company's most recent value of one concept, for screening.
+
+        Args:
+            concept: Concept name, e.g. 'Revenues'
+            unit: Unit of measure
+            fiscal_period: Only consider facts reported for this period
+                ('FY', 'Q1', ...)
+            taxonomy: Taxonomy of ``concept``
+
+        Returns:
+            One dict per company (cik, name, end, value, fy, fp, form, filed),
+            largest value first
+        """
+        sql = (
+            "SELECT f.cik, c.name, f.end, f.val, f.fy, f.fp, f.form, f.filed,"
+            " MAX(f.end || ' ' || COALESCE(f.filed, '')) FROM facts f"
+            " LEFT JOIN companies c ON c.cik = f.cik"
+            " WHERE f.taxonomy = ? AND f.concept = ? AND f.unit = ?"
+        )
+        params: List[Any] = [taxonomy, concept, unit]
+        if fiscal_period:
+            sql += " AND f.fp = ?"
+            params.append(fiscal_period.upper())
+        # SQLite takes the bare columns from the row holding the MAX()
+        rows = self.execute(sql + " GROUP BY f.cik", params)
+        results = [
+            {"cik": str(cik).zfill(10), "name": name, "end": end, "value": val,
+             "fy": fy, "fp": fp, "form": form, "filed": filed}
+            for cik, name, end, val, fy, fp, form, filed, _ in rows
+        ]
+        results.sort(key=lambda row: row["value"] if row["value"] is not None else float("-inf"), reverse=True)
+        return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point (``sec-edgar-warehouse``)."""
+    parser = argparse.ArgumentParser(
+        prog="sec-edgar-warehouse",
+        description="Build and inspect a local SEC EDGAR warehouse from the nightly bulk archives.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser("ingest", help="load submissions.zip / companyfacts.zip")
+    load.add_argument("database", help="warehouse SQLite file (created if missing)")
+    load.add_argument("--submissions", help=f"path of submissions.zip ({BULK_SUBMISSIONS_URL})")
+    load.add_argument("--companyfacts", help=f"path of companyfacts.zip ({BULK_COMPANY_FACTS_URL})")
+    load.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    load.add_argument("--limit", type=int, default=None, help="only load the first N members of each archive")
+
+    show = commands.add_parser("stats", help="print table row counts")
+    show.add_argument("database")
+
+    args = parser.parse_args(argv)
+    if args.command == "ingest":
+        if not (args.submissions or args.companyfacts):
+            parser.error("ingest needs --submissions and/or --companyfacts")
+        stats = ingest(
+            args.database,
+            submissions=args.submissions,
+            company_facts=args.companyfacts,
+            workers=args.workers,
+            limit=args.limit,
+        )
+        print(
+            f"Loaded {stats.members} members ({stats.companies} companies, {stats.filings} filings, "
+            f"{stats.facts} facts, {stats.errors} errors) in {stats.seconds:.1f}s"
+        )
+        return 1 if stats.errors and stats.errors == stats.members else 0
+
+    with Warehouse(args.database) as warehouse:
+        for table, count in warehouse.counts().items():
+            print(f"{table}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
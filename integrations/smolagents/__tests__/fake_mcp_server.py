@@ -0,0 +1,126 @@
+"""Minimal stand-in for ``sec-edgar-mcp stdio`` used by the MCP client tests.
+
+Speaks the MCP handshake (``initialize`` then ``notifications/initialized``;
+tool calls before it are rejected) and lists its tools over several pages.
+
+Tools:
+    echo: Returns its arguments after ``delay`` seconds, so replies to
+        concurrent calls come back out of order; with ``block`` set it runs
+        on the request loop, like a single-threaded server, so pings wait
+    fail: Answers with a JSON-RPC error
+    exit: Exits the process without answering
+    reload: Announces that the tool list changed
+    whoami: Returns the server's process ID after ``delay`` seconds, and
+        its ``SEC_EDGAR_RATE_LIMIT`` setting
+    spam: Writes ``kb`` kilobytes to stderr before answering
+    hang: Stops reading requests, so even pings go unanswered
+    crash_once: Read-only tool that kills the server the first time it is
+        called with a given ``marker`` file, and answers on later calls
+
+Pings are answered. Cancellation notifications are acknowledged with a
+log notification.
+``FAKE_MCP_STARTUP_DELAY`` delays reading the first request, like a slow
+server start.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+TOOLS = [
+    {"name": name, "description": f"Fake {name} tool", "inputSchema": {"type": "object"}}
+    for name in ("echo", "fail", "exit", "reload", "whoami", "spam", "hang", "crash_once")
+]
+TOOLS[-1]["annotations"] = {"readOnlyHint": True}
+
+PAGE_SIZE = 3
+
+_write_lock = threading.Lock()
+
+
+def send(message):
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def reply(request, result=None, error=None):
+    message = {"jsonrpc": "2.0", "id": request["id"]}
+    if error is not None:
+        message["error"] = error
+    else:
+        message["result"] = result
+    send(message)
+
+
+def call_tool(request):
+    name = request["params"]["name"]
+    arguments = request["params"].get("arguments", {})
+    send({"jsonrpc": "2.0", "method": "notifications/message", "params": {"level": "info", "data": name}})
+    if name == "echo":
+        time.sleep(arguments.get("delay", 0))
+        reply(request, arguments)
+    elif name == "fail":
+        reply(request, error={"code": -32000, "message": "tool failed"})
+    elif name == "whoami":
+        time.sleep(arguments.get("delay", 0))
+        reply(request, {"pid": os.getpid(), "rate_limit": os.environ.get("SEC_EDGAR_RATE_LIMIT")})
+    elif name == "spam":
+        for _ in range(arguments["kb"]):
+            sys.stderr.write("x" * 1023 + "\n")
+        sys.stderr.flush()
+        reply(request, {})
+    elif name == "crash_once":
+        if not os.path.exists(arguments["marker"]):
+            open(arguments["marker"], "w").close()
+            os._exit(4)
+        reply(request, {"replayed": True})
+    elif name == "reload":
+        send({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+        reply(request, {})
+
+
+def main():
+    time.sleep(float(os.environ.get("FAKE_MCP_STARTUP_DELAY", "0")))
+    # Stray non-protocol output must not break the client
+    print("fake sec-edgar-mcp starting", flush=True)
+    initialized = False
+    for line in sys.stdin:
+        request = json.loads(line)
+        method = request.get("method")
+        if method == "initialize":
+            reply(request, {
+                "protocolVersion": request["params"]["protocolVersion"],
+                "capabilities": {"tools": {"listChanged": True}},
+                "serverInfo": {"name": "fake-sec-edgar-mcp", "version": "0.0.1"},
+            })
+        elif method == "notifications/initialized":
+            initialized = True
+        elif method == "notifications/cancelled":
+            cancelled = request["params"]["requestId"]
+            send({"jsonrpc": "2.0", "method": "notifications/message", "params": {"data": f"cancelled {cancelled}"}})
+        elif method == "ping":
+            reply(request, {})
+        elif not initialized and "id" in request:
+            reply(request, error={"code": -32002, "message": "Server not initialized"})
+        elif method == "tools/list":
+            page = int(request["params"].get("cursor", "0"))
+            result = {"tools": TOOLS[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]}
+            if (page + 1) * PAGE_SIZE < len(TOOLS):
+                result["nextCursor"] = str(page + 1)
+            reply(request, result)
+        elif method == "tools/call":
+            if request["params"]["name"] == "exit":
+                sys.exit(3)
+            if request["params"]["name"] == "hang":
+                time.sleep(3600)
+            if request["params"].get("arguments", {}).get("block"):
+                call_tool(request)
+            else:
+                threading.Thread(target=call_tool, args=(request,), daemon=True).start()
+
+
+if __name__ == "__main__":
+    main()
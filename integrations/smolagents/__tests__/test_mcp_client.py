@@ -0,0 +1,322 @@
+"""Tests for the MCP client transport against a fake stdio server."""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+
+import pytest
+from sec_edgar_smolagents.mcp_client import (
+    AsyncRateLimiter,
+    MCPClient,
+    MCPClientPool,
+    MCPConnectionError,
+    MCPError,
+    MCPTimeoutError,
+)
+
+FAKE_SERVER = os.path.join(os.path.dirname(__file__), "fake_mcp_server.py")
+
+
+def fake_client(**kwargs):
+    return MCPClient(server_command=sys.executable, server_args=[FAKE_SERVER], **kwargs)
+
+
+def fake_pool(size, **kwargs):
+    return MCPClientPool(size, server_command=sys.executable, server_args=[FAKE_SERVER], **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_matched_by_id():
+    """Test calls pipeline over one process and each gets its own reply."""
+    async with fake_client().session() as client:
+        started = time.monotonic()
+        results = await asyncio.gather(*(
+            client.call_tool("echo", {"n": n, "delay": 0.3 - n * 0.05}) for n in range(6)
+        ))
+        elapsed = time.monotonic() - started
+
+    assert [result["n"] for result in results] == list(range(6))
+    assert elapsed < 0.9
+
+
+@pytest.mark.asyncio
+async def test_error_responses_raise_for_their_caller_only():
+    """Test a JSON-RPC error fails only the request it answers."""
+    async with fake_client().session() as client:
+        ok, failed = await asyncio.gather(
+            client.call_tool("echo", {"n": 1, "delay": 0.1}),
+            client.call_tool("fail", {}),
+            return_exceptions=True,
+        )
+
+    assert ok == {"n": 1, "delay": 0.1}
+    assert isinstance(failed, MCPError) and failed.code == -32000
+    assert "tool failed" in str(failed)
+
+
+@pytest.mark.asyncio
+async def test_notifications_go_to_handlers():
+    """Test server notifications reach handlers instead of pending calls."""
+    seen = []
+    client = fake_client()
+    client.add_notification_handler(lambda method, params: seen.append((method, params["data"])))
+
+    async with client.session():
+        assert await client.call_tool("echo", {"n": 1}) == {"n": 1}
+
+    assert seen == [("notifications/message", "echo")]
+
+
+@pytest.mark.asyncio
+async def test_server_exit_fails_pending_calls():
+    """Test calls in flight when the server dies fail instead of hanging."""
+    async with fake_client().session() as client:
+        slow = asyncio.ensure_future(client.call_tool("echo", {"delay": 5}))
+        await asyncio.sleep(0.1)
+        with pytest.raises(MCPConnectionError):
+            await client.call_tool("exit", {})
+        with pytest.raises(MCPConnectionError):
+            await slow
+
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_running_during_calls():
+    """Test waiting on the server never blocks other coroutines."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async with fake_client().session() as client:
+        task = asyncio.ensure_future(ticker())
+        await client.call_tool("echo", {"delay": 0.5})
+        task.cancel()
+
+    assert ticks >= 25
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_the_request():
+    """Test a slow call times out, the server is told, and the client stays usable."""
+    seen = []
+    client = fake_client(timeout=5)
+    client.add_notification_handler(lambda method, params: seen.append(params["data"]))
+
+    async with client.session():
+        with pytest.raises(MCPTimeoutError):
+            await client.call_tool("echo", {"delay": 2}, timeout=0.1)
+        assert await client.call_tool("echo", {"n": 2}) == {"n": 2}
+
+    assert any(data.startswith("cancelled ") for data in seen)
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_limits_concurrency():
+    """Test callers queue for a slot once max_in_flight requests are pending."""
+    async with fake_client(max_in_flight=2).session() as client:
+        started = time.monotonic()
+        await asyncio.gather(*(client.call_tool("echo", {"delay": 0.2}) for _ in range(4)))
+        elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.4
+
+
+@pytest.mark.asyncio
+async def test_large_messages():
+    """Test responses far beyond the default stream line limit are read."""
+    payload = "x" * (5 * 1024 * 1024)
+    async with fake_client().session() as client:
+        assert (await client.call_tool("echo", {"payload": payload}))["payload"] == payload
+
+
+@pytest.mark.asyncio
+async def test_handshake_caches_server_info_and_tools():
+    """Test start completes initialize and caches capabilities and the tool list."""
+    async with fake_client().session() as client:
+        assert client.server_info == {"name": "fake-sec-edgar-mcp", "version": "0.0.1"}
+        assert client.protocol_version == "2025-06-18"
+        assert "tools" in client.server_capabilities
+        assert [tool["name"] for tool in await client.list_tools()][:5] == ["echo", "fail", "exit", "reload", "whoami"]
+        assert client.startup_time < 0.5
+
+
+@pytest.mark.asyncio
+async def test_startup_waits_for_a_slow_server(monkeypatch):
+    """Test calls made while the server is still starting wait for the handshake."""
+    monkeypatch.setenv("FAKE_MCP_STARTUP_DELAY", "0.8")
+    client = fake_client()
+    try:
+        results = await asyncio.gather(*(client.call_tool("echo", {"n": n}) for n in range(3)))
+        assert [result["n"] for result in results] == [0, 1, 2]
+        assert client.startup_time >= 0.8
+    finally:
+        await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_tool_list_refreshes_after_change_notification():
+    """Test a tools/list_changed notification invalidates the cached list."""
+    methods = []
+    async with fake_client().session() as client:
+        original = client._send
+
+        async def spy(message):
+            methods.append(message.get("method"))
+            await original(message)
+
+        client._send = spy
+        await client.list_tools()
+        assert "tools/list" not in methods
+        await client.call_tool("reload", {})
+        await asyncio.sleep(0.05)
+        assert len(await client.list_tools()) == 8
+        assert methods[0] == "tools/call" and set(methods[1:]) == {"tools/list"}
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_calls_across_workers():
+    """Test concurrent calls go to the least busy of several processes."""
+    async with fake_pool(3, rate_limit=None).session() as pool:
+        started = time.monotonic()
+        results = await asyncio.gather(*(pool.call_tool("whoami", {"delay": 0.3}) for _ in range(6)))
+        elapsed = time.monotonic() - started
+
+    pids = [result["pid"] for result in results]
+    assert sorted(pids.count(pid) for pid in set(pids)) == [2, 2, 2]
+    assert elapsed < 0.55
+
+
+@pytest.mark.asyncio
+async def test_pool_restarts_crashed_workers():
+    """Test calls keep succeeding and the dead worker comes back."""
+    async with fake_pool(2, rate_limit=None).session() as pool:
+        before = {(await pool.call_tool("whoami", {}))["pid"] for _ in range(2)}
+        with pytest.raises(MCPConnectionError):
+            await pool.call_tool("exit", {})
+        assert (await pool.call_tool("echo", {"n": 1})) == {"n": 1}
+        for _ in range(50):
+            if all(client.running for client in pool.clients):
+                break
+            await asyncio.sleep(0.05)
+        after = {(await pool.call_tool("whoami", {}))["pid"] for _ in range(2)}
+
+    assert pool.restarts == 1
+    assert len(after) == 2 and len(before & after) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_shares_one_rate_limit():
+    """Test the rate limit applies to calls across all workers together."""
+    async with fake_pool(2, rate_limit=20).session() as pool:
+        started = time.monotonic()
+        await asyncio.gather(*(pool.call_tool("echo", {}) for _ in range(30)))
+        elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.45
+
+
+@pytest.mark.asyncio
+async def test_pool_splits_sec_budget_across_workers():
+    """Test each worker server gets an equal share of the SEC request budget."""
+    async with fake_pool(4, rate_limit=10).session() as pool:
+        results = await asyncio.gather(*(pool.call_tool("whoami", {"delay": 0.1}) for _ in range(4)))
+
+    assert len({result["pid"] for result in results}) == 4
+    assert {result["rate_limit"] for result in results} == {"2.5"}
+
+
+def test_rate_limiter_is_shared_across_loops():
+    """Test acquisitions from several threads' loops draw on one budget."""
+    limiter = AsyncRateLimiter(20, burst=1)
+
+    async def acquire_five():
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+    def worker():
+        asyncio.run(acquire_five())
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - started >= 0.9
+
+
+async def wait_running(client, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not client.running:
+        assert time.monotonic() < deadline, "server was not restarted"
+        await asyncio.sleep(0.02)
+
+
+@pytest.mark.asyncio
+async def test_stderr_is_drained_into_logging(caplog):
+    """Test a server writing far more than a pipe buffer to stderr keeps answering."""
+    caplog.set_level(logging.INFO, logger="sec_edgar_smolagents.mcp_client.server")
+    async with fake_client(timeout=5).session() as client:
+        assert await client.call_tool("spam", {"kb": 512}) == {}
+
+    assert len([r for r in caplog.records if r.name == "sec_edgar_smolagents.mcp_client.server"]) >= 512
+
+
+@pytest.mark.asyncio
+async def test_crashed_server_is_respawned_and_idempotent_calls_replayed(tmp_path):
+    """Test a read-only call in flight when the server dies is resent to its replacement."""
+    async with fake_client(restart_backoff=0.05).session() as client:
+        first_pid = (await client.call_tool("whoami", {}))["pid"]
+        result = await client.call_tool("crash_once", {"marker": str(tmp_path / "crashed")})
+        second_pid = (await client.call_tool("whoami", {}))["pid"]
+
+    assert result == {"replayed": True}
+    assert first_pid != second_pid
+    assert client.restarts == 1
+
+
+@pytest.mark.asyncio
+async def test_hung_server_is_killed_and_restarted():
+    """Test a server that stops answering pings is replaced."""
+    client = fake_client(health_check_interval=0.1, health_check_timeout=0.2, restart_backoff=0.05)
+    async with client.session():
+        with pytest.raises(MCPConnectionError):
+            await client.call_tool("hang", {}, timeout=10)
+        await wait_running(client)
+        assert await client.call_tool("echo", {"n": 1}) == {"n": 1}
+
+    assert client.restarts == 1
+
+
+@pytest.mark.asyncio
+async def test_busy_server_is_not_killed():
+    """Test a call that keeps the server from answering pings for a while does not get it restarted."""
+    client = fake_client(health_check_interval=0.1, health_check_timeout=0.3, restart_backoff=0.05)
+    async with client.session():
+        assert (await client.call_tool("echo", {"n": 1, "delay": 0.6, "block": True}))["n"] == 1
+        await asyncio.sleep(0.5)
+        assert await client.call_tool("echo", {"n": 2}) == {"n": 2}
+
+    assert client.restarts == 0
+
+
+@pytest.mark.asyncio
+async def test_restart_backoff_grows_with_consecutive_crashes():
+    """Test each crash without a successful call in between doubles the respawn delay."""
+    async with fake_client(restart_backoff=0.2).session() as client:
+        delays = []
+        for _ in range(2):
+            with pytest.raises(MCPConnectionError):
+                await client.call_tool("exit", {})
+            crashed = time.monotonic()
+            await wait_running(client)
+            delays.append(time.monotonic() - crashed)
+
+    assert delays[0] >= 0.2 and delays[1] >= 0.4
+    assert client.restarts == 2
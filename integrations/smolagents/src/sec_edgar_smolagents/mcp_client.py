@@ -1,115 +1,585 @@
 """MCP Client for connecting to sec-edgar-mcp server."""
 
 import asyncio
+import itertools
 import json
-import subprocess
-from typing import Any, Dict, Optional, List
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Coroutine, Dict, Iterable, Optional, List
 from contextlib import asynccontextmanager
 
+logger = logging.getLogger(__name__)
+# Receives the server's stderr, line by line
+server_logger = logging.getLogger(f"{__name__}.server")
+
+# Called with the method and params of every server notification
+NotificationHandler = Callable[[str, Dict[str, Any]], Any]
+
+# JSON-RPC error code for requests the client does not implement
+METHOD_NOT_FOUND = -32601
+
+# Largest single JSON-RPC message read from the server (companyfacts
+# responses for large filers run to tens of megabytes)
+DEFAULT_MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+# MCP protocol revision requested in the handshake, and the ones accepted back
+PROTOCOL_VERSION = "2025-06-18"
+SUPPORTED_PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
+
+CLIENT_INFO = {"name": "sec-edgar-agentkit-smolagents", "version": "0.1.0"}
+
+# Environment variable holding a server's SEC requests-per-second budget
+RATE_LIMIT_ENV = "SEC_EDGAR_RATE_LIMIT"
+
+# Read-only sec-edgar-mcp tools, safe to resend after a server restart
+IDEMPOTENT_TOOLS = frozenset({
+    "sec_edgar_cik_lookup",
+    "sec_edgar_company_info",
+    "sec_edgar_company_facts",
+    "sec_edgar_filing_search",
+    "sec_edgar_filing_content",
+    "sec_edgar_analyze_8k",
+    "sec_edgar_financial_statements",
+    "sec_edgar_xbrl_parse",
+    "sec_edgar_insider_trading",
+})
+
+
+class MCPError(Exception):
+    """Error response returned by the MCP server."""
+
+    def __init__(self, message: str, code: Optional[int] = None, data: Any = None):
+        super().__init__(f"MCP Error: {message}")
+        self.code = code
+        self.data = data
+
+    @classmethod
+    def from_response(cls, error: Any) -> "MCPError":
+        if isinstance(error, dict):
+            return cls(error.get("message", str(error)), error.get("code"), error.get("data"))
+        return cls(str(error))
+
+
+class MCPConnectionError(MCPError):
+    """The server process exited or was stopped before answering."""
+
+
+class MCPTimeoutError(MCPError, asyncio.TimeoutError):
+    """The server did not answer within the request timeout."""
+
 
 class MCPClient:
-    """Client for interacting with sec-edgar-mcp server."""
-    
-    def __init__(self, server_command: str = "sec-edgar-mcp"):
+    """Client for interacting with sec-edgar-mcp server.
+
+    Every request gets its own JSON-RPC ID and a background reader task
+    routes each response to the caller waiting on that ID, so any number of
+    tool calls can be in flight over one server process. Notifications are
+    passed to the handlers registered with :meth:`add_notification_handler`.
+
+    The server runs as an asyncio subprocess: writes wait for the pipe to
+    drain and reads never block the event loop. :meth:`start` performs the
+    MCP ``initialize`` handshake and caches the server's capabilities and
+    tool list.
+
+    The process is supervised: its stderr is forwarded to the
+    ``sec_edgar_smolagents.mcp_client.server`` logger, it is pinged
+    when it falls silent, and when it exits or hangs it is respawned with
+    exponential backoff. Calls to idempotent tools that were in flight are
+    resent to the new process; other calls fail with MCPConnectionError.
+    """
+
+    def __init__(
+        self,
+        server_command: str = "sec-edgar-mcp",
+        server_args: Optional[List[str]] = None,
+        timeout: Optional[float] = 120.0,
+        max_in_flight: Optional[int] = None,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+        shutdown_timeout: float = 2.0,
+        startup_timeout: float = 30.0,
+        restart_backoff: float = 0.5,
+        restart_backoff_max: float = 30.0,
+        max_replays: int = 2,
+        idempotent_tools: Optional[Iterable[str]] = None,
+        health_check_interval: Optional[float] = 30.0,
+        health_check_timeout: float = 10.0,
+        health_check_misses: int = 3,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            server_command: Executable of the MCP server
+            server_args: Arguments of the server (default ``["stdio"]``)
+            timeout: Default seconds to wait for each response (None waits forever)
+            max_in_flight: Most requests awaiting a response at once; further
+                calls wait for a slot (None for no limit)
+            max_message_size: Longest line accepted from the server, in bytes
+            shutdown_timeout: Seconds :meth:`stop` waits for a clean exit
+                before terminating and then killing the server
+            startup_timeout: Seconds to wait for each handshake response
+            restart_backoff: Seconds before respawning a crashed server,
+                doubled for each further crash without a successful call
+            restart_backoff_max: Longest delay before a respawn
+            max_replays: Times an idempotent call is resent after the
+                server dies with it in flight
+            idempotent_tools: Tools safe to resend (default: the read-only
+                SEC EDGAR tools); tools the server annotates as read-only or
+                idempotent are always resent
+            health_check_interval: Seconds between liveness checks (None
+                disables them); any message from the server in the last
+                interval counts as proof of life, otherwise it is pinged
+            health_check_timeout: Seconds a ping may take before it counts
+                as missed
+            health_check_misses: Consecutive missed pings after which the
+                server is considered hung and restarted, so a server busy
+                with a long call is not killed for one slow reply
+            env: Variables added to this process's environment for the server
+        """
         self.server_command = server_command
-        self.process: Optional[subprocess.Popen] = None
+        self.server_args = list(server_args) if server_args is not None else ["stdio"]
+        self.env = dict(env or {})
+        self.timeout = timeout
+        self.max_message_size = max_message_size
+        self.shutdown_timeout = shutdown_timeout
+        self.startup_timeout = startup_timeout
+        self.restart_backoff = restart_backoff
+        self.restart_backoff_max = restart_backoff_max
+        self.max_replays = max_replays
+        self.idempotent_tools = frozenset(idempotent_tools) if idempotent_tools is not None else IDEMPOTENT_TOOLS
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.health_check_misses = max(1, health_check_misses)
+        self.process: Optional[asyncio.subprocess.Process] = None
         self._lock = asyncio.Lock()
-        
+        self._write_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        # When the server last sent anything, for the liveness check
+        self._last_message = 0.0
+        # Reader, stderr drain and supervisor of the current process
+        self._tasks: List[asyncio.Future] = []
+        self._notification_handlers: List[NotificationHandler] = []
+        self._ready = False
+        self._closing = False
+        # Crashes since the last successful call, for the restart backoff
+        self._crashes = 0
+        self.restarts = 0
+        self._tools: Optional[List[Dict[str, Any]]] = None
+        # Filled in by the handshake
+        self.protocol_version: Optional[str] = None
+        self.server_info: Dict[str, Any] = {}
+        self.server_capabilities: Dict[str, Any] = {}
+        self.startup_time: Optional[float] = None
+
     async def start(self):
-        """Start the MCP server process."""
+        """Start the MCP server process and complete the MCP handshake.
+
+        Returns as soon as the server has answered ``initialize`` (and
+        ``tools/list`` if it offers tools); ``startup_time`` records how long
+        that took. After a crash the respawn is delayed by the restart
+        backoff.
+
+        Raises:
+            MCPError: If the server fails the handshake or speaks an
+                unsupported protocol version
+        """
         async with self._lock:
-            if self.process is None:
-                self.process = subprocess.Popen(
-                    [self.server_command, "stdio"],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1
-                )
-                # Give server time to initialize
-                await asyncio.sleep(0.5)
-    
+            if self._ready:
+                return
+            self._closing = False
+            if self._crashes:
+                delay = min(self.restart_backoff_max, self.restart_backoff * 2 ** (self._crashes - 1))
+                logger.warning("Restarting MCP server in %.2fs (crash %d)", delay, self._crashes)
+                await asyncio.sleep(delay)
+            started = time.perf_counter()
+            process = self.process = await asyncio.create_subprocess_exec(
+                self.server_command,
+                *self.server_args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=self.max_message_size,
+                env={**os.environ, **self.env} if self.env else None,
+            )
+            self._last_message = time.monotonic()
+            self._tasks = [
+                asyncio.ensure_future(self._read_loop(process)),
+                asyncio.ensure_future(self._drain_stderr(process)),
+            ]
+            try:
+                await self._initialize()
+            except BaseException:
+                await self._abandon()
+                raise
+            self._tasks.append(asyncio.ensure_future(self._supervise(process)))
+            if self._crashes:
+                self.restarts += 1
+            self._ready = True
+            self.startup_time = time.perf_counter() - started
+            logger.info(
+                "%s %s ready in %.3fs",
+                self.server_info.get("name", self.server_command),
+                self.server_info.get("version", ""),
+                self.startup_time,
+            )
+
+    async def _initialize(self) -> None:
+        result = await self._request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": CLIENT_INFO,
+        }, self.startup_timeout)
+        version = result.get("protocolVersion")
+        if version not in SUPPORTED_PROTOCOL_VERSIONS:
+            raise MCPError(f"Unsupported MCP protocol version {version!r}")
+        self.protocol_version = version
+        self.server_info = result.get("serverInfo") or {}
+        self.server_capabilities = result.get("capabilities") or {}
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        self._tools = await self._fetch_tools(self.startup_timeout) if "tools" in self.server_capabilities else None
+
+    async def _abandon(self) -> None:
+        """Tear down a server that failed to start."""
+        process, self.process = self.process, None
+        if process is not None:
+            # Hung rather than exited (the reader counts exits)
+            self._crashes += 1
+            await self._shutdown(process)
+        self._cancel_tasks()
+        self._fail_pending(MCPConnectionError("MCP server failed to start"))
+
     async def stop(self):
-        """Stop the MCP server process."""
+        """Stop the MCP server process.
+
+        Closing stdin asks the server to exit; it is terminated, then killed,
+        if it is still running after ``shutdown_timeout`` seconds.
+        """
+        self._closing = True
+        # Interrupt a respawn that may be holding the lock
+        self._cancel_tasks()
         async with self._lock:
+            self._ready = False
+            self._crashes = 0
             if self.process:
-                self.process.terminate()
-                await asyncio.sleep(0.1)
-                if self.process.poll() is None:
-                    self.process.kill()
-                self.process = None
-    
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        """Call a tool on the MCP server."""
-        if not self.process:
+                process, self.process = self.process, None
+                await self._shutdown(process)
+                self._fail_pending(MCPConnectionError("MCP server stopped"))
+
+    def _cancel_tasks(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        current = asyncio.current_task()
+        for task in tasks:
+            if task is not current:
+                task.cancel()
+
+    async def _shutdown(self, process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            process.stdin.close()
+        for signal in (None, process.terminate, process.kill):
+            try:
+                if signal is not None:
+                    signal()
+                await asyncio.wait_for(process.wait(), self.shutdown_timeout)
+                return
+            except ProcessLookupError:
+                return
+            except asyncio.TimeoutError:
+                continue
+
+    @property
+    def running(self) -> bool:
+        """Whether the server process is up and has completed the handshake."""
+        return self._ready
+
+    @property
+    def outstanding(self) -> int:
+        """Requests sent and still awaiting a response."""
+        return len(self._pending)
+
+    def add_notification_handler(self, handler: NotificationHandler) -> None:
+        """Register a callback for server notifications (``method``, ``params``).
+
+        Coroutine functions are scheduled on the client's event loop.
+        """
+        self._notification_handlers.append(handler)
+
+    def remove_notification_handler(self, handler: NotificationHandler) -> None:
+        """Unregister a callback added with :meth:`add_notification_handler`."""
+        self._notification_handlers.remove(handler)
+
+    async def request(
+        self, method: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Any:
+        """Send a JSON-RPC request and wait for its result.
+
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+            timeout: Seconds to wait for the response (defaults to the
+                client's ``timeout``)
+
+        Raises:
+            MCPError: If the server answers with an error
+            MCPConnectionError: If the server exits before answering and
+                the request is not idempotent (or was resent too often)
+            MCPTimeoutError: If no response arrives in time; the server is
+                sent a cancellation notification for the request
+        """
+        if timeout is None:
+            timeout = self.timeout
+        replays = 0
+        while True:
+            if not self._ready:
+                await self.start()
+            try:
+                if self._slots is None:
+                    result = await self._request(method, params, timeout)
+                else:
+                    async with self._slots:
+                        result = await self._request(method, params, timeout)
+            except MCPConnectionError:
+                if self._closing or replays >= self.max_replays or not self._replayable(method, params):
+                    raise
+                replays += 1
+                logger.warning("Resending %s %s to the restarted MCP server", method, (params or {}).get("name", ""))
+                continue
+            self._crashes = 0
+            return result
+
+    def _replayable(self, method: str, params: Optional[Dict[str, Any]]) -> bool:
+        """Whether a request can safely be sent again after a crash."""
+        if method in ("tools/list", "ping"):
+            return True
+        if method != "tools/call":
+            return False
+        name = (params or {}).get("name")
+        if name in self.idempotent_tools:
+            return True
+        for tool in self._tools or []:
+            if tool.get("name") == name:
+                annotations = tool.get("annotations") or {}
+                return bool(annotations.get("readOnlyHint") or annotations.get("idempotentHint"))
+        return False
+
+    async def _request(self, method: str, params: Optional[Dict[str, Any]], timeout: Optional[float]) -> Any:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if future.done():
+                raise
+            future.cancel()
+            await self._cancel(request_id, "timeout")
+            raise MCPTimeoutError(f"No response to {method} within {timeout}s") from None
+        except asyncio.CancelledError:
+            future.cancel()
+            await asyncio.shield(self._cancel(request_id, "cancelled"))
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _cancel(self, request_id: int, reason: str) -> None:
+        """Tell the server to stop working on an abandoned request."""
+        try:
+            await self._send({
+                "jsonrpc": "2.0",
+                "method": "notifications/cancelled",
+                "params": {"requestId": request_id, "reason": reason},
+            })
+        except MCPConnectionError:
+            pass
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send a JSON-RPC notification, which gets no response."""
+        if not self._ready:
+            await self.start()
+        await self._send({"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """Call a tool on the MCP server.
+
+        Args:
+            tool_name: Name of the server tool
+            arguments: Tool arguments
+            timeout: Seconds to wait for the result (defaults to the client's ``timeout``)
+        """
+        return await self.request("tools/call", {"name": tool_name, "arguments": arguments}, timeout)
+
+    async def list_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Tools offered by the server, as returned by ``tools/list``.
+
+        The list fetched during the handshake is reused until the server
+        announces a change or ``refresh`` is set.
+        """
+        if not self._ready:
             await self.start()
-            
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            },
-            "id": 1
-        }
-        
-        # Send request
-        self.process.stdin.write(json.dumps(request) + '\n')
-        self.process.stdin.flush()
-        
-        # Read response
-        response_line = self.process.stdout.readline()
-        if response_line:
+        if self._tools is None or refresh:
+            self._tools = await self._fetch_tools(self.timeout)
+        return self._tools
+
+    async def _fetch_tools(self, timeout: Optional[float]) -> List[Dict[str, Any]]:
+        tools: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            result = await self._request("tools/list", {"cursor": cursor} if cursor else {}, timeout)
+            tools.extend(result.get("tools", []))
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return tools
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        process = self.process
+        if process is None or process.returncode is not None:
+            raise MCPConnectionError("MCP server is not running")
+        data = (json.dumps(message) + "\n").encode()
+        try:
+            async with self._write_lock:
+                process.stdin.write(data)
+                # Wait for the pipe to drain so a slow server pushes back on callers
+                await process.stdin.drain()
+        except (ConnectionError, RuntimeError) as e:
+            raise MCPConnectionError(f"MCP server closed its input: {e}") from e
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        """Dispatch server output until the process closes stdout."""
+        try:
+            while True:
+                try:
+                    line = await process.stdout.readline()
+                except ValueError:
+                    # The oversized line has been discarded; its caller times out
+                    logger.error("Dropped MCP message larger than %d bytes", self.max_message_size)
+                    continue
+                if not line:
+                    break
+                self._dispatch(line.decode("utf-8", errors="replace"))
+        finally:
+            if self.process is process:
+                # The server exited on its own; release stdin so the transport can close
+                self.process = None
+                self._ready = False
+                self._crashes += 1
+                process.stdin.close()
+                logger.warning("MCP server exited unexpectedly")
+            self._fail_pending(MCPConnectionError("MCP server exited"))
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process) -> None:
+        """Forward server stderr to logging so a chatty server never fills the pipe."""
+        while True:
+            try:
+                line = await process.stderr.readline()
+            except ValueError:
+                continue
+            if not line:
+                return
+            server_logger.info("%s", line.decode("utf-8", errors="replace").rstrip())
+
+    async def _supervise(self, process: asyncio.subprocess.Process) -> None:
+        """Check the server is alive periodically and respawn it once it exits.
+
+        The server is only pinged when it has sent nothing for a whole
+        interval. One that misses ``health_check_misses`` pings in a row is
+        killed, which fails or resends the calls in flight and leads to the
+        respawn.
+        """
+        missed = 0
+        while process.returncode is None:
             try:
-                response = json.loads(response_line)
-                if "result" in response:
-                    return response["result"]
-                elif "error" in response:
-                    raise Exception(f"MCP Error: {response['error']}")
-            except json.JSONDecodeError:
-                # For simplified demo, return mock data
-                return self._get_mock_response(tool_name, arguments)
-        
-        return self._get_mock_response(tool_name, arguments)
-    
-    def _get_mock_response(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        """Return mock responses for testing."""
-        mock_responses = {
-            "sec_edgar_cik_lookup": {
-                "cik": "0000320193",
-                "name": "Apple Inc.",
-                "ticker": "AAPL"
-            },
-            "sec_edgar_company_info": {
-                "cik": "0000320193",
-                "name": "Apple Inc.",
-                "ticker": "AAPL",
-                "sic": "3571",
-                "sic_description": "Electronic Computers",
-                "address": "One Apple Park Way, Cupertino, CA 95014"
-            },
-            "sec_edgar_filing_search": [
-                {
-                    "form": "10-K",
-                    "filing_date": "2024-11-01",
-                    "accession_number": "0000320193-24-000081",
-                    "file_url": "https://www.sec.gov/Archives/edgar/data/320193/000032019324000081/aapl-20240928.htm"
-                }
-            ],
-            "sec_edgar_filing_content": {
-                "content": "Sample 10-K filing content...",
-                "sections": ["Business", "Risk Factors", "Financial Statements"]
-            },
-            "sec_edgar_financial_statements": {
-                "balance_sheet": {"assets": 352583000000, "liabilities": 258549000000},
-                "income_statement": {"revenue": 383285000000, "net_income": 96995000000}
+                await asyncio.wait_for(asyncio.shield(process.wait()), self.health_check_interval)
+            except asyncio.TimeoutError:
+                if time.monotonic() - self._last_message < self.health_check_interval or await self._alive():
+                    missed = 0
+                    continue
+                missed += 1
+                if missed < self.health_check_misses:
+                    logger.warning(
+                        "MCP server did not answer a ping within %.1fs (%d/%d)",
+                        self.health_check_timeout, missed, self.health_check_misses,
+                    )
+                    continue
+                logger.error("MCP server missed %d pings in a row; killing it", missed)
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+        if not self._closing:
+            try:
+                await self.start()
+            except Exception:
+                logger.exception("Failed to restart MCP server; retrying on the next call")
+
+    async def _alive(self) -> bool:
+        try:
+            await self._request("ping", None, self.health_check_timeout)
+        except MCPTimeoutError:
+            return False
+        except MCPError:
+            # Any answer, even an error, shows the server is responsive
+            pass
+        return True
+
+    def _dispatch(self, line: str) -> None:
+        self._last_message = time.monotonic()
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning("Ignoring non-JSON output from MCP server: %.200s", line.rstrip())
+            return
+        if not isinstance(message, dict):
+            logger.warning("Ignoring unexpected MCP message: %.200s", line.rstrip())
+            return
+
+        if "method" not in message:
+            future = self._pending.pop(message.get("id"), None)
+            if future is None or future.done():
+                logger.debug("Dropping response to unknown or abandoned request %s", message.get("id"))
+            elif "error" in message:
+                future.set_exception(MCPError.from_response(message["error"]))
+            else:
+                future.set_result(message.get("result"))
+        elif "id" in message:
+            asyncio.ensure_future(self._answer_server_request(message))
+        else:
+            self._handle_notification(message["method"], message.get("params") or {})
+
+    async def _answer_server_request(self, message: Dict[str, Any]) -> None:
+        """Reply to requests the server sends the client (only ``ping`` is supported)."""
+        if message["method"] == "ping":
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+        else:
+            reply = {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "error": {"code": METHOD_NOT_FOUND, "message": f"Method not found: {message['method']}"},
             }
-        }
-        
-        return mock_responses.get(tool_name, {"status": "success", "data": "Mock response"})
-    
+        try:
+            await self._send(reply)
+        except MCPConnectionError:
+            pass
+
+    def _handle_notification(self, method: str, params: Dict[str, Any]) -> None:
+        if method == "notifications/tools/list_changed":
+            self._tools = None
+        for handler in list(self._notification_handlers):
+            try:
+                result = handler(method, params)
+                if asyncio.iscoroutine(result):
+                    asyncio.ensure_future(result)
+            except Exception:
+                logger.exception("MCP notification handler failed for %s", method)
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
     @asynccontextmanager
     async def session(self):
         """Context manager for MCP client session."""
@@ -120,8 +590,162 @@ class MCPClient:
             await self.stop()
 
 
+class AsyncRateLimiter:
+    """Token bucket for coroutines, safe to share across threads and loops.
+
+    Each :meth:`acquire` reserves a token up front and sleeps until it is
+    due, so waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: Sustained acquisitions per second
+            burst: Acquisitions allowed back to back (default ``rate``)
+            clock: Monotonic clock, replaceable in tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        # Reservations are never held across an await, so a thread lock is enough
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class MCPClientPool:
+    """Several sec-edgar-mcp server processes behind the MCPClient interface.
+
+    Each call goes to the worker with the fewest requests outstanding, so
+    CPU-heavy tools (XBRL parsing, 8-K analysis) run on separate cores.
+    Workers restart themselves after a crash and are skipped until they are
+    ready again.
+
+    ``rate_limit`` is the pool's SEC budget as a whole: tool calls from all
+    workers share one limiter, and since a tool call may make several SEC
+    requests, each worker server is also given ``rate_limit / size``
+    requests per second through the ``SEC_EDGAR_RATE_LIMIT`` environment
+    variable, so N servers' own limiters never add up past it (for servers
+    that ignore the variable, lower ``rate_limit`` instead).
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        server_command: str = "sec-edgar-mcp",
+        server_args: Optional[List[str]] = None,
+        rate_limit: Optional[float] = 10.0,
+        rate_limit_burst: Optional[int] = None,
+        **client_options: Any,
+    ):
+        """
+        Args:
+            size: Number of server processes (default: CPU count)
+            server_command: Executable of the MCP server
+            server_args: Arguments of the server (default ``["stdio"]``)
+            rate_limit: Tool calls and SEC requests per second across all
+                workers (None leaves the servers' own limits alone)
+            rate_limit_burst: Calls allowed back to back (default ``rate_limit``)
+            **client_options: Passed to every :class:`MCPClient`
+        """
+        self.size = size or os.cpu_count() or 1
+        if rate_limit:
+            env = dict(client_options.pop("env", None) or {})
+            env[RATE_LIMIT_ENV] = f"{rate_limit / self.size:g}"
+            client_options["env"] = env
+        self.clients = [MCPClient(server_command, server_args, **client_options) for _ in range(self.size)]
+        self.rate_limiter = AsyncRateLimiter(rate_limit, rate_limit_burst) if rate_limit else None
+        self._assigned = [0] * self.size
+        self._next = 0
+
+    async def start(self):
+        """Start every worker and complete their handshakes concurrently."""
+        await asyncio.gather(*(client.start() for client in self.clients))
+
+    async def stop(self):
+        """Stop every worker."""
+        await asyncio.gather(*(client.stop() for client in self.clients), return_exceptions=True)
+
+    @property
+    def outstanding(self) -> int:
+        """Calls routed to workers and not yet answered."""
+        return sum(self._assigned)
+
+    @property
+    def restarts(self) -> int:
+        """Worker respawns after crashes, over all workers."""
+        return sum(client.restarts for client in self.clients)
+
+    def add_notification_handler(self, handler: NotificationHandler) -> None:
+        """Register a notification callback on every worker."""
+        for client in self.clients:
+            client.add_notification_handler(handler)
+
+    def remove_notification_handler(self, handler: NotificationHandler) -> None:
+        """Unregister a callback added with :meth:`add_notification_handler`."""
+        for client in self.clients:
+            client.remove_notification_handler(handler)
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """Call a tool on the least busy worker."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        return await self._route(lambda client: client.call_tool(tool_name, arguments, timeout))
+
+    async def request(
+        self, method: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Any:
+        """Send a JSON-RPC request to the least busy worker."""
+        return await self._route(lambda client: client.request(method, params, timeout))
+
+    async def list_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Tools offered by the servers (all workers run the same server)."""
+        return await self._route(lambda client: client.list_tools(refresh))
+
+    async def _route(self, call: Callable[[MCPClient], Coroutine]) -> Any:
+        index = self._pick()
+        self._assigned[index] += 1
+        try:
+            return await call(self.clients[index])
+        finally:
+            self._assigned[index] -= 1
+
+    def _pick(self) -> int:
+        """Index of the worker for the next call: running workers first, then
+        fewest assigned calls, ties broken round robin."""
+        order = [(self._next + offset) % self.size for offset in range(self.size)]
+        self._next = (self._next + 1) % self.size
+        return min(order, key=lambda index: (not self.clients[index].running, self._assigned[index]))
+
+    @asynccontextmanager
+    async def session(self):
+        """Context manager starting and stopping every worker."""
+        try:
+            await self.start()
+            yield self
+        finally:
+            await self.stop()
+
+
 # Global client instance
 _client: Optional[MCPClient] = None
+_pool: Optional[MCPClientPool] = None
+
+# Event loop running the calls of synchronous tools
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
 
 
 def get_mcp_client(server_command: str = "sec-edgar-mcp") -> MCPClient:
@@ -129,4 +753,31 @@ def get_mcp_client(server_command: str = "sec-edgar-mcp") -> MCPClient:
     global _client
     if _client is None:
         _client = MCPClient(server_command)
-    return _client
\ No newline at end of file
+    return _client
+
+
+def get_mcp_pool(server_command: str = "sec-edgar-mcp", size: Optional[int] = None) -> MCPClientPool:
+    """Get or create the global pool of MCP server processes.
+
+    Pass it to ``SECEdgarToolkit(mcp_client=get_mcp_pool())`` to spread tool
+    calls over several servers.
+    """
+    global _pool
+    if _pool is None:
+        _pool = MCPClientPool(size, server_command)
+    return _pool
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """Run a coroutine on the shared background event loop and wait for it.
+
+    Synchronous tool calls from any thread go through this one loop, so they
+    share a client's reader task and are multiplexed over its connection
+    instead of each thread needing its own event loop.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="sec-edgar-mcp-client", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
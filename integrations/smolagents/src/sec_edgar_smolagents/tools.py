@@ -1,9 +1,8 @@
 """SEC EDGAR agentkit tools for smolagents framework."""
 
-import asyncio
 from typing import Any, Dict, List, Optional, Union
 from smolagents import Tool
-from .mcp_client import get_mcp_client
+from .mcp_client import get_mcp_client, run_sync
 
 
 class BaseSECEdgarTool(Tool):
@@ -15,12 +14,7 @@ class BaseSECEdgarTool(Tool):
     
     def _run_async(self, coro):
         """Helper to run async code in sync context."""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(coro)
+        return run_sync(coro)
 
 
 class CIKLookupTool(BaseSECEdgarTool):